@@ -37,7 +37,6 @@ RA_ID_SCHEMAS = frozenset(
 # QLever-optimized SPARQL query constants
 QLEVER_BATCH_SIZE = 30
 QLEVER_MAX_WORKERS = 24
-QLEVER_QUERIES_PER_GROUP = 100
 
 VENUES = {
     "archival-document",
@@ -7,10 +7,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, TypeVar, cast
 
 from oc_meta.constants import BR_ID_SCHEMAS, RA_ID_SCHEMAS
-from oc_meta.core.curator import get_edited_br_metaid
+from oc_meta.core.curator import CreatorIndex, get_edited_br_metaid
+from oc_meta.lib.cow_graph import CopyOnWriteGraphSet
 from oc_meta.lib.finder import ResourceFinder
 from oc_meta.lib.master_of_regex import (
     RE_COMMA_AND_SPACES,
@@ -19,14 +20,17 @@ from oc_meta.lib.master_of_regex import (
     split_name_and_ids,
 )
 from oc_ocdm.counter_handler.counter_handler import CounterHandler
-from oc_ocdm.graph import GraphSet
 from oc_ocdm.graph.entities.bibliographic import BibliographicResource
 from oc_ocdm.graph.entities.bibliographic_entity import BibliographicEntity
+from oc_ocdm.graph.entities.identifier import Identifier
+from oc_ocdm.graph.graph_entity import GraphEntity
 from oc_ocdm.support import create_date
 
 if TYPE_CHECKING:
     from rich.progress import Progress
 
+_Entity = TypeVar("_Entity", bound=GraphEntity)
+
 
 class Creator(object):
     def __init__(
@@ -37,17 +41,18 @@ class Creator(object):
         counter_handler: CounterHandler,
         supplier_prefix: str,
         resp_agent: str,
-        ra_index: list,
-        br_index: list,
-        re_index_csv: list,
-        ar_index_csv: list,
-        vi_index: dict,
+        ra_index: list | None = None,
+        br_index: list | None = None,
+        re_index_csv: list | None = None,
+        ar_index_csv: list | None = None,
+        vi_index: dict | None = None,
         silencer: list | None = None,
         progress: Progress | None = None,
+        index: CreatorIndex | None = None,
     ):
         self.url = base_iri
         self.progress = progress
-        self.setgraph = GraphSet(
+        self.setgraph = CopyOnWriteGraphSet(
             self.url,
             supplier_prefix=supplier_prefix,
             wanted_label=False,
@@ -59,12 +64,26 @@ class Creator(object):
         self.ra_id_schemas = RA_ID_SCHEMAS
         self.br_id_schemas = BR_ID_SCHEMAS
         self.schemas = RA_ID_SCHEMAS | BR_ID_SCHEMAS
-
-        self.ra_index = self.indexer_id(ra_index)
-        self.br_index = self.indexer_id(br_index)
-        self.re_index = self.index_re(re_index_csv)
-        self.ar_index = self.index_ar(ar_index_csv)
-        self.vi_index = vi_index
+        # Identifier schema → method of Identifier setting its value
+        self._ra_id_methods = {schema: f"create_{schema}" for schema in RA_ID_SCHEMAS}
+        self._br_id_methods = {schema: f"create_{schema}" for schema in BR_ID_SCHEMAS}
+        # Identifiers already added to this batch, keyed by (ra, identifier)
+        self._ids: Dict[Tuple[bool, str], Identifier] = {}
+
+        # The list-of-dicts indexes are parsed only when no CreatorIndex is given
+        if index is None:
+            index = CreatorIndex.from_csv(
+                ra_index or [],
+                br_index or [],
+                re_index_csv or [],
+                ar_index_csv or [],
+                vi_index or {},
+            )
+        self.ra_index = index.ra_ids
+        self.br_index = index.br_ids
+        self.re_index = index.re
+        self.ar_index = index.ar
+        self.vi_index = index.vi
         self.data = data
         self.counter_handler = counter_handler
         self.silencer = silencer or []
@@ -165,46 +184,6 @@ class Creator(object):
             self.progress.remove_task(task_id)
         return self.setgraph
 
-    @staticmethod
-    def index_re(id_index):
-        index = dict()
-        for row in id_index:
-            index[row["br"]] = row["re"]
-        return index
-
-    @staticmethod
-    def index_ar(id_index):
-        index = dict()
-        for row in id_index:
-            index[row["meta"]] = dict()
-            index[row["meta"]]["author"] = Creator.__ar_worker(row["author"])
-            index[row["meta"]]["editor"] = Creator.__ar_worker(row["editor"])
-            index[row["meta"]]["publisher"] = Creator.__ar_worker(row["publisher"])
-        return index
-
-    @staticmethod
-    def __ar_worker(s: str) -> dict:
-        if s:
-            ar_dict = dict()
-            couples = s.split("; ")
-            for c in couples:
-                cou = c.split(", ")
-                ar_dict[cou[1]] = cou[0]
-            return ar_dict
-        else:
-            return dict()
-
-    def indexer_id(self, csv_index):
-        index = {}
-        for row in csv_index:
-            if row_id := row["id"]:
-                schema, value = row_id.split(":", 1)
-                if schema in self.schemas:
-                    if schema not in index:
-                        index[schema] = {}
-                    index[schema][value] = row["meta"]
-        return index
-
     def id_action(self, ids):
         idslist = RE_ONE_OR_MORE_SPACES.split(ids)
         # publication id
@@ -212,17 +191,8 @@ class Creator(object):
             if "omid:" in identifier:
                 identifier = identifier.replace("omid:", "")
                 url = self.url + identifier
-                preexisting_entity = url in self.finder
                 self.row_meta = identifier
-                preexisting_graph = (
-                    self.finder.graph.subgraph(url) if preexisting_entity else None
-                )
-                self.br_graph = self.setgraph.add_br(
-                    self.resp_agent,
-                    source=self.src,
-                    res=url,
-                    preexisting_graph=preexisting_graph,
-                )
+                self.br_graph = self._add_entity(self.setgraph.add_br, url)
         for identifier in idslist:
             self.id_creator(self.br_graph, identifier, ra=False)
 
@@ -244,19 +214,8 @@ class Creator(object):
                     if "omid:" in identifier:
                         identifier = str(identifier).replace("omid:", "")
                         url = self.url + identifier
-                        preexisting_entity = url in self.finder
                         aut_meta = identifier
-                        preexisting_graph = (
-                            self.finder.graph.subgraph(url)
-                            if preexisting_entity
-                            else None
-                        )
-                        author_ra = self.setgraph.add_ra(
-                            self.resp_agent,
-                            source=self.src,
-                            res=url,
-                            preexisting_graph=preexisting_graph,
-                        )
+                        author_ra = self._add_entity(self.setgraph.add_ra, url)
                         if "," in author_name:
                             author_name_splitted = RE_COMMA_AND_SPACES.split(
                                 author_name
@@ -276,16 +235,7 @@ class Creator(object):
                     continue
                 seen_ar.add(ar_meta)
                 ar_url = self.url + ar_meta
-                preexisting_entity = ar_url in self.finder
-                preexisting_graph = (
-                    self.finder.graph.subgraph(ar_url) if preexisting_entity else None
-                )
-                author_ra_role = self.setgraph.add_ar(
-                    self.resp_agent,
-                    source=self.src,
-                    res=ar_url,
-                    preexisting_graph=preexisting_graph,
-                )
+                author_ra_role = self._add_entity(self.setgraph.add_ar, ar_url)
                 author_ra_role.create_author()
                 self.br_graph.has_contributor(author_ra_role)
                 author_ra_role.is_held_by(author_ra)
@@ -309,16 +259,7 @@ class Creator(object):
                     ven_id = str(identifier).replace("omid:", "")
                     self.venue_meta = ven_id
                     url = self.url + ven_id
-                    preexisting_entity = url in self.finder
-                    preexisting_graph = (
-                        self.finder.graph.subgraph(url) if preexisting_entity else None
-                    )
-                    self.venue_graph = self.setgraph.add_br(
-                        self.resp_agent,
-                        source=self.src,
-                        res=url,
-                        preexisting_graph=preexisting_graph,
-                    )
+                    self.venue_graph = self._add_entity(self.setgraph.add_br, url)
                     venue_type = self.get_venue_type(self.type, venue_ids_list)
                     if venue_type:
                         venue_type = venue_type.replace(" ", "_")
@@ -331,18 +272,7 @@ class Creator(object):
                 if vol:
                     vol_meta = self.vi_index[self.venue_meta]["volume"][vol]["id"]
                     vol_url = self.url + vol_meta
-                    preexisting_entity = vol_url in self.finder
-                    preexisting_graph = (
-                        self.finder.graph.subgraph(vol_url)
-                        if preexisting_entity
-                        else None
-                    )
-                    self.vol_graph = self.setgraph.add_br(
-                        self.resp_agent,
-                        source=self.src,
-                        res=vol_url,
-                        preexisting_graph=preexisting_graph,
-                    )
+                    self.vol_graph = self._add_entity(self.setgraph.add_br, vol_url)
                     self.vol_graph.create_volume()
                     self.vol_graph.has_number(vol)
                 if issue:
@@ -355,18 +285,7 @@ class Creator(object):
                             "id"
                         ]
                     issue_url = self.url + issue_meta
-                    preexisting_entity = issue_url in self.finder
-                    preexisting_graph = (
-                        self.finder.graph.subgraph(issue_url)
-                        if preexisting_entity
-                        else None
-                    )
-                    self.issue_graph = self.setgraph.add_br(
-                        self.resp_agent,
-                        source=self.src,
-                        res=issue_url,
-                        preexisting_graph=preexisting_graph,
-                    )
+                    self.issue_graph = self._add_entity(self.setgraph.add_br, issue_url)
                     self.issue_graph.create_issue()
                     self.issue_graph.has_number(issue)
         if venue and vol and issue:
@@ -434,16 +353,7 @@ class Creator(object):
         if page:
             re_meta = self.re_index[self.row_meta]
             re_url = self.url + re_meta
-            preexisting_entity = re_url in self.finder
-            preexisting_graph = (
-                self.finder.graph.subgraph(re_url) if preexisting_entity else None
-            )
-            form = self.setgraph.add_re(
-                self.resp_agent,
-                source=self.src,
-                res=re_url,
-                preexisting_graph=preexisting_graph,
-            )
+            form = self._add_entity(self.setgraph.add_re, re_url)
             form.has_starting_page(page)
             form.has_ending_page(page)
             self.br_graph.has_format(form)
@@ -507,18 +417,7 @@ class Creator(object):
                         identifier = str(identifier).replace("omid:", "")
                         pub_meta = identifier
                         url = self.url + identifier
-                        preexisting_entity = url in self.finder
-                        preexisting_graph = (
-                            self.finder.graph.subgraph(url)
-                            if preexisting_entity
-                            else None
-                        )
-                        publisher_ra = self.setgraph.add_ra(
-                            self.resp_agent,
-                            source=self.src,
-                            res=url,
-                            preexisting_graph=preexisting_graph,
-                        )
+                        publisher_ra = self._add_entity(self.setgraph.add_ra, url)
                         publisher_ra.has_name(publ_name)
                 assert publisher_ra is not None
                 for identifier in publ_id_list:
@@ -528,16 +427,7 @@ class Creator(object):
                     continue
                 seen_ar.add(ar_meta)
                 ar_url = self.url + ar_meta
-                preexisting_entity = ar_url in self.finder
-                preexisting_graph = (
-                    self.finder.graph.subgraph(ar_url) if preexisting_entity else None
-                )
-                publ_role = self.setgraph.add_ar(
-                    self.resp_agent,
-                    source=self.src,
-                    res=ar_url,
-                    preexisting_graph=preexisting_graph,
-                )
+                publ_role = self._add_entity(self.setgraph.add_ar, ar_url)
                 publ_role.create_publisher()
                 self.br_graph.has_contributor(publ_role)
                 publ_role.is_held_by(publisher_ra)
@@ -560,18 +450,7 @@ class Creator(object):
                         identifier = str(identifier).replace("omid:", "")
                         ed_meta = identifier
                         url = self.url + identifier
-                        preexisting_entity = url in self.finder
-                        preexisting_graph = (
-                            self.finder.graph.subgraph(url)
-                            if preexisting_entity
-                            else None
-                        )
-                        editor_ra = self.setgraph.add_ra(
-                            self.resp_agent,
-                            source=self.src,
-                            res=url,
-                            preexisting_graph=preexisting_graph,
-                        )
+                        editor_ra = self._add_entity(self.setgraph.add_ra, url)
                         if "," in editor_name:
                             editor_name_splitted = RE_COMMA_AND_SPACES.split(
                                 editor_name
@@ -592,16 +471,7 @@ class Creator(object):
                     continue
                 seen_ar.add(ar_meta)
                 ar_url = self.url + ar_meta
-                preexisting_entity = ar_url in self.finder
-                preexisting_graph = (
-                    self.finder.graph.subgraph(ar_url) if preexisting_entity else None
-                )
-                editor_ra_role = self.setgraph.add_ar(
-                    self.resp_agent,
-                    source=self.src,
-                    res=ar_url,
-                    preexisting_graph=preexisting_graph,
-                )
+                editor_ra_role = self._add_entity(self.setgraph.add_ar, ar_url)
                 editor_ra_role.create_editor()
                 br_graphs: List[BibliographicResource] = [
                     g
@@ -624,45 +494,34 @@ class Creator(object):
     def __res_metaid(self, graph: BibliographicResource):
         return graph.res.replace(self.url, "")
 
+    def _add_entity(self, add: Callable[..., _Entity], url: str) -> _Entity:
+        """Return the entity of ``url`` in this batch, adding it on first use."""
+        entity = self.setgraph.res_to_entity.get(url)
+        if entity is not None:
+            return cast(_Entity, entity)
+        preexisting_graph = (
+            self.finder.graph.subgraph(url) if url in self.finder else None
+        )
+        return add(
+            self.resp_agent,
+            source=self.src,
+            res=url,
+            preexisting_graph=preexisting_graph,
+        )
+
     def id_creator(self, graph: BibliographicEntity, identifier: str, ra: bool) -> None:
-        new_id = None
         # Skip temporary identifiers - they should not be saved in the final dataset
         if identifier.startswith("temp:"):
             return
 
-        if ra:
-            for ra_id_schema in self.ra_id_schemas:
-                if identifier.startswith(f"{ra_id_schema}:"):
-                    identifier = identifier.split(":", 1)[1]
-                    res = self.ra_index[ra_id_schema][identifier]
-                    url = self.url + res
-                    preexisting_entity = url in self.finder
-                    preexisting_graph = (
-                        self.finder.graph.subgraph(url) if preexisting_entity else None
-                    )
-                    new_id = self.setgraph.add_id(
-                        self.resp_agent,
-                        source=self.src,
-                        res=url,
-                        preexisting_graph=preexisting_graph,
-                    )
-                    getattr(new_id, f"create_{ra_id_schema}")(identifier)
-        else:
-            for br_id_schema in self.br_id_schemas:
-                if identifier.startswith(f"{br_id_schema}:"):
-                    identifier = identifier.split(":", 1)[1]
-                    res = self.br_index[br_id_schema][identifier]
-                    url = self.url + res
-                    preexisting_entity = url in self.finder
-                    preexisting_graph = (
-                        self.finder.graph.subgraph(url) if preexisting_entity else None
-                    )
-                    new_id = self.setgraph.add_id(
-                        self.resp_agent,
-                        source=self.src,
-                        res=url,
-                        preexisting_graph=preexisting_graph,
-                    )
-                    getattr(new_id, f"create_{br_id_schema}")(identifier)
-        if new_id:
-            graph.has_identifier(new_id)
+        new_id = self._ids.get((ra, identifier))
+        if new_id is None:
+            schema, _, value = identifier.partition(":")
+            method = (self._ra_id_methods if ra else self._br_id_methods).get(schema)
+            if method is None:
+                return
+            res = (self.ra_index if ra else self.br_index)[schema][value]
+            new_id = self._add_entity(self.setgraph.add_id, self.url + res)
+            getattr(new_id, method)(value)
+            self._ids[(ra, identifier)] = new_id
+        graph.has_identifier(new_id)
@@ -7,25 +7,34 @@
 
 from __future__ import annotations
 
+import dataclasses
 import multiprocessing
 import os
 from concurrent.futures import ProcessPoolExecutor
 from contextlib import nullcontext
+from functools import cached_property
 from typing import TYPE_CHECKING, Dict, List, Tuple
 
-from oc_meta.constants import CONTAINER_EDITOR_TYPES, VALID_ENTITY_TYPES
+from oc_meta.constants import (
+    BR_ID_SCHEMAS,
+    CONTAINER_EDITOR_TYPES,
+    RA_ID_SCHEMAS,
+    VALID_ENTITY_TYPES,
+)
 from oc_meta.lib.cleaner import (
+    ID_NORMALIZER,
     clean_date,
     clean_name,
     clean_ra_list,
     clean_title,
     clean_volume_and_issue,
     normalize_hyphens,
-    normalize_id,
+    normalize_ids,
 )
 from oc_meta.lib.file_manager import write_csv
 from oc_meta.lib.finder import ResourceFinder
-from oc_meta.lib.merge_registry import EntityStore
+from oc_meta.lib.merge_registry import create_entity_store
+from oc_meta.lib.subject_cache import SubjectCache
 from oc_meta.lib.master_of_regex import (
     RE_COLON_AND_SPACES,
     RE_MULTIPLE_SPACES,
@@ -43,6 +52,55 @@ def _omid(meta: str) -> str:
     return f"omid:{meta}"
 
 
+@dataclasses.dataclass
+class CreatorIndex:
+    """
+    MetaIDs assigned by the Curator, in the shape Creator looks them up.
+
+    ra_ids and br_ids map identifier schema → value → ID MetaID, ar maps
+    BR MetaID → role → RA MetaID → AR MetaID, re maps BR MetaID → RE MetaID
+    and vi is the venue → volume → issue structure (Curator.VolIss). Built
+    once per curated file and shared by every Creator batch.
+    """
+
+    ra_ids: Dict[str, Dict[str, str]] = dataclasses.field(default_factory=dict)
+    br_ids: Dict[str, Dict[str, str]] = dataclasses.field(default_factory=dict)
+    ar: Dict[str, Dict[str, Dict[str, str]]] = dataclasses.field(default_factory=dict)
+    re: Dict[str, str] = dataclasses.field(default_factory=dict)
+    vi: dict = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def from_csv(
+        cls,
+        ra_index: List[dict],
+        br_index: List[dict],
+        re_index: List[dict],
+        ar_index: List[dict],
+        vi_index: dict,
+    ) -> CreatorIndex:
+        """Build the index from the list-of-dicts form of Curator.indexer."""
+        index = cls(vi=vi_index)
+        for csv_index, ids in ((ra_index, index.ra_ids), (br_index, index.br_ids)):
+            for row in csv_index:
+                if row_id := row["id"]:
+                    schema, value = row_id.split(":", 1)
+                    if schema in BR_ID_SCHEMAS or schema in RA_ID_SCHEMAS:
+                        ids.setdefault(schema, {})[value] = row["meta"]
+        for row in re_index:
+            index.re[row["br"]] = row["re"]
+        for row in ar_index:
+            index.ar[row["meta"]] = {
+                role: {
+                    pair.split(", ")[1]: pair.split(", ")[0]
+                    for pair in row[role].split("; ")
+                }
+                if row[role]
+                else {}
+                for role in ("author", "editor", "publisher")
+            }
+        return index
+
+
 def _extract_ids_from_chunk(rows: list) -> Tuple[set, set, set]:
     all_metavals = set()
     all_identifiers = set()
@@ -98,6 +156,13 @@ def _extract_ids_from_chunk(rows: list) -> Tuple[set, set, set]:
     return all_metavals, all_identifiers, all_vvis
 
 
+def _extract_ids_and_normalized_from_chunk(rows: list) -> Tuple[set, set, set, dict]:
+    # Also hands the identifiers this worker normalised back to the parent, so
+    # that the following phases find them in its memo
+    with ID_NORMALIZER.collecting():
+        return (*_extract_ids_from_chunk(rows), ID_NORMALIZER.drain())
+
+
 class Curator:
     def __init__(
         self,
@@ -113,6 +178,7 @@ class Curator:
         timer=None,
         progress: Progress | None = None,
         min_rows_parallel: int = 1000,
+        subject_cache: SubjectCache | None = None,
     ):
         self.timer = timer
         self.progress = progress
@@ -124,6 +190,7 @@ class Curator:
             settings=self.settings,
             meta_config_path=meta_config_path,
             workers=self.workers,
+            subject_cache=subject_cache,
         )
         self.base_iri = base_iri
         self.prov_config = prov_config
@@ -143,7 +210,9 @@ class Curator:
         self.prefix = prefix
         self.counter_handler = counter_handler
 
-        self.entity_store = EntityStore()
+        self.entity_store = create_entity_store(
+            self.settings.get("entity_store_backend", "dict")
+        )
         self.ardict = {}
         self.vvi = {}
         self.remeta = dict()
@@ -180,9 +249,13 @@ class Curator:
                 max_workers=self.workers,
                 mp_context=multiprocessing.get_context("forkserver"),
             ) as executor:
-                for chunk_metavals, chunk_ids, chunk_vvis in executor.map(
-                    _extract_ids_from_chunk, chunks
-                ):
+                for (
+                    chunk_metavals,
+                    chunk_ids,
+                    chunk_vvis,
+                    normalized,
+                ) in executor.map(_extract_ids_and_normalized_from_chunk, chunks):
+                    ID_NORMALIZER.update(normalized)
                     all_metavals.update(chunk_metavals)
                     all_idslist.update(chunk_ids)
                     all_vvis.update(chunk_vvis)
@@ -273,50 +346,12 @@ class Curator:
                 progress=self.progress,
             )
 
-        # Phase 2: Clean ID (loop over all rows)
-        with self._timed("curation__clean_id"):
-            task_clean_id = None
-            if self.progress:
-                task_clean_id = self.progress.add_task(
-                    "  [dim]Cleaning IDs[/dim]", total=total_rows
-                )
-            for row in self.data:
-                self.clean_id(row)
-                self.rowcnt += 1
-                if self.progress and task_clean_id is not None:
-                    self.progress.advance(task_clean_id)
-            if self.progress and task_clean_id is not None:
-                self.progress.remove_task(task_clean_id)
-
-        # Phase 3: Merge duplicates + clean VVI/RA
-        with self._timed("curation__clean_vvi_ra"):
-            task_merge = None
-            if self.progress:
-                task_merge = self.progress.add_task(
-                    "  [dim]Merging duplicates[/dim]", total=total_rows
-                )
-            self.merge_duplicate_entities(task_id=task_merge)
-            if self.progress and task_merge is not None:
-                self.progress.remove_task(task_merge)
-            self.clean_metadata_without_id()
-
-            if not self.identifiers_only:
-                self.rowcnt = 0
-                task_vvi_ra = None
-                if self.progress:
-                    task_vvi_ra = self.progress.add_task(
-                        "  [dim]Cleaning VVI and RA[/dim]", total=total_rows
-                    )
-                for row in self.data:
-                    self.clean_vvi(row)
-                    self.clean_ra(row, "author")
-                    self.clean_ra(row, "publisher")
-                    self.clean_ra(row, "editor")
-                    self.rowcnt += 1
-                    if self.progress and task_vvi_ra is not None:
-                        self.progress.advance(task_vvi_ra)
-                if self.progress and task_vvi_ra is not None:
-                    self.progress.remove_task(task_vvi_ra)
+        # Phases 2 and 3: one partition of rows per worker, or all rows here
+        if not self._curate_in_partitions():
+            with self._timed("curation__clean_id"):
+                self._clean_ids()
+            with self._timed("curation__clean_vvi_ra"):
+                self._clean_vvi_ra()
 
         # Phase 4: Metamaker (preexisting + meta_maker + enrich + dedupe)
         with self._timed("curation__metamaker"):
@@ -337,6 +372,69 @@ class Curator:
             self.filename = filename
             self.indexer(path_csv=path_csv)
 
+    def _curate_in_partitions(self) -> bool:
+        """
+        Run phases 2 and 3 in worker processes when parallel_curation is enabled.
+
+        Returns False if the rows were left untouched and must be curated here.
+        """
+        if not (
+            self.settings.get("parallel_curation", False)
+            and self.workers > 1
+            and len(self.data) > self.min_rows_parallel
+        ):
+            return False
+        from oc_meta.core.partitioned_curator import curate_partitions
+
+        with self._timed("curation__partitioned"):
+            return curate_partitions(self)
+
+    def _clean_ids(self) -> None:
+        """Phase 2: clean the identifiers of every row."""
+        task_clean_id = None
+        if self.progress:
+            task_clean_id = self.progress.add_task(
+                "  [dim]Cleaning IDs[/dim]", total=len(self.data)
+            )
+        for row in self.data:
+            self.clean_id(row)
+            self.rowcnt += 1
+            if self.progress and task_clean_id is not None:
+                self.progress.advance(task_clean_id)
+        if self.progress and task_clean_id is not None:
+            self.progress.remove_task(task_clean_id)
+
+    def _clean_vvi_ra(self) -> None:
+        """Phase 3: merge duplicates, then clean venues, volumes, issues and agents."""
+        total_rows = len(self.data)
+        task_merge = None
+        if self.progress:
+            task_merge = self.progress.add_task(
+                "  [dim]Merging duplicates[/dim]", total=total_rows
+            )
+        self.merge_duplicate_entities(task_id=task_merge)
+        if self.progress and task_merge is not None:
+            self.progress.remove_task(task_merge)
+        self.clean_metadata_without_id()
+
+        if not self.identifiers_only:
+            self.rowcnt = 0
+            task_vvi_ra = None
+            if self.progress:
+                task_vvi_ra = self.progress.add_task(
+                    "  [dim]Cleaning VVI and RA[/dim]", total=total_rows
+                )
+            for row in self.data:
+                self.clean_vvi(row)
+                self.clean_ra(row, "author")
+                self.clean_ra(row, "publisher")
+                self.clean_ra(row, "editor")
+                self.rowcnt += 1
+                if self.progress and task_vvi_ra is not None:
+                    self.progress.advance(task_vvi_ra)
+            if self.progress and task_vvi_ra is not None:
+                self.progress.remove_task(task_vvi_ra)
+
     def clean_id(self, row: Dict[str, str]) -> None:
         """
         The 'clean id()' function is executed for each CSV row.
@@ -754,24 +852,19 @@ class Curator:
         """
         metaid = ""
         id_list = list(filter(None, id_list))
-        clean_set = set()
-        clean_list = []
+        to_normalize = []
 
-        for elem in id_list:
-            if elem in clean_set:
-                continue
-            clean_set.add(elem)
-            elem = normalize_hyphens(elem)
+        for elem in dict.fromkeys(id_list):
             identifier = elem.split(":", 1)
-            schema = identifier[0].lower()
-            value = identifier[1]
-
-            if schema == "omid":
-                metaid = value
+            if identifier[0].lower() == "omid":
+                metaid = normalize_hyphens(identifier[1])
             else:
-                normalized_id = normalize_id(elem)
-                if normalized_id:
-                    clean_list.append(normalized_id)
+                to_normalize.append(elem)
+        clean_list = [
+            normalized_id
+            for normalized_id in normalize_ids(to_normalize)
+            if normalized_id
+        ]
 
         meta_count = sum(1 for i in id_list if i.lower().startswith("omid"))
         if meta_count > 1:
@@ -1044,62 +1137,73 @@ class Curator:
 
     def indexer(self, path_csv: str | None = None) -> None:
         """
-        Transform internal dicts (idra, idbr, ardict, remeta) to list-of-dicts format
-        for Creator consumption. Optionally saves the enriched CSV file.
+        Build the CreatorIndex read by Creator. Optionally saves the enriched CSV file.
 
         :params path_csv: Directory path for the enriched CSV output (optional)
         :type path_csv: str
         """
-        self.index_id_ra = list()
-        self.index_id_br = list()
-        id_metaids = self.entity_store.get_id_metaids()
-        for literal, metaid in id_metaids.items():
+        index = CreatorIndex(vi=self.VolIss)
+        for literal, metaid in self.entity_store.get_id_metaids().items():
+            schema, value = literal.split(":", 1)
+            if schema not in BR_ID_SCHEMAS and schema not in RA_ID_SCHEMAS:
+                continue
             entities = self.entity_store.find_entities(literal)
-            has_br = any(e.startswith("br/") for e in entities)
-            has_ra = any(e.startswith("ra/") for e in entities)
-            if has_br:
-                self.index_id_br.append({"id": str(literal), "meta": str(metaid)})
-            if has_ra:
-                self.index_id_ra.append({"id": str(literal), "meta": str(metaid)})
-        if not self.index_id_br:
-            self.index_id_br.append({"id": "", "meta": ""})
-        if not self.index_id_ra:
-            self.index_id_ra.append({"id": "", "meta": ""})
-        self.ar_index = list()
-        if self.ardict:
-            for metaid in self.ardict:
-                index = dict()
-                index["meta"] = metaid
-                for role in self.ardict[metaid]:
-                    list_ar = list()
-                    for ar, ra in self.ardict[metaid][role]:
-                        list_ar.append(str(ar) + ", " + str(ra))
-                    index[role] = "; ".join(list_ar)
-                self.ar_index.append(index)
-        else:
-            row = dict()
-            row["meta"] = ""
-            row["author"] = ""
-            row["editor"] = ""
-            row["publisher"] = ""
-            self.ar_index.append(row)
-        self.re_index = list()
-        if self.remeta:
-            for x in self.remeta:
-                r = dict()
-                r["br"] = x
-                r["re"] = str(self.remeta[x][0])
-                self.re_index.append(r)
-        else:
-            row = dict()
-            row["br"] = ""
-            row["re"] = ""
-            self.re_index.append(row)
+            if any(e.startswith("br/") for e in entities):
+                index.br_ids.setdefault(schema, {})[value] = metaid
+            if any(e.startswith("ra/") for e in entities):
+                index.ra_ids.setdefault(schema, {})[value] = metaid
+        for metaid, roles in self.ardict.items():
+            index.ar[metaid] = {
+                role: {ra: ar for ar, ra in roles.get(role, [])}
+                for role in ("author", "editor", "publisher")
+            }
+        for br, re in self.remeta.items():
+            index.re[br] = str(re[0])
+        self.index = index
+        for name in ("index_id_br", "index_id_ra", "ar_index", "re_index"):
+            self.__dict__.pop(name, None)
         if self.filename and path_csv and self.data:
             name = self.filename + ".csv"
             data_file = os.path.join(path_csv, name)
             write_csv(data_file, self.data)
 
+    # List-of-dicts form of the indexes, as stored in the test case CSV files.
+    # Computed on first access after indexer()
+
+    def _id_index(self, entity_type: str) -> List[dict]:
+        rows = []
+        for literal, metaid in self.entity_store.get_id_metaids().items():
+            entities = self.entity_store.find_entities(literal)
+            if any(e.startswith(f"{entity_type}/") for e in entities):
+                rows.append({"id": str(literal), "meta": str(metaid)})
+        return rows or [{"id": "", "meta": ""}]
+
+    @cached_property
+    def index_id_br(self) -> List[dict]:
+        return self._id_index("br")
+
+    @cached_property
+    def index_id_ra(self) -> List[dict]:
+        return self._id_index("ra")
+
+    @cached_property
+    def ar_index(self) -> List[dict]:
+        if not self.ardict:
+            return [{"meta": "", "author": "", "editor": "", "publisher": ""}]
+        rows = []
+        for metaid, roles in self.ardict.items():
+            row = {"meta": metaid}
+            for role, sequence in roles.items():
+                row[role] = "; ".join(f"{ar}, {ra}" for ar, ra in sequence)
+            rows.append(row)
+        return rows
+
+    @cached_property
+    def re_index(self) -> List[dict]:
+        if not self.remeta:
+            return [{"br": "", "re": ""}]
+        return [{"br": br, "re": str(re[0])} for br, re in self.remeta.items()]
+
     def _merge_VolIss_with_vvi(
         self, VolIss_venue_meta: str, vvi_venue_meta: str
     ) -> None:
@@ -0,0 +1,207 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from oc_ocdm.counter_handler.counter_handler import CounterHandler
+from oc_ocdm.graph import GraphSet
+from oc_ocdm.prov import ProvSet
+
+# (entity_short_name, prov_short_name, identifier, supplier_prefix)
+CounterKey = Tuple[str, str, int, str]
+Created = Tuple[GraphSet, ProvSet, set]
+CreateFn = Callable[[list, CounterHandler], Created]
+ProvenanceFn = Callable[[GraphSet, CounterHandler], Tuple[ProvSet, set]]
+
+# Batches being created and the state they need, inherited by forked workers
+_batches: List[list] = []
+_create: CreateFn | None = None
+_base_handler: CounterHandler | None = None
+
+
+class BatchCounterHandler(CounterHandler):
+    """
+    Counter handler of a single batch, layered on top of a shared handler.
+
+    The first access to a counter reads it from the shared handler and
+    remembers the value seen in ``observed``; every later read, set or
+    increment works on the private copy in ``values``. Metadata counters are
+    layered the same way in ``metadata_observed`` and ``metadata_values``.
+    The shared handler is never written.
+    """
+
+    def __init__(self, base: CounterHandler) -> None:
+        self.base = base
+        self.observed: Dict[CounterKey, int] = {}
+        self.values: Dict[CounterKey, int] = {}
+        self.metadata_observed: Dict[Tuple[str, str], int] = {}
+        self.metadata_values: Dict[Tuple[str, str], int] = {}
+
+    def _value(self, key: CounterKey) -> int:
+        if key not in self.values:
+            value = self.base.read_counter(*key)
+            self.observed[key] = value
+            self.values[key] = value
+        return self.values[key]
+
+    def set_counter(
+        self,
+        new_value: int,
+        entity_short_name: str,
+        prov_short_name: str = "",
+        identifier: int = 1,
+        supplier_prefix: str = "",
+    ) -> None:
+        key = (entity_short_name, prov_short_name, identifier, supplier_prefix)
+        self._value(key)
+        self.values[key] = new_value
+
+    def read_counter(
+        self,
+        entity_short_name: str,
+        prov_short_name: str = "",
+        identifier: int = 1,
+        supplier_prefix: str = "",
+    ) -> int:
+        return self._value(
+            (entity_short_name, prov_short_name, identifier, supplier_prefix)
+        )
+
+    def increment_counter(
+        self,
+        entity_short_name: str,
+        prov_short_name: str = "",
+        identifier: int = 1,
+        supplier_prefix: str = "",
+    ) -> int:
+        key = (entity_short_name, prov_short_name, identifier, supplier_prefix)
+        self.values[key] = self._value(key) + 1
+        return self.values[key]
+
+    def _metadata_value(self, key: Tuple[str, str]) -> int:
+        if key not in self.metadata_values:
+            value = self.base.read_metadata_counter(*key)
+            self.metadata_observed[key] = value
+            self.metadata_values[key] = value
+        return self.metadata_values[key]
+
+    def set_metadata_counter(
+        self, new_value: int, entity_short_name: str, dataset_name: str
+    ) -> None:
+        key = (entity_short_name, dataset_name)
+        self._metadata_value(key)
+        self.metadata_values[key] = new_value
+
+    def read_metadata_counter(self, entity_short_name: str, dataset_name: str) -> int:
+        return self._metadata_value((entity_short_name, dataset_name))
+
+    def increment_metadata_counter(
+        self, entity_short_name: str, dataset_name: str
+    ) -> int:
+        key = (entity_short_name, dataset_name)
+        self.metadata_values[key] = self._metadata_value(key) + 1
+        return self.metadata_values[key]
+
+
+def is_stale(observed: Dict[CounterKey, int], counter_handler: CounterHandler) -> bool:
+    """True if a provenance counter read by a batch has changed since."""
+    return any(
+        key[1] and counter_handler.read_counter(*key) != value
+        for key, value in observed.items()
+    )
+
+
+def apply_counters(
+    batch_handler: BatchCounterHandler,
+    counter_handler: CounterHandler,
+    provenance: bool = True,
+) -> None:
+    """
+    Write the counters of a batch to the shared handler.
+
+    Creator passes the MetaID of every entity it adds, so entity counters only
+    ever grow to the largest number met and are merged by taking the maximum.
+    Provenance counters are copied as they are, unless ``provenance`` is False.
+    Metadata counters are copied as they are.
+    """
+    for key, value in batch_handler.values.items():
+        if value == batch_handler.observed[key]:
+            continue
+        if key[1]:
+            if provenance:
+                counter_handler.set_counter(value, *key)
+        elif value > counter_handler.read_counter(*key):
+            counter_handler.set_counter(value, *key)
+    for key, value in batch_handler.metadata_values.items():
+        if value != batch_handler.metadata_observed[key]:
+            counter_handler.set_metadata_counter(value, *key)
+
+
+def _create_batch(idx: int) -> tuple:
+    assert _create is not None and _base_handler is not None
+    batch_handler = BatchCounterHandler(_base_handler)
+    creator, prov, modified_entities = _create(_batches[idx], batch_handler)
+    # The shared handler stays behind: the parent reattaches its own
+    batch_handler.base = None  # type: ignore[assignment]
+    creator.counter_handler = None  # type: ignore[assignment]
+    prov.counter_handler = None  # type: ignore[assignment]
+    return creator, prov, modified_entities, batch_handler
+
+
+def create_in_parallel(
+    batches: List[list],
+    create: CreateFn,
+    provenance: ProvenanceFn,
+    counter_handler: CounterHandler,
+    workers: int,
+) -> Iterator[Created]:
+    """
+    Create the RDF and provenance of each batch in a pool of forked processes.
+
+    ``create`` turns a batch into its graph set, provenance set and modified
+    entities using the counter handler it is given; ``provenance`` regenerates
+    the provenance of a graph set. Each worker starts from a copy-on-write
+    snapshot of ``counter_handler`` and of everything ``create`` reads (the
+    local graph and the curated indexes), and records its counters in a
+    ``BatchCounterHandler`` instead of writing them.
+
+    Results are yielded in batch order by this process, the only one writing
+    to ``counter_handler``. A batch whose provenance read a snapshot counter
+    that an earlier batch has since moved (an entity present in both) gets its
+    provenance generated again from the shared counters, so MetaIDs, snapshot
+    numbers and counters are the same as with serial creation.
+
+    As with partitioned curation, no other thread may be running work while
+    the workers are forked: MetaProcess drains its storage queue before every
+    window when parallel_rdf_creation is enabled.
+    """
+    global _batches, _create, _base_handler
+    _batches, _create, _base_handler = batches, create, counter_handler
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(batches)),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            # Every worker is forked while submitting, before any counter is
+            # written here
+            futures = [
+                executor.submit(_create_batch, idx) for idx in range(len(batches))
+            ]
+            for idx, future in enumerate(futures):
+                creator, prov, modified_entities, batch_handler = future.result()
+                futures[idx] = None  # type: ignore[call-overload]
+                creator.counter_handler = counter_handler
+                stale = is_stale(batch_handler.observed, counter_handler)
+                apply_counters(batch_handler, counter_handler, provenance=not stale)
+                if stale:
+                    prov, modified_entities = provenance(creator, counter_handler)
+                else:
+                    prov.counter_handler = counter_handler
+                yield creator, prov, modified_entities
+    finally:
+        _batches, _create, _base_handler = [], None, None
@@ -0,0 +1,377 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import count
+from typing import Callable, Dict, List, Tuple
+
+from oc_meta.core.curator import Curator
+from oc_meta.lib.console import console
+from oc_meta.lib.master_of_regex import (
+    RE_SEMICOLON_IN_PEOPLE_FIELD,
+    split_name_and_ids,
+)
+from oc_meta.lib.merge_registry import EntityStore
+
+Stamp = Tuple[int, int, int]
+
+# Rows citing an OMID missing from the local graph share this key: curation
+# asks the provenance triplestore what it was merged into, so any two of them
+# may end up on the same entity
+_UNRESOLVED = "__unresolved__"
+
+# Tables whose keys are entity keys (the others are keyed by identifier literal)
+_ENTITY_KEYED_TABLES = frozenset(
+    {
+        "_parent",
+        "_merged",
+        "_wannabe_to_meta",
+        "_entity_ids",
+        "_entity_titles",
+        "ardict",
+        "vvi",
+        "remeta",
+    }
+)
+
+# Curator whose rows are being curated, inherited by forked workers
+_parent_curator: Curator | None = None
+
+
+class _StampedDict(dict):
+    """Dictionary remembering the stamp at which each of its keys was inserted."""
+
+    def __init__(self, clock: Callable[[], Stamp]) -> None:
+        super().__init__()
+        self.clock = clock
+        self.stamps: Dict[str, Stamp] = {}
+
+    def __setitem__(self, key, value) -> None:
+        if key not in self:
+            self.stamps[key] = self.clock()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        del self.stamps[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            del self.stamps[key]
+        return super().pop(key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def stamped_items(self) -> List[tuple]:
+        # Insertion order is stamp order, since stamps only grow
+        return [(self.stamps[key], key, value) for key, value in self.items()]
+
+
+class _PartitionCurator(Curator):
+    """
+    Curator running phases 2 and 3 on a subset of its parent's rows.
+
+    Wannabe entities and AR or identifier numbers are recorded as events
+    instead of being allocated: counters hand out placeholder tokens that the
+    parent later swaps for real numbers. Every key inserted in the entity store,
+    ardict, vvi or remeta is stamped with (phase, row, tick), the position it
+    would have in a serial run.
+    """
+
+    def __init__(self, parent: Curator, row_indices: List[int]) -> None:
+        self.__dict__.update(parent.__dict__)
+        self.data = [dict(parent.data[idx]) for idx in row_indices]
+        self.row_indices = row_indices
+        self.timer = None
+        self.progress = None
+        self.phase = 0
+        self.ticks = count()
+        self.events: List[Tuple[Stamp, str, str]] = []
+        self.entity_store = EntityStore(dict_factory=self._stamped_dict)
+        self.ardict = self._stamped_dict()
+        self.vvi = self._stamped_dict()
+        self.remeta = self._stamped_dict()
+        self.wnb_cnt = 0
+        self.rowcnt = 0
+
+    def _stamp(self) -> Stamp:
+        return (self.phase, self.row_indices[self.rowcnt], next(self.ticks))
+
+    def _stamped_dict(self) -> _StampedDict:
+        return _StampedDict(self._stamp)
+
+    def clean_id(self, row: Dict[str, str]) -> None:
+        self.phase = 0
+        super().clean_id(row)
+
+    def merge_duplicate_entities(self, task_id=None) -> None:
+        self.phase = 1
+        super().merge_duplicate_entities(task_id)
+
+    def clean_vvi(self, row: Dict[str, str]) -> None:
+        self.phase = 2
+        super().clean_vvi(row)
+
+    def new_entity(self, name: str, entity_type: str) -> str:
+        metaval = super().new_entity(name, entity_type)
+        self.events.append((self._stamp(), "wannabe", metaval))
+        return metaval
+
+    def _add_number(self, entity_type: str) -> int:
+        token = f"~{len(self.events)}"
+        self.events.append((self._stamp(), entity_type, token))
+        return token  # type: ignore[return-value]
+
+    def tables(self) -> Dict[str, List[tuple]]:
+        tables = {
+            **self.entity_store.tables(),
+            "ardict": self.ardict,
+            "vvi": self.vvi,
+            "remeta": self.remeta,
+        }
+        return {name: table.stamped_items() for name, table in tables.items()}
+
+
+def _row_keys(curator: Curator, row: Dict[str, str]) -> set[str]:
+    """Identifiers and MetaIDs whose state curating ``row`` reads or writes."""
+    id_lists = []
+    if row["id"]:
+        id_lists.append(curator.split_identifiers(row["id"]))
+    for field in ("author", "editor", "publisher"):
+        if row[field]:
+            for ra in RE_SEMICOLON_IN_PEOPLE_FIELD.split(row[field]):
+                _, ids_str = split_name_and_ids(ra)
+                if ids_str:
+                    id_lists.append(curator.split_identifiers(ids_str))
+    for field in ("venue", "volume", "issue"):
+        _, ids_str = split_name_and_ids(row[field])
+        if ids_str:
+            id_lists.append(curator.split_identifiers(ids_str))
+
+    finder = curator.finder
+    keys = set()
+    for id_list in id_lists:
+        idslist, metaval = Curator.clean_id_list(id_list, br=True)
+        metaids = set()
+        if metaval:
+            keys.add(metaval)
+            if f"{finder.base_iri}/{metaval}" in finder:
+                metaids.add(metaval)
+            else:
+                keys.add(_UNRESOLVED)
+        for identifier in idslist:
+            keys.add(identifier)
+            schema, value = identifier.split(":", maxsplit=1)
+            metaids.update(finder.retrieve_metaids_from_id(schema, value))
+        for metaid in metaids:
+            keys.update(finder.retrieve_related_metaids(metaid))
+    return keys
+
+
+def partition_rows(curator: Curator) -> List[List[int]]:
+    """
+    Split the curator's rows into connected components.
+
+    Two rows are connected when they share an identifier, a MetaID or an entity
+    of the local graph reached from one of them (containers and agents). Rows
+    of different components never touch the same curation state.
+    """
+    parent = list(range(len(curator.data)))
+
+    def find(idx: int) -> int:
+        while parent[idx] != idx:
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    owner: Dict[str, int] = {}
+    for idx, row in enumerate(curator.data):
+        for key in _row_keys(curator, row):
+            other = owner.setdefault(key, idx)
+            root_a, root_b = find(other), find(idx)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    components: Dict[int, List[int]] = {}
+    for idx in range(len(parent)):
+        components.setdefault(find(idx), []).append(idx)
+    return list(components.values())
+
+
+def _balance(components: List[List[int]], workers: int) -> List[List[int]]:
+    # Largest component first, each to the partition with fewest rows
+    partitions: List[List[int]] = [[] for _ in range(min(workers, len(components)))]
+    sizes = [(0, idx) for idx in range(len(partitions))]
+    for component in sorted(components, key=len, reverse=True):
+        size, idx = heapq.heappop(sizes)
+        partitions[idx].extend(component)
+        heapq.heappush(sizes, (size + len(component), idx))
+    return [sorted(partition) for partition in partitions]
+
+
+def _curate_partition(row_indices: List[int]) -> dict:
+    assert _parent_curator is not None
+    curator = _PartitionCurator(_parent_curator, row_indices)
+    curator._clean_ids()
+    curator._clean_vvi_ra()
+    return {"rows": curator.data, "events": curator.events, "tables": curator.tables()}
+
+
+def _shared_key(results: List[dict]) -> str | None:
+    owner: Dict[str, int] = {}
+    for idx, result in enumerate(results):
+        for items in result["tables"].values():
+            for _, key, _ in items:
+                if "wannabe" not in key and owner.setdefault(key, idx) != idx:
+                    return key
+    return None
+
+
+def _rename_vvi(node: dict, rename: Dict[str, str]) -> dict:
+    return {
+        key: _rename_vvi(value, rename)
+        if isinstance(value, dict)
+        else rename.get(value, value)
+        for key, value in node.items()
+    }
+
+
+def _rename_item(name: str, key: str, value, rename: Dict[str, str]) -> tuple:
+    if name in _ENTITY_KEYED_TABLES:
+        key = rename.get(key, key)
+    if name in ("_parent", "_wannabe_to_meta", "_id_to_metaid"):
+        value = rename.get(value, value)
+    elif name in ("_merged", "_id_to_entities"):
+        value = {rename.get(entity, entity) for entity in value}
+    elif name == "ardict":
+        value = {
+            role: [(rename.get(ar, ar), rename.get(ra, ra)) for ar, ra in sequence]
+            for role, sequence in value.items()
+        }
+    elif name == "vvi":
+        value = _rename_vvi(value, rename)
+    return key, value
+
+
+def _merge_partitions(
+    curator: Curator, partitions: List[List[int]], results: List[dict]
+) -> None:
+    # Replay events in serial order: wannabes get the serial numbering and
+    # counters are incremented exactly as a serial run would
+    renames: List[Dict[str, str]] = [{} for _ in results]
+    events = heapq.merge(
+        *(
+            [(stamp, idx, kind, token) for stamp, kind, token in result["events"]]
+            for idx, result in enumerate(results)
+        )
+    )
+    for _, idx, kind, token in events:
+        if kind == "wannabe":
+            entity_type = token.split("/", 1)[0]
+            renames[idx][token] = f"{entity_type}/wannabe_{curator.wnb_cnt}"
+            curator.wnb_cnt += 1
+        else:
+            number = curator._add_number(kind)
+            renames[idx][f"{kind}/{curator.prefix}{token}"] = (
+                f"{kind}/{curator.prefix}{number}"
+            )
+
+    tables: Dict[str, dict] = {}
+    for name in results[0]["tables"]:
+        merged: dict = {}
+        items = heapq.merge(
+            *(
+                [
+                    (stamp, idx, key, value)
+                    for stamp, key, value in result["tables"][name]
+                ]
+                for idx, result in enumerate(results)
+            )
+        )
+        for _, idx, key, value in items:
+            key, value = _rename_item(name, key, value, renames[idx])
+            merged[key] = value
+        tables[name] = merged
+
+    curator.entity_store = type(curator.entity_store).from_tables(tables)
+    curator.ardict = tables["ardict"]
+    curator.vvi = tables["vvi"]
+    curator.remeta = tables["remeta"]
+    for row_indices, result, rename in zip(partitions, results, renames):
+        for idx, row in zip(row_indices, result["rows"]):
+            row["id"] = rename.get(row["id"], row["id"])
+            row["venue"] = rename.get(row["venue"], row["venue"])
+            curator.data[idx] = row
+    curator.rowcnt = len(curator.data)
+
+
+def curate_partitions(curator: Curator) -> bool:
+    """
+    Run phases 2 and 3 of curation with one process per partition of rows.
+
+    Workers are forked, so each one reads a copy-on-write snapshot of the
+    prefetched local graph. Their entity stores, ardict, vvi and remeta are
+    merged in the order a serial run would have filled them, with the same
+    wannabe and counter numbering. Returns False, leaving the curator untouched,
+    if the rows form a single component, the platform cannot fork, or two
+    partitions ended up touching the same entity: the caller must then curate
+    the rows serially.
+
+    Forking is safe only while no other thread is running work. The caller
+    blocks here, so the threads of the shared SPARQL query pool are idle, and
+    forked children reset the pool on start (see oc_meta.lib.sparql). A
+    background storage queue must be drained before calling this:
+    MetaProcess waits for it before every window when parallel_curation is
+    enabled, even with rdf_files_only.
+    """
+    global _parent_curator
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return False
+    components = partition_rows(curator)
+    if len(components) < 2:
+        return False
+    partitions = _balance(components, curator.workers)
+
+    progress = curator.progress
+    task = None
+    if progress:
+        task = progress.add_task(
+            "  [dim]Curating partitions[/dim]", total=len(curator.data)
+        )
+    results: List[dict] = [{} for _ in partitions]
+    _parent_curator = curator
+    try:
+        with ProcessPoolExecutor(
+            max_workers=len(partitions),
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = {
+                executor.submit(_curate_partition, partition): idx
+                for idx, partition in enumerate(partitions)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                results[idx] = future.result()
+                if progress and task is not None:
+                    progress.advance(task, len(partitions[idx]))
+    finally:
+        _parent_curator = None
+        if progress and task is not None:
+            progress.remove_task(task)
+
+    shared_key = _shared_key(results)
+    if shared_key is not None:
+        console.print(
+            f"  [yellow]Partitions share {shared_key}, curating serially[/yellow]"
+        )
+        return False
+    _merge_partitions(curator, partitions, results)
+    return True
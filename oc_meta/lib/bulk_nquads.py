@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from oc_ocdm import Storer
+from oc_ocdm.support.query_utils import _term_to_nt
+
+from oc_meta.lib.sparql_coalescer import UpdateCoalescer, coalesce_storer
+from oc_meta.run.migration.stream_nquads import write_nquads_line_groups
+
+PENDING_DIR = ".pending"
+DELETE_BATCH_TRIPLES = 10000
+
+
+def _nquads_lines(coalescer: UpdateCoalescer) -> Iterator[bytes]:
+    for graph_iri, (s, p, o) in coalescer.quads():
+        line = f"{_term_to_nt(s)} {_term_to_nt(p)} {_term_to_nt(o)} <{graph_iri}> .\n"
+        yield line.encode("utf-8")
+
+
+def write_bulk_files(
+    storer: Storer,
+    output_dir: str,
+    prefix: str,
+    lines_per_file: int,
+    max_triples: int = DELETE_BATCH_TRIPLES,
+) -> None:
+    """
+    Write the changes of the entities of ``storer`` for a bulk loader.
+
+    Inserted quads go to ``<prefix>.NNNNNN.nq.gz`` files of at most
+    ``lines_per_file`` lines. Deletions cannot be bulk loaded: they are saved
+    as ``DELETE DATA`` updates of at most ``max_triples`` statements, one per
+    line, in ``<prefix>.delete.sparql``, to be run after the quads are loaded.
+    """
+    coalescer = coalesce_storer(storer, max_triples)
+    write_nquads_line_groups(
+        [_nquads_lines(coalescer)],
+        Path(output_dir),
+        prefix,
+        lines_per_file,
+        compress=True,
+    )
+    deletions = [query for query, _, _ in coalescer.updates(inserts=False)]
+    if deletions:
+        with open(
+            os.path.join(output_dir, f"{prefix}.delete.sparql"), "w", encoding="utf-8"
+        ) as f:
+            f.write("\n".join(deletions) + "\n")
+
+
+class BulkFileStaging:
+    """
+    Keeps the bulk files of an input file aside until the file is done.
+
+    Batches write into ``<output_dir>/.pending/<input file>/{data,prov}``.
+    ``commit`` moves the files into ``<output_dir>/{data,prov}`` once every batch
+    of the input file is stored, right before the file goes into
+    ``cache.txt``. ``discard`` drops what an interrupted run left for a file,
+    which is processed again from scratch. Bulk files therefore exist exactly
+    for the input files listed in ``cache.txt``.
+    """
+
+    def __init__(self, output_dir: str) -> None:
+        self.output_dir = output_dir
+        self._run = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        self._batches: Dict[str, int] = {}
+
+    def _pending(self, group: str) -> str:
+        return os.path.join(self.output_dir, PENDING_DIR, group)
+
+    def next_batch(self, group: str) -> Tuple[str, str, str]:
+        """Return the pending data and provenance directories and the file prefix of a new batch."""
+        index = self._batches.get(group, 0)
+        self._batches[group] = index + 1
+        directories = []
+        for kind in ("data", "prov"):
+            directory = os.path.join(self._pending(group), kind)
+            os.makedirs(directory, exist_ok=True)
+            directories.append(directory)
+        stem = os.path.splitext(group)[0]
+        return directories[0], directories[1], f"{stem}_{self._run}_{index:06d}"
+
+    def discard(self, group: str) -> None:
+        shutil.rmtree(self._pending(group), ignore_errors=True)
+        self._batches.pop(group, None)
+
+    def commit(self, group: str) -> None:
+        pending = self._pending(group)
+        if os.path.isdir(pending):
+            for kind in os.listdir(pending):
+                target = os.path.join(self.output_dir, kind)
+                os.makedirs(target, exist_ok=True)
+                for name in os.listdir(os.path.join(pending, kind)):
+                    os.replace(
+                        os.path.join(pending, kind, name), os.path.join(target, name)
+                    )
+        self.discard(group)
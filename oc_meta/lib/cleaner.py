@@ -8,8 +8,9 @@
 import html
 import re
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from dateutil.parser import parse
 from oc_ds_converter.oc_idmanager import (
@@ -415,6 +416,90 @@ def normalize_id(string: str) -> Union[str, None]:
     return valid_id
 
 
+class IdentifierNormalizer:
+    """
+    Memo of normalised identifiers shared by every curation phase.
+
+    Raw identifiers are looked up as they appear in the CSV: hyphens are
+    normalised and normalize_id runs only the first time a string is seen.
+    The least recently used entries are evicted beyond ``maxsize``. New
+    entries are only recorded for ``drain`` inside ``collecting``.
+    """
+
+    def __init__(self, maxsize: int = 1_000_000) -> None:
+        self.maxsize = maxsize
+        self._memo: OrderedDict[str, Optional[str]] = OrderedDict()
+        self._added: Optional[List[str]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def normalize(self, identifiers: Iterable[str]) -> List[Optional[str]]:
+        """
+        Normalise a batch of raw identifiers.
+
+        :returns: List[Optional[str]] -- One result per input, in the same order: the normalised identifier, or None if it is invalid
+        """
+        memo = self._memo
+        results = []
+        for identifier in identifiers:
+            if identifier in memo:
+                memo.move_to_end(identifier)
+                self.hits += 1
+            else:
+                memo[identifier] = normalize_id(normalize_hyphens(identifier))
+                if self._added is not None:
+                    self._added.append(identifier)
+                self.misses += 1
+                if len(memo) > self.maxsize:
+                    memo.popitem(last=False)
+            results.append(memo[identifier])
+        return results
+
+    def update(self, normalized: Dict[str, Optional[str]]) -> None:
+        """Store identifiers normalised elsewhere, e.g. by a worker process."""
+        for identifier, value in normalized.items():
+            self._memo[identifier] = value
+            self._memo.move_to_end(identifier)
+        while len(self._memo) > self.maxsize:
+            self._memo.popitem(last=False)
+
+    @contextmanager
+    def collecting(self) -> Iterator[None]:
+        """Record the identifiers normalised in this block for ``drain``."""
+        self._added = []
+        try:
+            yield
+        finally:
+            self._added = None
+
+    def drain(self) -> Dict[str, Optional[str]]:
+        """Return the identifiers normalised since the previous call within ``collecting``."""
+        if self._added is None:
+            return {}
+        added = {
+            identifier: self._memo[identifier]
+            for identifier in self._added
+            if identifier in self._memo
+        }
+        self._added = []
+        return added
+
+    def clear(self) -> None:
+        self._memo.clear()
+        if self._added is not None:
+            self._added = []
+        self.hits = 0
+        self.misses = 0
+
+
+ID_NORMALIZER = IdentifierNormalizer()
+
+
+def normalize_ids(identifiers: Iterable[str]) -> List[Optional[str]]:
+    """Normalise raw identifiers in bulk through the process-wide memo (see IdentifierNormalizer)."""
+    return ID_NORMALIZER.normalize(identifiers)
+
+
 def clean_volume_and_issue(row: dict) -> None:
     output = {"volume": "", "issue": "", "pub_date": ""}
     for field in {"volume", "issue"}:
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Set, Tuple
+
+from oc_ocdm.graph import GraphSet
+from oc_ocdm.prov import ProvSet
+from triplelite import RDFTerm, TripleLite
+
+Triple = Tuple[str, str, RDFTerm]
+Pattern = Tuple[Optional[str], Optional[str], Optional[RDFTerm]]
+
+
+def _rebuild_copy_on_write(
+    identifier: str | None,
+    reverse_index_predicates: frozenset[str] | None,
+    triples: list,
+    shared: frozenset | None,
+    added: list,
+    removed: list,
+) -> CopyOnWriteGraph:
+    g = CopyOnWriteGraph(identifier, reverse_index_predicates)
+    if shared is None:
+        g.add_many(triples)
+    else:
+        g._shared = shared
+        g._added = set(added)
+        g._removed = set(removed)
+    return g
+
+
+class CopyOnWriteGraph(TripleLite):
+    """
+    Entity graph that shares its preexisting triples instead of copying them.
+
+    ``GraphEntity`` fills the graph of a preexisting entity with the frozenset
+    of triples read from the local graph. When that frozenset is the first
+    thing added to an empty ``CopyOnWriteGraph``, the graph keeps a reference
+    to it and records every later change in two small sets of added and
+    removed triples. Entities that are only read or linked to never copy their
+    triples, and ``modified`` tells without a diff whether the content still
+    equals the shared triples. Any other graph behaves like a ``TripleLite``.
+    """
+
+    def __init__(
+        self,
+        identifier: str | None = None,
+        reverse_index_predicates: frozenset[str] | None = None,
+    ) -> None:
+        super().__init__(identifier, reverse_index_predicates)
+        self._shared: frozenset | None = None
+        self._added: Set[Triple] = set()
+        self._removed: Set[Triple] = set()
+
+    @property
+    def modified(self) -> bool:
+        """False while the graph holds exactly the triples it was given."""
+        return self._shared is None or bool(self._added or self._removed)
+
+    def __reduce__(self) -> tuple:
+        if self._shared is None:
+            state = (list(self), None, [], [])
+        else:
+            state = ([], self._shared, list(self._added), list(self._removed))
+        return (
+            _rebuild_copy_on_write,
+            (self.identifier, self._reverse_index_predicates, *state),
+        )
+
+    def _current(self) -> Iterator[Triple]:
+        assert self._shared is not None
+        if self._removed:
+            yield from (t for t in self._shared if t not in self._removed)
+        else:
+            yield from self._shared
+        yield from self._added
+
+    def add(self, triple: Triple) -> None:
+        if self._shared is None:
+            super().add(triple)
+        elif triple in self._removed:
+            self._removed.discard(triple)
+        elif triple not in self._shared:
+            self._added.add(triple)
+
+    def add_many(self, triples: Iterable[Triple]) -> None:
+        if self._shared is not None:
+            for triple in triples:
+                self.add(triple)
+        elif isinstance(triples, frozenset) and not super().__len__():
+            self._shared = triples
+        else:
+            super().add_many(triples)
+
+    def remove(self, triple: Pattern) -> None:
+        if self._shared is None:
+            super().remove(triple)
+            return
+        for match in list(self.triples(triple)):
+            if match in self._added:
+                self._added.discard(match)
+            else:
+                self._removed.add(match)
+
+    def triples(self, pattern: Pattern) -> Iterator[Triple]:
+        if self._shared is None:
+            return super().triples(pattern)
+        s, p, o = pattern
+        return iter(
+            [
+                t
+                for t in self._current()
+                if (s is None or t[0] == s)
+                and (p is None or t[1] == p)
+                and (o is None or t[2] == o)
+            ]
+        )
+
+    def objects(
+        self, subject: str | None = None, predicate: str | None = None
+    ) -> Iterator[RDFTerm]:
+        if self._shared is None:
+            return super().objects(subject, predicate)
+        return (o for _, _, o in self.triples((subject, predicate, None)))
+
+    def predicate_objects(
+        self, subject: str | None = None
+    ) -> Iterator[Tuple[str, RDFTerm]]:
+        if self._shared is None:
+            return super().predicate_objects(subject)
+        return ((p, o) for _, p, o in self.triples((subject, None, None)))
+
+    def subjects(
+        self, predicate: str | None = None, object: RDFTerm | None = None
+    ) -> Iterator[str]:
+        if self._shared is None:
+            return super().subjects(predicate, object)
+        return iter(
+            dict.fromkeys(s for s, _, _ in self.triples((None, predicate, object)))
+        )
+
+    def has_subject(self, subject: str) -> bool:
+        if self._shared is None:
+            return super().has_subject(subject)
+        return any(t[0] == subject for t in self._current())
+
+    def __contains__(self, triple: object) -> bool:
+        if self._shared is None:
+            return super().__contains__(triple)
+        return triple in self._added or (
+            triple in self._shared and triple not in self._removed
+        )
+
+    def __iter__(self) -> Iterator[Triple]:
+        if self._shared is None:
+            return super().__iter__()
+        return iter(list(self._current()))
+
+    def __len__(self) -> int:
+        if self._shared is None:
+            return super().__len__()
+        return len(self._shared) - len(self._removed) + len(self._added)
+
+
+class CopyOnWriteGraphSet(GraphSet):
+    """``GraphSet`` whose entities get a ``CopyOnWriteGraph``."""
+
+    def _add(
+        self, graph_url: str, short_name: str, res: str | None = None
+    ) -> Tuple[TripleLite, str | None, str | None]:
+        _, count, label = super()._add(graph_url, short_name, res)
+        return CopyOnWriteGraph(identifier=graph_url), count, label
+
+    def mutated_entities(self) -> Set[str]:
+        """URIs of the entities that are new, changed, merged, deleted or restored."""
+        return {
+            res
+            for res, entity in self.res_to_entity.items()
+            if not isinstance(entity.g, CopyOnWriteGraph)
+            or entity.g.modified
+            or entity.to_be_deleted
+            or entity.was_merged
+            or entity.is_restored
+        }
+
+
+class MutatedEntitiesProvSet(ProvSet):
+    """
+    ``ProvSet`` that only looks at the mutated entities of a ``CopyOnWriteGraphSet``.
+
+    An entity whose graph still holds its preexisting triples gets no snapshot
+    unless it has none yet, so it is skipped without computing its update
+    query. The snapshots and the returned set of modified entities are the
+    same as those of ``ProvSet``.
+    """
+
+    def generate_provenance(self, c_time: float | None = None) -> set:
+        graph_set = self.prov_g
+        if not isinstance(graph_set, CopyOnWriteGraphSet):
+            return super().generate_provenance(c_time)
+        mutated = graph_set.mutated_entities()
+        every_entity = graph_set.res_to_entity
+        graph_set.res_to_entity = {
+            res: entity
+            for res, entity in every_entity.items()
+            if res in mutated or self._retrieve_last_snapshot(res) is None
+        }
+        try:
+            return super().generate_provenance(c_time)
+        finally:
+            graph_set.res_to_entity = every_entity
@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from zipfile import ZipFile
+
+import orjson
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def read_json_file(filepath: str) -> Tuple[list, int]:
+    """Parse a JSON-LD file, zipped or not, and return it with its uncompressed size."""
+    if filepath.endswith(".zip"):
+        with ZipFile(filepath, "r") as zip_file:
+            info = zip_file.infolist()[0]
+            raw = zip_file.read(info)
+    else:
+        with open(filepath, "rb") as f:
+            raw = f.read()
+    return orjson.loads(raw), len(raw)
+
+
+class EntityIndex:
+    """
+    ``@id`` → entity dicts of JSON-LD files, built once per file.
+
+    Looking an entity up in a parsed file means scanning every entity of
+    every ``@graph``; here each file is indexed on first use and kept until
+    the indexes held exceed ``max_bytes``, measured as the size of their
+    uncompressed JSON. The least recently used files are dropped first. A
+    file changed on disk since it was indexed is read again.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.size = 0
+        self._files: OrderedDict[str, Tuple[Tuple[int, int], Dict[str, dict], int]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def entities(self, filepath: str) -> Optional[Dict[str, dict]]:
+        """Return the entities of ``filepath`` by ``@id``, or None if it does not exist."""
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            self._drop(filepath)
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(filepath)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            self._files.move_to_end(filepath)
+            return cached[1]
+        self.misses += 1
+        self._drop(filepath)
+        data, size = read_json_file(filepath)
+        index: Dict[str, dict] = {}
+        for graph in data:
+            for entity in graph.get("@graph", []):
+                index[entity["@id"]] = entity
+        self._files[filepath] = (version, index, size)
+        self.size += size
+        while self.size > self.max_bytes and len(self._files) > 1:
+            _, (_, _, evicted) = self._files.popitem(last=False)
+            self.size -= evicted
+        return index
+
+    def get(self, filepath: str, uri: str) -> Optional[dict]:
+        entities = self.entities(filepath)
+        if entities is None:
+            return None
+        return entities.get(uri)
+
+    def clear(self) -> None:
+        self._files.clear()
+        self.size = 0
+
+    def _drop(self, filepath: str) -> None:
+        cached = self._files.pop(filepath, None)
+        if cached is not None:
+            self.size -= cached[2]
+
+
+_shared_index: Optional[EntityIndex] = None
+
+
+def get_entity_index() -> EntityIndex:
+    """Return the index shared by everything that runs in this process."""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = EntityIndex()
+    return _shared_index
+
+
+def set_entity_index_size(max_bytes: int) -> None:
+    """Bound the shared index of this process, e.g. from a pool initializer."""
+    index = get_entity_index()
+    index.max_bytes = max_bytes
@@ -13,7 +13,7 @@ import sys
 from contextlib import contextmanager
 from pathlib import Path
 from time import sleep
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, Iterator, List, Set
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import orjson
@@ -96,28 +96,64 @@ def collect_zip_files(
     return sorted(files)
 
 
+def _iter_csv_rows(filepath: str, clean_data: bool) -> Iterator[Dict[str, str]]:
+    """
+    Yield the rows of a CSV file one at a time.
+
+    If a field exceeds the current CSV field size limit, the limit is doubled
+    and reading resumes after the last row already yielded.
+    """
+    field_size_changed = False
+    cur_field_size = 128
+    yielded_rows = 0
+    try:
+        while True:
+            try:
+                with open(filepath, "r", encoding="utf8") as f:
+                    if clean_data:
+                        lines = (normalize_spaces(line.replace("\0", "")) for line in f)
+                        reader = csv.DictReader(lines, delimiter=",")
+                    else:
+                        reader = csv.DictReader(f, delimiter=",")
+                    for row_idx, row in enumerate(reader):
+                        if row_idx < yielded_rows:
+                            continue
+                        yielded_rows += 1
+                        yield row
+                break
+            except csv.Error:
+                cur_field_size *= 2
+                csv.field_size_limit(cur_field_size)
+                field_size_changed = True
+    finally:
+        if field_size_changed:
+            csv.field_size_limit(128)
+
+
 def get_csv_data(filepath: str, clean_data: bool = True) -> List[Dict[str, str]]:
     if not os.path.splitext(filepath)[1].endswith(".csv"):
         return list()
-    field_size_changed = False
-    cur_field_size = 128
-    data: List[Dict[str, str]] = list()
-    while True:
-        try:
-            with open(filepath, "r", encoding="utf8") as f:
-                if clean_data:
-                    lines = (normalize_spaces(line.replace("\0", "")) for line in f)
-                    data = list(csv.DictReader(lines, delimiter=","))
-                else:
-                    data = list(csv.DictReader(f, delimiter=","))
-            break
-        except csv.Error:
-            cur_field_size *= 2
-            csv.field_size_limit(cur_field_size)
-            field_size_changed = True
-    if field_size_changed:
-        csv.field_size_limit(128)
-    return data
+    return list(_iter_csv_rows(filepath, clean_data))
+
+
+def iter_csv_data(
+    filepath: str, window_size: int, clean_data: bool = True
+) -> Iterator[List[Dict[str, str]]]:
+    """
+    Stream a CSV file as consecutive windows of at most window_size rows.
+
+    Unlike get_csv_data, only one window is held in memory at a time.
+    """
+    if not os.path.splitext(filepath)[1].endswith(".csv"):
+        return
+    window: List[Dict[str, str]] = []
+    for row in _iter_csv_rows(filepath, clean_data):
+        window.append(row)
+        if len(window) == window_size:
+            yield window
+            window = []
+    if window:
+        yield window
 
 
 def pathoo(path):
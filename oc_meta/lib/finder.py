@@ -4,9 +4,7 @@
 
 from __future__ import annotations
 
-import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
-from functools import partial
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import TYPE_CHECKING, Dict, List, Tuple, TypedDict
 
 import orjson
@@ -21,12 +19,13 @@ from triplelite import RDFTerm, TripleLite
 from time_agnostic_library.agnostic_entity import AgnosticEntity
 from rich.console import Console
 
-from oc_meta.constants import (
-    QLEVER_BATCH_SIZE,
-    QLEVER_MAX_WORKERS,
-    QLEVER_QUERIES_PER_GROUP,
+from oc_meta.constants import QLEVER_BATCH_SIZE, QLEVER_MAX_WORKERS
+from oc_meta.lib.sparql import (
+    execute_sparql_queries,
+    execute_sparql_queries_parallel,
+    get_query_pool,
 )
-from oc_meta.lib.sparql import execute_sparql_queries
+from oc_meta.lib.subject_cache import CachedRow, SubjectCache
 
 _XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
 _RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
@@ -57,6 +56,98 @@ _R_AUTHOR = GraphEntity.iri_author
 _R_EDITOR = GraphEntity.iri_editor
 _R_PUBLISHER = GraphEntity.iri_publisher
 
+_PROFILE_PREFIXES = {
+    "datacite": "http://purl.org/spar/datacite/",
+    "fabio": "http://purl.org/spar/fabio/",
+    "frbr": "http://purl.org/vocab/frbr/core#",
+    "oco": "https://w3id.org/oc/ontology/",
+    "pro": "http://purl.org/spar/pro/",
+}
+
+# A traversal profile maps an entity type (the OMID prefix: br, ar, ra, id, re)
+# to the predicates followed from entities of that type, each with the maximum
+# depth at which the entity is still expanded through it. "full" (no profile)
+# follows every URI object. "curation" keeps what the retrieve_* methods and
+# Creator read: identifiers, agent roles and embodiment of the row resources,
+# the partOf chain up to the venue and the publishers of parent and
+# grandparent containers.
+TRAVERSAL_PROFILES: Dict[str, Dict[str, Dict[str, int]]] = {
+    "curation": {
+        "br": {
+            "datacite:hasIdentifier": 3,
+            "frbr:partOf": 2,
+            "pro:isDocumentContextFor": 2,
+            "frbr:embodiment": 0,
+        },
+        "ar": {
+            "pro:isHeldBy": 3,
+            "oco:hasNext": 3,
+        },
+        "ra": {
+            "datacite:hasIdentifier": 4,
+        },
+    },
+}
+
+
+def resolve_traversal_profile(
+    settings: dict | None,
+) -> Dict[str, Dict[str, int]] | None:
+    """
+    Return the traversal profile selected by the traversal_profile setting.
+
+    Profiles are looked up in the traversal_profiles setting first, then among
+    the built-in TRAVERSAL_PROFILES. Predicates may be written as full IRIs or
+    with the datacite, fabio, frbr, oco and pro prefixes. Returns None for the
+    default "full" profile.
+    """
+    settings = settings or {}
+    name = settings.get("traversal_profile") or "full"
+    custom_profiles = settings.get("traversal_profiles") or {}
+    profile = custom_profiles.get(name, TRAVERSAL_PROFILES.get(name))
+    if profile is None:
+        if name == "full":
+            return None
+        raise ValueError(f"Unknown traversal profile: {name}")
+    resolved: Dict[str, Dict[str, int]] = {}
+    for entity_type, predicates in profile.items():
+        resolved[entity_type] = {}
+        for predicate, max_depth in predicates.items():
+            prefix, _, local_name = predicate.partition(":")
+            if prefix in _PROFILE_PREFIXES:
+                predicate = _PROFILE_PREFIXES[prefix] + local_name
+            resolved[entity_type][predicate] = int(max_depth)
+    return resolved
+
+
+def _chain_lengths(next_of: Dict[str, str]) -> Dict[str, int]:
+    """
+    Number of roles visited walking hasNext from each role, in linear time.
+
+    The walk stops at a role missing from ``next_of`` or already visited, so
+    a role on a cycle counts the whole cycle and a role leading into it adds
+    one per step.
+    """
+    lengths: Dict[str, int] = {}
+    for start in next_of:
+        path: List[str] = []
+        position: Dict[str, int] = {}
+        role = start
+        while role in next_of and role not in lengths and role not in position:
+            position[role] = len(path)
+            path.append(role)
+            role = next_of[role]
+        if role in position:
+            cycle = path[position[role] :]
+            for member in cycle:
+                lengths[member] = len(cycle)
+            path = path[: position[role]]
+        length = lengths.get(role, 0)
+        for member in reversed(path):
+            length += 1
+            lengths[member] = length
+    return lengths
+
 
 class IssueEntry(TypedDict):
     id: str
@@ -80,6 +171,7 @@ class ResourceFinder:
         settings: dict = dict(),
         meta_config_path: str | None = None,
         workers: int = 1,
+        subject_cache: SubjectCache | None = None,
     ):
         self.ts_url = ts_url
         self.base_iri = base_iri[:-1] if base_iri[-1] == "/" else base_iri
@@ -94,6 +186,17 @@ class ResourceFinder:
             else False
         )
         self.workers = workers
+        self.subject_cache = subject_cache
+        self.subject_cache_hits = 0
+        self.traversal_depth_stats: Dict[int, int] = {}
+        self.traversal_profile = resolve_traversal_profile(settings)
+        # Volumes and issues of every container, keyed by container URI. Reset
+        # whenever a triple is added and rebuilt on the next venue lookup
+        self._venue_index: Dict[str, VenueStructure] | None = None
+        # Responsible agent sequences keyed by (BR MetaID, column) and RA name
+        # and identifiers keyed by RA MetaID, emptied whenever a triple is added
+        self._ra_sequences: Dict[Tuple[str, str], List[Dict[str, tuple]]] = {}
+        self._ra_tuples: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {}
 
     _PO_S_INDEXED_PREDICATES = {_P_HAS_LITERAL_VALUE, _P_HAS_IDENTIFIER, _P_PART_OF}
 
@@ -105,6 +208,11 @@ class ResourceFinder:
         else:
             term = RDFTerm("literal", o, _XSD_STRING)
         self.graph.add((s, p, term))
+        self._venue_index = None
+        if self._ra_sequences:
+            self._ra_sequences = {}
+        if self._ra_tuples:
+            self._ra_tuples = {}
 
     def __contains__(self, uri: str) -> bool:
         return self.graph.has_subject(uri)
@@ -310,9 +418,32 @@ class ResourceFinder:
         else:
             return ""
 
+    def _retrieve_ra_tuple(self, ra_metaid: str) -> Tuple[str, List[Tuple[str, str]]]:
+        ra_tuple = self._ra_tuples.get(ra_metaid)
+        if ra_tuple is None:
+            ra_tuple = self.retrieve_ra_from_meta(ra_metaid)[0:2]
+            self._ra_tuples[ra_metaid] = ra_tuple
+        return ra_tuple
+
     def retrieve_ra_sequence_from_br_meta(
         self, metaid: str, col_name: str
     ) -> List[Dict[str, tuple]]:
+        """
+        Return the agents of ``metaid`` for a column, following the hasNext chain.
+
+        Sequences are cached per (BR, column) until the local graph changes.
+        When several roles could start the chain, the longest chain wins, then
+        the one starting from the lowest AR number; only its agents are
+        resolved.
+        """
+        key = (metaid, col_name)
+        sequence = self._ra_sequences.get(key)
+        if sequence is None:
+            sequence = self._build_ra_sequence(metaid, col_name)
+            self._ra_sequences[key] = sequence
+        return list(sequence)
+
+    def _build_ra_sequence(self, metaid: str, col_name: str) -> List[Dict[str, tuple]]:
         if col_name == "author":
             role_str = _R_AUTHOR
         elif col_name == "editor":
@@ -337,74 +468,42 @@ class ResourceFinder:
                 if ra is not None:
                     dict_ar[role_value] = {"next": next_role, "ra": ra}
 
-        all_roles = set(dict_ar.keys())
+        if not dict_ar:
+            return []
+
         roles_with_next = set(
             details["next"] for details in dict_ar.values() if details["next"]
         )
-        start_role_candidates = all_roles - roles_with_next
-
-        if len(all_roles) == 0:
-            return []
+        start_role_candidates = [
+            role for role in dict_ar if role not in roles_with_next
+        ]
 
-        if len(start_role_candidates) == 0:
-            sorted_ars = sorted(
-                all_roles, key=lambda ar: get_resource_number(f"{self.base_iri}/{ar}")
+        if not start_role_candidates:
+            start_role = min(
+                dict_ar, key=lambda ar: get_resource_number(f"{self.base_iri}/{ar}")
             )
-            start_role_candidates = {sorted_ars[0]}
-
-        if len(start_role_candidates) != 1:
-            chains = []
-            for start_candidate in start_role_candidates:
-                current_role = start_candidate
-                chain: list[dict[str, tuple]] = []
-                visited_roles: set[str] = set()
-                while current_role and current_role not in visited_roles:
-                    visited_roles.add(current_role)
-                    if current_role in dict_ar:
-                        ra_info = self.retrieve_ra_from_meta(
-                            dict_ar[current_role]["ra"]
-                        )[0:2]
-                        ra_tuple = ra_info + (dict_ar[current_role]["ra"],)
-                        chain.append({current_role: ra_tuple})
-                        current_role = dict_ar[current_role]["next"]
-                    else:
-                        break
-                chains.append(chain)
-            chains.sort(
-                key=lambda chain: (
-                    -len(chain),
-                    get_resource_number(f"{self.base_iri}/{list(chain[0].keys())[0]}"),
-                )
-            )
-            try:
-                ordered_ar_list = chains[0]
-            except Exception as e:
-                print(
-                    f"\nWarning: Error processing BR: {metaid} for column: {col_name}"
-                )
-                print(f"dict_ar: {dict_ar}")
-                print(f"All roles: {all_roles}")
-                print(f"Start role candidates: {start_role_candidates}")
-                print(f"Roles with next: {roles_with_next}")
-                print(f"Error: {str(e)}")
-                return []
+        elif len(start_role_candidates) == 1:
+            start_role = start_role_candidates[0]
         else:
-            start_role = start_role_candidates.pop()
-            ordered_ar_list: list[dict[str, tuple]] = []
-            current_role = start_role
-            visited_roles: set[str] = set()
-            while current_role and current_role not in visited_roles:
-                visited_roles.add(current_role)
-                if current_role in dict_ar:
-                    ra_info = self.retrieve_ra_from_meta(dict_ar[current_role]["ra"])[
-                        0:2
-                    ]
-                    ra_tuple = ra_info + (dict_ar[current_role]["ra"],)
-                    ordered_ar_list.append({current_role: ra_tuple})
-                    current_role = dict_ar[current_role]["next"]
-                else:
-                    break
+            lengths = _chain_lengths(
+                {role: details["next"] for role, details in dict_ar.items()}
+            )
+            start_role = min(
+                start_role_candidates,
+                key=lambda ar: (
+                    -lengths[ar],
+                    get_resource_number(f"{self.base_iri}/{ar}"),
+                ),
+            )
 
+        ordered_ar_list: list[dict[str, tuple]] = []
+        current_role = start_role
+        visited_roles: set[str] = set()
+        while current_role in dict_ar and current_role not in visited_roles:
+            visited_roles.add(current_role)
+            ra = dict_ar[current_role]["ra"]
+            ordered_ar_list.append({current_role: self._retrieve_ra_tuple(ra) + (ra,)})
+            current_role = dict_ar[current_role]["next"]
         return ordered_ar_list
 
     def retrieve_re_from_br_meta(self, metaid: str) -> Tuple[str, str] | None:
@@ -634,80 +733,142 @@ class ResourceFinder:
                     "  [dim]Resolving VVI[/dim]", total=len(vvis)
                 )
 
-        max_depth_reached = 0
-
-        def process_batch_parallel(subjects, cur_depth, visited_subjects):
-            nonlocal max_depth_reached
-            if not subjects or (max_depth and cur_depth > max_depth):
-                return
-
-            new_subjects = subjects - visited_subjects
-            if not new_subjects:
-                return
-
-            if cur_depth > max_depth_reached:
-                max_depth_reached = cur_depth
-
-            visited_subjects.update(new_subjects)
+        _skip_preds = {_P_TYPE, _P_WITH_ROLE, _P_USES_ID_SCHEME}
 
-            if progress and task_traversal is not None:
-                progress.update(
-                    task_traversal,
-                    description=f"  [dim]Graph traversal (depth {cur_depth}/{max_depth}, {len(visited_subjects):,} subjects)[/dim]",
-                )
-
-            subject_list = list(new_subjects)
-            batches = list(batch_process(subject_list, BATCH_SIZE))
-            batch_queries = []
+        def traverse(initial_subjects: set) -> Dict[str, int]:
+            """
+            Fetch every subject reachable from initial_subjects within max_depth.
+
+            Subjects are batched into SELECT queries submitted to the shared
+            SPARQL thread pool; as soon as a batch completes its objects are
+            scheduled, without waiting for the rest of the depth level. Full
+            batches are submitted eagerly, partial ones only when the pool has
+            idle workers. Each subject keeps the shortest depth it was reached
+            at: if a shorter path shows up after the subject was fetched, its
+            children are re-scheduled from the local graph, so the depth cut-off
+            matches a breadth-first traversal. When a traversal profile is set,
+            only the predicates it allows at the subject's depth are followed.
+            Returns the depth of each fetched subject.
+            """
+            pool = get_query_pool(MAX_WORKERS)
             ts_url = self.ts_url
+            profile = self.traversal_profile
+            type_start = len(self.base_iri) + 1
+            depth_of: Dict[str, int] = {}
+            edges_of: Dict[str, List[Tuple[str, str]]] = {}
+            unchecked: List[str] = []
+            waiting: List[str] = []
+            in_flight: Dict[Future, List[str]] = {}
+            deepest = 0
+
+            def discover(subject: str, depth: int) -> None:
+                nonlocal deepest
+                stack = [(subject, depth)]
+                while stack:
+                    s, d = stack.pop()
+                    if max_depth and d > max_depth:
+                        continue
+                    known = depth_of.get(s)
+                    if known is not None and known <= d:
+                        continue
+                    depth_of[s] = d
+                    if d > deepest:
+                        deepest = d
+                    if known is None:
+                        unchecked.append(s)
+                    else:
+                        stack.extend(
+                            (o_str, d + 1)
+                            for p_str, o_str in edges_of.get(s, ())
+                            if follows(s, p_str, d)
+                        )
 
-            for batch in batches:
-                query = f"""
+            def follows(subject: str, predicate: str, depth: int) -> bool:
+                if profile is None:
+                    return True
+                entity_type = subject[type_start:].split("/", 1)[0]
+                limit = profile.get(entity_type, {}).get(predicate)
+                return limit is not None and depth <= limit
+
+            def absorb(subject: str, rows: List[CachedRow]) -> None:
+                edges = []
+                for p_str, o_str, o_type, o_datatype in rows:
+                    self.add_triple(subject, p_str, o_str, o_datatype=o_datatype)
+                    if o_type == "uri" and p_str not in _skip_preds:
+                        edges.append((p_str, o_str))
+                edges_of[subject] = edges
+                depth = depth_of[subject]
+                for p_str, o_str in edges:
+                    if follows(subject, p_str, depth):
+                        discover(o_str, depth + 1)
+
+            def schedule() -> None:
+                nonlocal unchecked
+                while unchecked:
+                    subjects, unchecked = unchecked, []
+                    if self.subject_cache is not None:
+                        cached = self.subject_cache.get_many(subjects)
+                        self.subject_cache_hits += len(cached)
+                        for s_str, cached_rows in cached.items():
+                            absorb(s_str, cached_rows)
+                        subjects = [s for s in subjects if s not in cached]
+                    waiting.extend(subjects)
+                while len(waiting) >= BATCH_SIZE or (
+                    waiting and len(in_flight) < MAX_WORKERS
+                ):
+                    batch = waiting[:BATCH_SIZE]
+                    del waiting[:BATCH_SIZE]
+                    query = f"""
                     SELECT ?s ?p ?o
                     WHERE {{
                         VALUES ?s {{ {" ".join([f"<{s}>" for s in batch])} }}
                         ?s ?p ?o.
                     }}"""
-                batch_queries.append(query)
-
-            next_subjects = set()
-            if len(batch_queries) > 1 and MAX_WORKERS > 1:
-                queries_per_worker = max(1, len(batch_queries) // MAX_WORKERS)
-                query_groups = [
-                    batch_queries[i : i + queries_per_worker]
-                    for i in range(0, len(batch_queries), queries_per_worker)
-                ]
-                worker = partial(execute_sparql_queries, ts_url)
-                with ProcessPoolExecutor(
-                    max_workers=min(len(query_groups), MAX_WORKERS),
-                    mp_context=multiprocessing.get_context("forkserver"),
-                ) as executor:
-                    grouped_results = list(executor.map(worker, query_groups))
-                results = [item for sublist in grouped_results for item in sublist]
-            else:
-                results = (
-                    execute_sparql_queries(endpoint_url=ts_url, queries=batch_queries)
-                    if batch_queries
-                    else []
-                )
-
-            _skip_preds = {_P_TYPE, _P_WITH_ROLE, _P_USES_ID_SCHEME}
-            for result in results:
-                for row in result:
-                    s_str = row["s"]["value"]
-                    p_str = row["p"]["value"]
-                    o_binding = row["o"]
-                    o_str = o_binding["value"]
-                    o_datatype = (
-                        o_binding.get("datatype", "")
-                        if o_binding["type"] in ("literal", "typed-literal")
-                        else ""
-                    )
-                    self.add_triple(s_str, p_str, o_str, o_datatype=o_datatype)
-                    if o_binding["type"] == "uri" and p_str not in _skip_preds:
-                        next_subjects.add(o_str)
+                    future = pool.submit(execute_sparql_queries, ts_url, [query])
+                    in_flight[future] = batch
 
-            process_batch_parallel(next_subjects, cur_depth + 1, visited_subjects)
+            for subject in initial_subjects:
+                discover(subject, 0)
+            schedule()
+            try:
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch = in_flight.pop(future)
+                        fetched_rows: Dict[str, List[CachedRow]] = {
+                            s: [] for s in batch
+                        }
+                        for row in future.result()[0]:
+                            o_binding = row["o"]
+                            o_datatype = (
+                                o_binding.get("datatype", "")
+                                if o_binding["type"] in ("literal", "typed-literal")
+                                else ""
+                            )
+                            fetched_rows.setdefault(row["s"]["value"], []).append(
+                                (
+                                    row["p"]["value"],
+                                    o_binding["value"],
+                                    o_binding["type"],
+                                    o_datatype,
+                                )
+                            )
+                        if self.subject_cache is not None:
+                            self.subject_cache.put_many(fetched_rows)
+                        for s_str, rows in fetched_rows.items():
+                            if s_str in depth_of:
+                                absorb(s_str, rows)
+                    schedule()
+                    if progress and task_traversal is not None:
+                        progress.update(
+                            task_traversal,
+                            description=f"  [dim]Graph traversal (depth {deepest}/{max_depth}, {len(depth_of):,} subjects, {len(in_flight)} batches in flight)[/dim]",
+                        )
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            return depth_of
 
         def get_initial_subjects_from_metavals(metavals):
             """Convert metavals to a set of subjects."""
@@ -787,25 +948,17 @@ class ResourceFinder:
                     batch_queries.append(query)
 
             if len(batch_queries) > 1 and MAX_WORKERS > 1:
-                query_groups = []
-                grouped_batch_sizes = []
-                for i in range(0, len(batch_queries), QLEVER_QUERIES_PER_GROUP):
-                    query_groups.append(batch_queries[i : i + QLEVER_QUERIES_PER_GROUP])
-                    grouped_batch_sizes.append(
-                        sum(batch_sizes[i : i + QLEVER_QUERIES_PER_GROUP])
-                    )
-                worker = partial(execute_sparql_queries, ts_url)
-                with ProcessPoolExecutor(
-                    max_workers=MAX_WORKERS,
-                    mp_context=multiprocessing.get_context("forkserver"),
-                ) as executor:
-                    results = []
-                    for idx, grouped_result in enumerate(
-                        executor.map(worker, query_groups)
-                    ):
-                        results.extend(grouped_result)
-                        if progress and progress_task is not None:
-                            progress.advance(progress_task, grouped_batch_sizes[idx])
+
+                def advance(idx: int) -> None:
+                    if progress and progress_task is not None:
+                        progress.advance(progress_task, batch_sizes[idx])
+
+                results = execute_sparql_queries_parallel(
+                    ts_url,
+                    batch_queries,
+                    workers=MAX_WORKERS,
+                    progress_callback=advance,
+                )
             elif batch_queries:
                 results = execute_sparql_queries(
                     endpoint_url=ts_url, queries=batch_queries
@@ -964,26 +1117,18 @@ class ResourceFinder:
 
             # Execute batched VVI queries in parallel
             if len(vvi_queries) > 1 and MAX_WORKERS > 1:
-                query_groups = []
-                grouped_vvi_counts = []
-                queries_per_group = max(1, len(vvi_queries) // MAX_WORKERS)
-                for i in range(0, len(vvi_queries), queries_per_group):
-                    group = vvi_queries[i : i + queries_per_group]
-                    query_groups.append(group)
-                    vvi_count = int(total_vvis * len(group) / len(vvi_queries))
-                    grouped_vvi_counts.append(max(1, vvi_count))
-                worker = partial(execute_sparql_queries, ts_url)
-                with ProcessPoolExecutor(
-                    max_workers=MAX_WORKERS,
-                    mp_context=multiprocessing.get_context("forkserver"),
-                ) as executor:
-                    results = []
-                    for idx, grouped_result in enumerate(
-                        executor.map(worker, query_groups)
-                    ):
-                        results.extend(grouped_result)
-                        if progress and progress_task is not None:
-                            progress.advance(progress_task, grouped_vvi_counts[idx])
+                vvi_count = max(1, int(total_vvis / len(vvi_queries)))
+
+                def advance(idx: int) -> None:
+                    if progress and progress_task is not None:
+                        progress.advance(progress_task, vvi_count)
+
+                results = execute_sparql_queries_parallel(
+                    ts_url,
+                    vvi_queries,
+                    workers=MAX_WORKERS,
+                    progress_callback=advance,
+                )
             elif vvi_queries:
                 results = execute_sparql_queries(
                     endpoint_url=ts_url, queries=vvi_queries
@@ -1032,12 +1177,19 @@ class ResourceFinder:
                 "  [dim]Graph traversal[/dim]", total=None
             )
 
-        visited_subjects = set()
-        process_batch_parallel(initial_subjects, 0, visited_subjects)
+        depth_of = traverse(initial_subjects)
 
         if progress and task_traversal is not None:
             progress.remove_task(task_traversal)
 
+        depth_stats: Dict[int, int] = {}
+        for depth in depth_of.values():
+            depth_stats[depth] = depth_stats.get(depth, 0) + 1
+        self.traversal_depth_stats = dict(sorted(depth_stats.items()))
+        max_depth_reached = max(depth_stats, default=0)
+
+        self.build_venue_index()
+
         console = Console()
         style = "bold red" if max_depth_reached >= max_depth else "bold green"
         console.print(
@@ -1045,36 +1197,104 @@ class ResourceFinder:
             style=style,
         )
 
-    def retrieve_venue_from_local_graph(self, meta_id: str) -> VenueStructure:
-        content: VenueStructure = {"issue": {}, "volume": {}}
-        venue_uri = f"{self.base_iri}/{meta_id}"
-
-        venue_children = self._get_subjects(_P_PART_OF, venue_uri)
-        volumes: dict[str, str] = {}
+    def build_venue_index(self) -> None:
+        """
+        Index the volumes and issues of every container in the local graph.
 
-        for child_uri in venue_children:
-            types = self._get_objects(child_uri, _P_TYPE)
-            child_id = child_uri.replace(f"{self.base_iri}/", "")
-            if _T_JOURNAL_VOLUME in types:
+        A single pass over the partOf triples reads the type and sequence
+        identifier of each child once, so that retrieve_venue_from_local_graph
+        no longer walks the graph for venues with thousands of issues.
+        """
+        prefix = f"{self.base_iri}/"
+        children: Dict[str, List[str]] = {}
+        for child_uri, _, container in self.graph.triples((None, _P_PART_OF, None)):
+            children.setdefault(container.value, []).append(child_uri)
+
+        issues_of: Dict[str, Dict[str, IssueEntry]] = {}
+        volumes_of: Dict[str, List[Tuple[str, str, List[str]]]] = {}
+        index: Dict[str, VenueStructure] = {}
+        for container_uri, child_uris in children.items():
+            issues: Dict[str, IssueEntry] = {}
+            direct_issues: Dict[str, IssueEntry] = {}
+            volumes: List[Tuple[str, str, List[str]]] = []
+            for child_uri in child_uris:
+                types = self._get_objects(child_uri, _P_TYPE)
                 seqs = self._get_objects(child_uri, _P_SEQ_ID)
+                child_id = child_uri.replace(prefix, "")
+                if _T_JOURNAL_VOLUME in types:
+                    volumes.append((child_uri, child_id, seqs))
+                if _T_JOURNAL_ISSUE in types and seqs:
+                    issues[seqs[0]] = {"id": child_id}
+                    if _T_JOURNAL_VOLUME not in types:
+                        direct_issues[seqs[0]] = {"id": child_id}
+            issues_of[container_uri] = issues
+            volumes_of[container_uri] = volumes
+            index[container_uri] = {"issue": direct_issues, "volume": {}}
+
+        for container_uri, volumes in volumes_of.items():
+            content = index[container_uri]["volume"]
+            for _, child_id, seqs in volumes:
                 for seq in seqs:
-                    volumes[child_uri] = seq
-                    content["volume"][seq] = {"id": child_id, "issue": {}}
-            elif _T_JOURNAL_ISSUE in types:
-                seqs = self._get_objects(child_uri, _P_SEQ_ID)
-                seq = seqs[0] if seqs else None
-                if seq:
-                    content["issue"][seq] = {"id": child_id}
+                    content[seq] = {"id": child_id, "issue": {}}
+            for volume_uri, _, seqs in volumes:
+                if seqs:
+                    content[seqs[-1]]["issue"].update(issues_of.get(volume_uri, {}))
+        self._venue_index = index
 
-        for volume_uri, volume_seq in volumes.items():
-            volume_children = self._get_subjects(_P_PART_OF, volume_uri)
-            for child_uri in volume_children:
-                types = self._get_objects(child_uri, _P_TYPE)
-                if _T_JOURNAL_ISSUE in types:
-                    child_id = child_uri.replace(f"{self.base_iri}/", "")
-                    seqs = self._get_objects(child_uri, _P_SEQ_ID)
-                    seq = seqs[0] if seqs else None
-                    if seq:
-                        content["volume"][volume_seq]["issue"][seq] = {"id": child_id}
-
-        return content
+    def retrieve_venue_from_local_graph(self, meta_id: str) -> VenueStructure:
+        if self._venue_index is None:
+            self.build_venue_index()
+        assert self._venue_index is not None
+        indexed = self._venue_index.get(f"{self.base_iri}/{meta_id}")
+        if indexed is None:
+            return {"issue": {}, "volume": {}}
+        # The curator extends the structure it receives with new volumes and
+        # issues, so it gets its own copy
+        return {
+            "issue": {
+                seq: {"id": entry["id"]} for seq, entry in indexed["issue"].items()
+            },
+            "volume": {
+                seq: {
+                    "id": volume["id"],
+                    "issue": {
+                        issue_seq: {"id": issue["id"]}
+                        for issue_seq, issue in volume["issue"].items()
+                    },
+                }
+                for seq, volume in indexed["volume"].items()
+            },
+        }
+
+    def retrieve_metaids_from_id(self, schema: str, value: str) -> set[str]:
+        """MetaIDs of the local entities carrying the identifier ``schema:value``."""
+        id_uri = self._find_id_uri(schema, value)
+        if not id_uri:
+            return set()
+        prefix = f"{self.base_iri}/"
+        return {
+            entity_uri.replace(prefix, "")
+            for entity_uri in self._get_subjects(_P_HAS_IDENTIFIER, id_uri)
+        }
+
+    def retrieve_related_metaids(self, metaid: str) -> set[str]:
+        """
+        MetaIDs whose local data is read while curating ``metaid``.
+
+        That is the entity itself, the containers it is part of and the agents
+        holding a role in it or in any of its containers.
+        """
+        prefix = f"{self.base_iri}/"
+        related = {metaid}
+        pending = [f"{prefix}{metaid}"]
+        while pending:
+            entity_uri = pending.pop()
+            for container_uri in self._get_objects(entity_uri, _P_PART_OF):
+                container = container_uri.replace(prefix, "")
+                if container not in related:
+                    related.add(container)
+                    pending.append(container_uri)
+            for ar_uri in self._get_objects(entity_uri, _P_IS_DOC_CONTEXT_FOR):
+                for ra_uri in self._get_objects(ar_uri, _P_IS_HELD_BY):
+                    related.add(ra_uri.replace(prefix, ""))
+        return related
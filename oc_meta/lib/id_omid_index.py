@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import mmap
+import os
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+META_FILE = "index.json"
+DEFAULT_SHARDS = 64
+
+
+def _shard_of(key: bytes, shards: int) -> int:
+    return zlib.crc32(key) % shards
+
+
+def _shard_paths(index_dir: str, shard: int) -> Tuple[str, str]:
+    stem = os.path.join(index_dir, f"shard_{shard:04d}")
+    return f"{stem}.tsv", f"{stem}.offsets.npy"
+
+
+def build_id_omid_index(
+    pairs: Iterable[Tuple[str, str]], index_dir: str, shards: int = DEFAULT_SHARDS
+) -> int:
+    """
+    Write the ``(identifier, omid)`` pairs as a sharded, sorted on-disk index.
+
+    Pairs are streamed into ``shards`` files by a hash of the identifier, so
+    only one shard is ever held in memory. Each shard is then sorted into
+    ``key<TAB>omid`` lines with an array of line offsets for binary search.
+    A key met more than once keeps its last OMID. Returns the number of keys.
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    raw_paths = [os.path.join(index_dir, f"shard_{n:04d}.raw") for n in range(shards)]
+    raw_files = [open(path, "wb") for path in raw_paths]
+    try:
+        for key, omid in pairs:
+            encoded = key.encode("utf-8")
+            raw_files[_shard_of(encoded, shards)].write(
+                encoded + b"\t" + omid.encode("utf-8") + b"\n"
+            )
+    finally:
+        for raw_file in raw_files:
+            raw_file.close()
+
+    total = 0
+    for shard, raw_path in enumerate(raw_paths):
+        entries: Dict[bytes, bytes] = {}
+        with open(raw_path, "rb") as raw_file:
+            for line in raw_file:
+                key, _, omid = line.rstrip(b"\n").partition(b"\t")
+                entries[key] = omid
+        os.remove(raw_path)
+        tsv_path, offsets_path = _shard_paths(index_dir, shard)
+        offsets = np.zeros(len(entries) + 1, dtype=np.uint64)
+        with open(tsv_path, "wb") as tsv_file:
+            position = 0
+            for n, key in enumerate(sorted(entries), 1):
+                line = key + b"\t" + entries[key] + b"\n"
+                tsv_file.write(line)
+                position += len(line)
+                offsets[n] = position
+        np.save(offsets_path, offsets)
+        total += len(entries)
+
+    with open(os.path.join(index_dir, META_FILE), "wb") as meta_file:
+        meta_file.write(orjson.dumps({"shards": shards, "keys": total}))
+    return total
+
+
+def is_index(index_dir: str) -> bool:
+    return os.path.exists(os.path.join(index_dir, META_FILE))
+
+
+class IdOmidIndex:
+    """
+    Read-only view of an index written by ``build_id_omid_index``.
+
+    Shards are memory-mapped on first use, so processes reading the same
+    index share its pages. Pickling keeps only the directory.
+    """
+
+    def __init__(self, index_dir: str) -> None:
+        self.index_dir = index_dir
+        with open(os.path.join(index_dir, META_FILE), "rb") as meta_file:
+            meta = orjson.loads(meta_file.read())
+        self.shards: int = meta["shards"]
+        self.keys: int = meta["keys"]
+        self._maps: List[Optional[Tuple[mmap.mmap | bytes, np.ndarray]]] = [
+            None
+        ] * self.shards
+
+    def __len__(self) -> int:
+        return self.keys
+
+    def __reduce__(self):
+        return (IdOmidIndex, (self.index_dir,))
+
+    def _shard(self, shard: int) -> Tuple[mmap.mmap | bytes, np.ndarray]:
+        loaded = self._maps[shard]
+        if loaded is None:
+            tsv_path, offsets_path = _shard_paths(self.index_dir, shard)
+            offsets = np.load(offsets_path, mmap_mode="r")
+            data: mmap.mmap | bytes = b""
+            if len(offsets) > 1:
+                with open(tsv_path, "rb") as tsv_file:
+                    data = mmap.mmap(tsv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            loaded = (data, offsets)
+            self._maps[shard] = loaded
+        return loaded
+
+    def get(self, key: str) -> Optional[str]:
+        encoded = key.encode("utf-8")
+        data, offsets = self._shard(_shard_of(encoded, self.shards))
+        lo, hi = 0, len(offsets) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = int(offsets[mid])
+            tab = data.find(b"\t", start)
+            current = data[start:tab]
+            if current == encoded:
+                return data[tab + 1 : int(offsets[mid + 1]) - 1].decode("utf-8")
+            if current < encoded:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+from array import array
+from typing import Callable, Iterable, Iterator
+
 
 class EntityStore:
     """
@@ -13,14 +16,36 @@ class EntityStore:
     lookups in both directions (entity→ids and id→entities).
     """
 
-    def __init__(self) -> None:
-        self._parent: dict[str, str] = {}
-        self._merged: dict[str, set[str]] = {}
-        self._wannabe_to_meta: dict[str, str] = {}
-        self._entity_ids: dict[str, set[str]] = {}
-        self._entity_titles: dict[str, str] = {}
-        self._id_to_entities: dict[str, set[str]] = {}
-        self._id_to_metaid: dict[str, str] = {}
+    TABLES = (
+        "_parent",
+        "_merged",
+        "_wannabe_to_meta",
+        "_entity_ids",
+        "_entity_titles",
+        "_id_to_entities",
+        "_id_to_metaid",
+    )
+
+    def __init__(self, dict_factory: Callable[[], dict] = dict) -> None:
+        self._parent: dict[str, str] = dict_factory()
+        self._merged: dict[str, set[str]] = dict_factory()
+        self._wannabe_to_meta: dict[str, str] = dict_factory()
+        self._entity_ids: dict[str, set[str]] = dict_factory()
+        self._entity_titles: dict[str, str] = dict_factory()
+        self._id_to_entities: dict[str, set[str]] = dict_factory()
+        self._id_to_metaid: dict[str, str] = dict_factory()
+
+    def tables(self) -> dict[str, dict]:
+        """Get the internal dictionaries keyed by attribute name (see TABLES)."""
+        return {name: getattr(self, name) for name in self.TABLES}
+
+    @classmethod
+    def from_tables(cls, tables: dict[str, dict]) -> EntityStore:
+        """Build a store from dictionaries shaped like the output of tables()."""
+        store = cls()
+        for name in cls.TABLES:
+            setattr(store, name, tables[name])
+        return store
 
     def find(self, entity_id: str) -> str:
         """
@@ -261,3 +286,428 @@ class EntityStore:
     def __contains__(self, entity_key: str) -> bool:
         """Check if entity exists."""
         return entity_key in self._entity_ids
+
+
+class CompactEntityStore:
+    """
+    EntityStore backend for runs with millions of entities.
+
+    Entity keys and identifier literals are interned into consecutive integers.
+    Union-Find parents and wannabe → MetaID links are arrays indexed by entity,
+    and identifiers of an entity (or entities of an identifier) are small
+    integer arrays instead of sets of strings. The API and its results are
+    those of EntityStore.
+    """
+
+    TABLES = EntityStore.TABLES
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._key_ids: dict[str, int] = {}
+        self._literals: list[str] = []
+        self._literal_ids: dict[str, int] = {}
+        # Indexed by entity: -1 means "not in a Union-Find tree" for _parent
+        # and "no MetaID" for _meta; None means "not in the store" for _ids
+        # and "no title" for _titles
+        self._parent = array("i")
+        self._meta = array("i")
+        self._ids: list[array | None] = []
+        self._titles: list[str | None] = []
+        # Entities in insertion order, like the keys of a dict. Entries whose
+        # _position does not point back at them were removed
+        self._position = array("i")
+        self._order = array("i")
+        self._size = 0
+        self._merged: dict[int, set[int]] = {}
+        # Identifiers still pointing to an entity without being among its ids
+        # (after add_entity reset it or update_id_entity moved them), so that
+        # update_id_entity only visits the identifiers of the old entity
+        self._refs: dict[int, array] = {}
+        # Indexed by identifier literal
+        self._entities: list[array | None] = []
+        self._metaids: list[str | None] = []
+        self._metaid_order = array("i")
+
+    def _key(self, entity_key: str) -> int:
+        idx = self._key_ids.get(entity_key)
+        if idx is None:
+            idx = len(self._keys)
+            self._keys.append(entity_key)
+            self._key_ids[entity_key] = idx
+            self._parent.append(-1)
+            self._meta.append(-1)
+            self._ids.append(None)
+            self._titles.append(None)
+            self._position.append(-1)
+        return idx
+
+    def _literal(self, id_literal: str) -> int:
+        idx = self._literal_ids.get(id_literal)
+        if idx is None:
+            idx = len(self._literals)
+            self._literals.append(id_literal)
+            self._literal_ids[id_literal] = idx
+            self._entities.append(None)
+            self._metaids.append(None)
+        return idx
+
+    def _insert(self, entity: int) -> array:
+        ids = self._ids[entity]
+        if ids is None:
+            ids = self._ids[entity] = array("i")
+            self._position[entity] = len(self._order)
+            self._order.append(entity)
+            self._size += 1
+        return ids
+
+    def _pop(self, entity: int) -> array:
+        ids = self._ids[entity]
+        if ids is None:
+            return array("i")
+        self._ids[entity] = None
+        self._position[entity] = -1
+        self._size -= 1
+        if len(self._order) > 2 * self._size + 1024:
+            self._order = array("i", self._iter_entities())
+            for position, live in enumerate(self._order):
+                self._position[live] = position
+        return ids
+
+    def _iter_entities(self) -> Iterator[int]:
+        position = self._position
+        for idx, entity in enumerate(self._order):
+            if position[entity] == idx:
+                yield entity
+
+    def _remember_refs(self, entity: int, literals: Iterable[int]) -> None:
+        refs = self._refs.get(entity)
+        if refs is None:
+            refs = self._refs[entity] = array("i")
+        for literal in literals:
+            if literal not in refs:
+                refs.append(literal)
+
+    def _root(self, entity: int) -> int:
+        parent = self._parent
+        root = entity
+        while parent[root] != root:
+            root = parent[root]
+        while entity != root:
+            parent[entity], entity = root, parent[entity]
+        return root
+
+    def find(self, entity_id: str) -> str:
+        """Find the canonical ID for an entity, like EntityStore.find."""
+        idx = self._key_ids.get(entity_id)
+        if idx is None:
+            return entity_id
+        if self._meta[idx] != -1:
+            return self._keys[self._meta[idx]]
+        if self._parent[idx] == -1:
+            return entity_id
+        root = self._root(idx)
+        if self._meta[root] != -1:
+            return self._keys[self._meta[root]]
+        return self._keys[root]
+
+    def merge(self, target: str, source: str) -> None:
+        """Register that source entity was merged into target entity."""
+        target_root = self.find(target)
+        source_root = self.find(source)
+
+        if target_root == source_root:
+            return
+
+        target_idx = self._key(target_root)
+        source_idx = self._key(source_root)
+        for idx in (target_idx, source_idx):
+            if self._parent[idx] == -1:
+                self._parent[idx] = idx
+                self._merged[idx] = set()
+
+        self._parent[source_idx] = target_idx
+
+        self._merged[target_idx].add(source_idx)
+        self._merged[target_idx].update(self._merged[source_idx])
+        del self._merged[source_idx]
+
+    def get_merged(self, canonical: str) -> set[str]:
+        """Get all entity IDs that were merged into the canonical entity."""
+        idx = self._key_ids.get(self.find(canonical))
+        if idx is None:
+            return set()
+        if "wannabe" in self._keys[idx] and self._meta[idx] != -1:
+            idx = self._meta[idx]
+        return {self._keys[merged] for merged in self._merged.get(idx, ())}
+
+    def assign_meta(self, wannabe: str, meta: str) -> None:
+        """Assign a final MetaID to a wannabe entity, like EntityStore.assign_meta."""
+        wannabe_idx = self._key(wannabe)
+        meta_idx = self._key(meta)
+        root = wannabe_idx
+        if self._parent[wannabe_idx] != -1:
+            while self._parent[root] != root:
+                root = self._parent[root]
+
+        self._meta[root] = meta_idx
+        self._meta[wannabe_idx] = meta_idx
+
+        if root in self._merged:
+            self._merged[meta_idx] = self._merged.pop(root)
+            self._merged[meta_idx].add(root)
+        else:
+            self._merged[meta_idx] = {wannabe_idx} if wannabe_idx != meta_idx else set()
+        for merged in self._merged[meta_idx]:
+            self._meta[merged] = meta_idx
+
+        ids = self._ids[wannabe_idx]
+        meta_ids = self._insert(meta_idx)
+        for literal in ids if ids is not None else ():
+            if literal not in meta_ids:
+                meta_ids.append(literal)
+            entities = self._entities[literal]
+            if entities is not None and wannabe_idx != meta_idx:
+                if wannabe_idx in entities:
+                    entities.remove(wannabe_idx)
+                if meta_idx not in entities:
+                    entities.append(meta_idx)
+
+        if self._titles[meta_idx] is None and self._titles[wannabe_idx] is not None:
+            self._titles[meta_idx] = self._titles[wannabe_idx]
+
+    def add_entity(self, entity_key: str, title: str = "") -> None:
+        """Create new entity with empty ids and optional title."""
+        idx = self._key(entity_key)
+        ids = self._ids[idx]
+        if ids:
+            self._remember_refs(idx, ids)
+        self._insert(idx)
+        self._ids[idx] = array("i")
+        self._titles[idx] = title
+
+    def add_id(self, entity_key: str, identifier: str) -> None:
+        """Add identifier to entity, updating both forward and reverse indexes."""
+        idx = self._key(entity_key)
+        literal = self._literal(identifier)
+        ids = self._insert(idx)
+        if literal not in ids:
+            ids.append(literal)
+        entities = self._entities[literal]
+        if entities is None:
+            entities = self._entities[literal] = array("i")
+        if idx not in entities:
+            entities.append(idx)
+
+    def get_ids(self, entity_key: str) -> set[str]:
+        """Get all identifiers for entity."""
+        idx = self._key_ids.get(entity_key)
+        ids = self._ids[idx] if idx is not None else None
+        if not ids:
+            return set()
+        return {self._literals[literal] for literal in ids}
+
+    def get_title(self, entity_key: str) -> str:
+        """Get title for entity."""
+        idx = self._key_ids.get(entity_key)
+        title = self._titles[idx] if idx is not None else None
+        return title if title is not None else ""
+
+    def set_title(self, entity_key: str, title: str) -> None:
+        """Set title for entity."""
+        self._titles[self._key(entity_key)] = title
+
+    def has_entity(self, entity_key: str) -> bool:
+        """Check if entity exists in store."""
+        return entity_key in self
+
+    def remove_entity(self, entity_key: str) -> None:
+        """Remove entity from store, cleaning both forward and reverse indexes."""
+        idx = self._key_ids.get(entity_key)
+        if idx is None:
+            return
+        identifiers = self._pop(idx)
+        self._titles[idx] = None
+        for literal in identifiers:
+            entities = self._entities[literal]
+            if entities is not None and idx in entities:
+                entities.remove(idx)
+                if not entities:
+                    self._entities[literal] = None
+
+    def merge_entities(self, target: str, source: str) -> None:
+        """Merge source entity into target, combining ids and keeping target's title."""
+        self.merge(target, source)
+        source_idx = self._key(source)
+        source_ids = self._pop(source_idx)
+        source_title = self._titles[source_idx] or ""
+        self._titles[source_idx] = None
+        target_idx = self._key(target)
+        target_ids = self._insert(target_idx)
+        for literal in source_ids:
+            if literal not in target_ids:
+                target_ids.append(literal)
+            entities = self._entities[literal]
+            if entities is not None:
+                if source_idx in entities:
+                    entities.remove(source_idx)
+                if target_idx not in entities:
+                    entities.append(target_idx)
+        if not self._titles[target_idx] and source_title:
+            self._titles[target_idx] = source_title
+
+    def entities(self) -> dict[str, dict[str, set[str] | str]]:
+        """Get all entities as {entity_key: {"ids": set, "title": str}}."""
+        return {
+            self._keys[idx]: {
+                "ids": self.get_ids(self._keys[idx]),
+                "title": self._titles[idx] or "",
+            }
+            for idx in self._iter_entities()
+        }
+
+    def find_entities(self, id_literal: str) -> set[str]:
+        """Find all entities that have an identifier."""
+        literal = self._literal_ids.get(id_literal)
+        entities = self._entities[literal] if literal is not None else None
+        if entities is None:
+            return set()
+        return {self._keys[idx] for idx in entities}
+
+    def find_entity(self, id_literal: str) -> str | None:
+        """Find the first entity that has an identifier."""
+        literal = self._literal_ids.get(id_literal)
+        entities = self._entities[literal] if literal is not None else None
+        return self._keys[entities[0]] if entities else None
+
+    def update_id_entity(self, old_entity: str, new_entity: str) -> None:
+        """
+        Update all identifiers from old_entity to point to new_entity.
+
+        Only the identifiers of old_entity, plus those recorded in _refs, are
+        visited instead of every identifier in the store.
+        """
+        old_idx = self._key_ids.get(old_entity)
+        if old_idx is None:
+            return
+        new_idx = self._key(new_entity)
+        candidates = dict.fromkeys(self._ids[old_idx] or ())
+        candidates.update(dict.fromkeys(self._refs.get(old_idx, ())))
+        moved = []
+        for literal in candidates:
+            entities = self._entities[literal]
+            if entities is None or old_idx not in entities:
+                continue
+            entities.remove(old_idx)
+            if new_idx not in entities:
+                entities.append(new_idx)
+            new_ids = self._ids[new_idx]
+            if new_ids is None or literal not in new_ids:
+                moved.append(literal)
+        if moved:
+            self._remember_refs(new_idx, moved)
+
+    def set_id_metaid(self, id_literal: str, metaid: str) -> None:
+        """Store the MetaID for an identifier literal."""
+        literal = self._literal(id_literal)
+        if self._metaids[literal] is None:
+            self._metaid_order.append(literal)
+        self._metaids[literal] = metaid
+
+    def get_id_metaid(self, id_literal: str) -> str | None:
+        """Get the MetaID for an identifier literal."""
+        literal = self._literal_ids.get(id_literal)
+        return self._metaids[literal] if literal is not None else None
+
+    def get_id_metaids(self) -> dict[str, str]:
+        """Get all identifier → MetaID mappings."""
+        return {
+            self._literals[literal]: self._metaids[literal]  # type: ignore[misc]
+            for literal in self._metaid_order
+        }
+
+    def tables(self) -> dict[str, dict]:
+        """Get the content as the dictionaries EntityStore keeps (see TABLES)."""
+        keys = self._keys
+        literals = self._literals
+        return {
+            "_parent": {
+                keys[idx]: keys[parent]
+                for idx, parent in enumerate(self._parent)
+                if parent != -1
+            },
+            "_merged": {
+                keys[idx]: {keys[merged] for merged in members}
+                for idx, members in self._merged.items()
+            },
+            "_wannabe_to_meta": {
+                keys[idx]: keys[meta]
+                for idx, meta in enumerate(self._meta)
+                if meta != -1
+            },
+            "_entity_ids": {
+                keys[idx]: self.get_ids(keys[idx]) for idx in self._iter_entities()
+            },
+            "_entity_titles": {
+                keys[idx]: title
+                for idx, title in enumerate(self._titles)
+                if title is not None
+            },
+            "_id_to_entities": {
+                literals[literal]: {keys[idx] for idx in entities}
+                for literal, entities in enumerate(self._entities)
+                if entities is not None
+            },
+            "_id_to_metaid": self.get_id_metaids(),
+        }
+
+    @classmethod
+    def from_tables(cls, tables: dict[str, dict]) -> CompactEntityStore:
+        """Build a store from dictionaries shaped like the output of tables()."""
+        store = cls()
+        for key, title in tables["_entity_titles"].items():
+            store._titles[store._key(key)] = title
+        for key, ids in tables["_entity_ids"].items():
+            idx = store._key(key)
+            store._insert(idx).extend(store._literal(literal) for literal in ids)
+        for key, parent in tables["_parent"].items():
+            store._parent[store._key(key)] = store._key(parent)
+        for key, members in tables["_merged"].items():
+            store._merged[store._key(key)] = {store._key(member) for member in members}
+        for key, meta in tables["_wannabe_to_meta"].items():
+            store._meta[store._key(key)] = store._key(meta)
+        for id_literal, entities in tables["_id_to_entities"].items():
+            literal = store._literal(id_literal)
+            store._entities[literal] = array("i", map(store._key, entities))
+            for idx in store._entities[literal]:
+                ids = store._ids[idx]
+                if ids is None or literal not in ids:
+                    store._remember_refs(idx, (literal,))
+        for id_literal, metaid in tables["_id_to_metaid"].items():
+            store.set_id_metaid(id_literal, metaid)
+        return store
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over entity keys in insertion order."""
+        return (self._keys[idx] for idx in self._iter_entities())
+
+    def __len__(self) -> int:
+        """Return number of entities."""
+        return self._size
+
+    def __contains__(self, entity_key: str) -> bool:
+        """Check if entity exists."""
+        idx = self._key_ids.get(entity_key)
+        return idx is not None and self._ids[idx] is not None
+
+
+ENTITY_STORE_BACKENDS: dict[str, type[EntityStore] | type[CompactEntityStore]] = {
+    "dict": EntityStore,
+    "compact": CompactEntityStore,
+}
+
+
+def create_entity_store(backend: str = "dict") -> EntityStore | CompactEntityStore:
+    """Instantiate the entity store backend selected by the entity_store_backend setting."""
+    if backend not in ENTITY_STORE_BACKENDS:
+        raise ValueError(f"Unknown entity store backend: {backend}")
+    return ENTITY_STORE_BACKENDS[backend]()
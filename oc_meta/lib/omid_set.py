@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import os
+from typing import FrozenSet, Iterable
+
+import numpy as np
+
+# A leading 1 keeps the zeros of "0601": the key of "br/0601" is 10601
+_MAX_DIGITS = 18
+
+
+def _key(number: str) -> int | None:
+    if number.isdigit() and len(number) <= _MAX_DIGITS:
+        return int(f"1{number}")
+    return None
+
+
+class OmidSet:
+    """
+    Read-only set of the OMIDs of one entity type, e.g. ``omid:br/``.
+
+    OMID numbers are kept as a sorted ``uint64`` array saved to ``path`` and
+    memory-mapped, so worker processes share the pages of one file instead of
+    each holding a copy; membership is a binary search. The rare numbers that
+    do not fit in 64 bits are kept in a plain set.
+    """
+
+    def __init__(self, path: str, prefix: str, overflow: FrozenSet[str]) -> None:
+        self.path = path
+        self.prefix = prefix
+        self.overflow = overflow
+        self._keys = np.load(path, mmap_mode="r")
+
+    @classmethod
+    def build(cls, omids: Iterable[str], path: str, prefix: str) -> "OmidSet":
+        """Save the OMIDs starting with ``prefix`` to ``path`` and map them."""
+        keys = []
+        overflow = set()
+        for omid in omids:
+            if not omid.startswith(prefix):
+                continue
+            number = omid[len(prefix) :]
+            key = _key(number)
+            if key is None:
+                overflow.add(number)
+            else:
+                keys.append(key)
+        array = np.unique(np.array(keys, dtype=np.uint64))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npy"
+        np.save(tmp_path, array)
+        os.replace(tmp_path, path)
+        return cls(path, prefix, frozenset(overflow))
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self.overflow)
+
+    def __contains__(self, omid: object) -> bool:
+        if not isinstance(omid, str) or not omid.startswith(self.prefix):
+            return False
+        number = omid[len(self.prefix) :]
+        key = _key(number)
+        if key is None:
+            return number in self.overflow
+        position = int(np.searchsorted(self._keys, np.uint64(key)))
+        return position < len(self._keys) and int(self._keys[position]) == key
+
+    def __reduce__(self):
+        # Workers map the saved file rather than receiving the array
+        return (OmidSet, (self.path, self.prefix, self.overflow))
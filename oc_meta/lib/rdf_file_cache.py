@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Dict, List
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import orjson
+from filelock import FileLock
+from oc_ocdm.graph.graph_entity import GraphEntity
+from oc_ocdm.metadata.metadata_entity import MetadataEntity
+from oc_ocdm.prov.prov_entity import ProvEntity
+from oc_ocdm.reader import Reader
+from oc_ocdm.storer import Storer, _compact_jsonld, _entity_to_jsonld_dict, _JsonLdDoc
+
+
+class _CachedFile:
+    __slots__ = (
+        "doc",
+        "relevant_path",
+        "zip_output",
+        "context_path",
+        "ns_to_prefix",
+    )
+
+    def __init__(
+        self,
+        doc: _JsonLdDoc,
+        relevant_path: str,
+        zip_output: bool,
+        context_path: str | None,
+        ns_to_prefix: list | None,
+    ) -> None:
+        self.doc = doc
+        self.relevant_path = relevant_path
+        self.zip_output = zip_output
+        self.context_path = context_path
+        self.ns_to_prefix = ns_to_prefix
+
+
+class RdfFileCache:
+    """
+    Write-back cache of the JSON-LD files written by ``CachedStorer``.
+
+    Files stay parsed in memory across batches, so a zip that several batches
+    touch (venues, identifiers and agents often fall in the same ranges) is
+    read once and written once per flush rather than once per batch. At most
+    ``max_files`` files are held: loading one more first writes back the least
+    recently used. ``flush`` writes every file back and empties the cache.
+    """
+
+    def __init__(self, max_files: int) -> None:
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._files: OrderedDict[str, _CachedFile] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def store(
+        self,
+        storer: Storer,
+        relevant_paths: Dict[str, list],
+        context_path: str | None,
+    ) -> List[str]:
+        """Merge the entities of ``storer`` into the cached files, as ``Storer`` does on disk."""
+        reader = Reader(context_map=storer.context_map)
+        ns_to_prefix = None
+        if context_path is not None and context_path in storer.context_map:
+            ns_to_prefix = storer._build_ns_to_prefix(context_path)
+        for relevant_path, entities_in_path in relevant_paths.items():
+            output_filepath = (
+                relevant_path.replace(os.path.splitext(relevant_path)[1], ".zip")
+                if storer.zip_output
+                else relevant_path
+            )
+            cached = self._files.get(output_filepath)
+            if cached is None:
+                self.misses += 1
+                existing_data = None
+                with FileLock(f"{output_filepath}.lock"):
+                    if os.path.exists(output_filepath):
+                        existing_data = reader.load_jsonld_dict(output_filepath)
+                while len(self._files) >= max(self.max_files, 1):
+                    self._write(*self._files.popitem(last=False))
+                cached = _CachedFile(
+                    _JsonLdDoc(existing_data if existing_data is not None else []),
+                    relevant_path,
+                    storer.zip_output,
+                    context_path,
+                    ns_to_prefix,
+                )
+                self._files[output_filepath] = cached
+            else:
+                self.hits += 1
+                self._files.move_to_end(output_filepath)
+
+            doc = cached.doc
+            for entity in entities_in_path:
+                graph_iri = entity.g.identifier
+                if isinstance(entity, ProvEntity):
+                    doc.merge_entity(
+                        graph_iri, entity.res, _entity_to_jsonld_dict(entity)
+                    )
+                elif isinstance(entity, (GraphEntity, MetadataEntity)):
+                    if entity.to_be_deleted:
+                        doc.remove_entity(graph_iri, entity.res)
+                    else:
+                        if len(entity._preexisting_triples) > 0:
+                            doc.remove_entity(graph_iri, entity.res)
+                        doc.upsert_entity(
+                            graph_iri, entity.res, _entity_to_jsonld_dict(entity)
+                        )
+        return list(relevant_paths.keys())
+
+    def flush(self) -> None:
+        """Write every cached file back to disk and drop all of them."""
+        while self._files:
+            self._write(*self._files.popitem(last=False))
+
+    def _write(self, output_filepath: str, cached: _CachedFile) -> None:
+        output_data: list | dict = cached.doc.to_list()
+        if cached.context_path is not None and cached.ns_to_prefix is not None:
+            output_data = _compact_jsonld(
+                output_data, cached.context_path, cached.ns_to_prefix
+            )
+        json_bytes = orjson.dumps(output_data)
+        with FileLock(f"{output_filepath}.lock"):
+            if cached.zip_output:
+                with ZipFile(
+                    output_filepath, mode="w", compression=ZIP_DEFLATED, allowZip64=True
+                ) as zf:
+                    zf.writestr(os.path.basename(cached.relevant_path), json_bytes)
+            else:
+                with open(output_filepath, "wb") as f:
+                    f.write(json_bytes)
+
+
+class CachedStorer(Storer):
+    """
+    ``Storer`` whose JSON-LD files go through an ``RdfFileCache``.
+
+    The cache is not pickled: a copy sent to another process stores its
+    files directly, like a plain ``Storer``.
+    """
+
+    def __init__(self, *args, file_cache: RdfFileCache | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.file_cache = file_cache
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["file_cache"] = None
+        return state
+
+    def _store_all_jsonld_fast(
+        self, relevant_paths: Dict[str, list], context_path: str | None
+    ) -> List[str]:
+        if self.file_cache is None:
+            return super()._store_all_jsonld_fast(relevant_paths, context_path)
+        return self.file_cache.store(self, relevant_paths, context_path)
@@ -4,17 +4,29 @@
 
 from __future__ import annotations
 
-import multiprocessing
+import os
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Callable
 from urllib.error import URLError
 from urllib.parse import parse_qs, urlparse
 
+import orjson
+import requests
 from SPARQLWrapper import JSON, POST, SPARQLWrapper
 from SPARQLWrapper.SPARQLExceptions import EndPointInternalError, QueryBadFormed
 
-from oc_meta.constants import QLEVER_MAX_WORKERS, QLEVER_QUERIES_PER_GROUP
+from oc_meta.constants import QLEVER_MAX_WORKERS
+
+# Statuses SPARQLWrapper maps to non-retried exceptions (Unauthorized,
+# EndPointNotFound, URITooLong); every other HTTP error used to surface as a
+# retried URLError
+_NON_RETRIABLE_STATUS = frozenset({401, 404, 414})
+
+_thread_local = threading.local()
+_query_pools: dict[int, ThreadPoolExecutor] = {}
+_query_pools_lock = threading.Lock()
 
 
 def _make_sparql_client(endpoint_url: str) -> SPARQLWrapper:
@@ -72,35 +84,134 @@ def execute_sparql_update(
     raise last_error  # type: ignore[misc]
 
 
+def _get_session() -> requests.Session:
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["Accept"] = "application/sparql-results+json"
+        _thread_local.session = session
+    return session
+
+
+def _reset_after_fork() -> None:
+    # A forked child must neither share the parent's sockets nor wait on
+    # pools whose threads were not copied
+    global _thread_local, _query_pools, _query_pools_lock
+    _thread_local = threading.local()
+    _query_pools = {}
+    _query_pools_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_query_pool(workers: int) -> ThreadPoolExecutor:
+    """Return the process-wide thread pool running SPARQL queries with ``workers`` threads."""
+    with _query_pools_lock:
+        pool = _query_pools.get(workers)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="sparql-query"
+            )
+            _query_pools[workers] = pool
+        return pool
+
+
+def _post_query(
+    session: requests.Session, endpoint_url: str, query: str
+) -> list[dict[str, dict[str, str]]]:
+    response = session.post(endpoint_url, data={"query": query}, timeout=3600)
+    status = response.status_code
+    if status == 400:
+        raise QueryBadFormed(response.text)
+    if status == 500:
+        raise EndPointInternalError(response.text)
+    response.raise_for_status()
+    return orjson.loads(response.content)["results"]["bindings"]
+
+
 def execute_sparql_queries(
     endpoint_url: str,
     queries: list[str],
     max_retries: int = 5,
     backoff_factor: float = 5,
 ) -> list[list[dict[str, dict[str, str]]]]:
+    """
+    Run SELECT queries one after the other and return their bindings.
+
+    Requests go through a keep-alive session owned by the calling thread and
+    responses are decoded with orjson. Retries follow the same rules as
+    execute_sparql: malformed queries and 401/404/414 responses fail at once,
+    while internal errors, other HTTP errors and connection failures are
+    retried with exponential backoff.
+    """
     results: list[list[dict[str, dict[str, str]]]] = []
-    sparql = _make_sparql_client(endpoint_url)
+    session = _get_session()
     for query in queries:
         last_error: Exception | None = None
         for attempt in range(max_retries + 1):
             if attempt > 0:
                 time.sleep(backoff_factor * (2**attempt))
             try:
-                sparql.setQuery(query)
-                result: dict[str, dict[str, list[dict[str, dict[str, str]]]]] = (
-                    sparql.queryAndConvert()
-                )  # type: ignore[assignment]
-                results.append(result["results"]["bindings"])
+                results.append(_post_query(session, endpoint_url, query))
                 break
             except QueryBadFormed:
                 raise
-            except (EndPointInternalError, URLError) as e:
+            except requests.HTTPError as e:
+                if e.response.status_code in _NON_RETRIABLE_STATUS:
+                    raise
+                last_error = e
+            except (EndPointInternalError, requests.RequestException) as e:
                 last_error = e
         else:
             raise last_error  # type: ignore[misc]
     return results
 
 
+def execute_sparql_queries_parallel(
+    endpoint_url: str,
+    queries: list[str],
+    workers: int = QLEVER_MAX_WORKERS,
+    progress_callback: Callable[[int], None] | None = None,
+    max_retries: int = 5,
+    backoff_factor: float = 5,
+) -> list[list[dict[str, dict[str, str]]]]:
+    """
+    Run SELECT queries concurrently on a shared thread pool.
+
+    At most ``workers`` requests are in flight at the same time. Pool threads
+    outlive the call, so their keep-alive connections are reused by later
+    calls (e.g. the next traversal depth). Results are returned in the order
+    of ``queries``; ``progress_callback`` receives the index of each query as
+    soon as it completes. The first error cancels the queries not yet started.
+    """
+    if not queries:
+        return []
+    pool = get_query_pool(workers)
+    future_to_idx = {
+        pool.submit(
+            execute_sparql_queries,
+            endpoint_url,
+            [query],
+            max_retries,
+            backoff_factor,
+        ): idx
+        for idx, query in enumerate(queries)
+    }
+    results: list[list[dict[str, dict[str, str]]]] = [[] for _ in queries]
+    try:
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            results[idx] = future.result()[0]
+            if progress_callback:
+                progress_callback(idx)
+    except BaseException:
+        for future in future_to_idx:
+            future.cancel()
+        raise
+    return results
+
+
 def run_queries_parallel(
     endpoint_url: str,
     batch_queries: list[str],
@@ -113,42 +224,26 @@ def run_queries_parallel(
     if not batch_queries:
         return []
 
-    all_bindings: list[list] = []
-
     if len(batch_queries) > 1 and workers > 1:
-        query_groups: list[list[str]] = []
-        grouped_sizes: list[int] = []
-        for i in range(0, len(batch_queries), QLEVER_QUERIES_PER_GROUP):
-            query_groups.append(batch_queries[i : i + QLEVER_QUERIES_PER_GROUP])
-            grouped_sizes.append(sum(batch_sizes[i : i + QLEVER_QUERIES_PER_GROUP]))
-
-        with ProcessPoolExecutor(
-            max_workers=min(len(query_groups), workers),
-            mp_context=multiprocessing.get_context("forkserver"),
-        ) as executor:
-            future_to_size = {
-                executor.submit(
-                    execute_sparql_queries,
-                    endpoint_url=endpoint_url,
-                    queries=group,
-                    max_retries=max_retries,
-                    backoff_factor=backoff_factor,
-                ): size
-                for group, size in zip(query_groups, grouped_sizes)
-            }
-            for future in as_completed(future_to_size):
-                all_bindings.extend(future.result())
-                if progress_callback:
-                    progress_callback(future_to_size[future])
-    else:
-        results = execute_sparql_queries(
-            endpoint_url=endpoint_url,
-            queries=batch_queries,
+        return execute_sparql_queries_parallel(
+            endpoint_url,
+            batch_queries,
+            workers=workers,
+            progress_callback=(
+                (lambda idx: progress_callback(batch_sizes[idx]))
+                if progress_callback
+                else None
+            ),
             max_retries=max_retries,
             backoff_factor=backoff_factor,
         )
-        all_bindings.extend(results)
-        if progress_callback:
-            progress_callback(sum(batch_sizes))
 
-    return all_bindings
+    results = execute_sparql_queries(
+        endpoint_url=endpoint_url,
+        queries=batch_queries,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+    if progress_callback:
+        progress_callback(sum(batch_sizes))
+    return results
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from oc_ocdm import Storer
+from oc_ocdm.support.query_utils import _compute_graph_changes, _serialize_triples_to_nt
+
+Triple = tuple
+# (query, added statements, removed statements)
+Update = Tuple[str, int, int]
+
+
+class UpdateCoalescer:
+    """
+    Merges the changes of many entities into few, size-bounded SPARQL updates.
+
+    Triples are grouped by graph, in the order they are added. Since every
+    change comes from the diff of an entity against its preexisting triples,
+    a deleted triple existed and an inserted one did not: deleting a triple
+    inserted earlier, or inserting one deleted earlier, leaves the
+    triplestore as it was, so both are dropped. Each update holds at most
+    ``max_triples`` statements, deletions first.
+    """
+
+    def __init__(self, max_triples: int) -> None:
+        self.max_triples = max(max_triples, 1)
+        self.cancelled = 0
+        self._inserts: Dict[str, Dict[Triple, None]] = {}
+        self._deletes: Dict[str, Dict[Triple, None]] = {}
+
+    def add(
+        self, graph_iri: str, to_insert: Iterable[Triple], to_delete: Iterable[Triple]
+    ) -> None:
+        inserts = self._inserts.setdefault(graph_iri, {})
+        deletes = self._deletes.setdefault(graph_iri, {})
+        for triple in to_delete:
+            if triple in inserts:
+                del inserts[triple]
+                self.cancelled += 1
+            else:
+                deletes[triple] = None
+        for triple in to_insert:
+            if triple in deletes:
+                del deletes[triple]
+                self.cancelled += 1
+            else:
+                inserts[triple] = None
+
+    def add_entity(self, entity) -> None:
+        to_insert, to_delete, _, _ = _compute_graph_changes(
+            entity, Storer._class_to_entity_type(entity)
+        )
+        if to_insert or to_delete:
+            self.add(entity.g.identifier, to_insert, to_delete)
+
+    def quads(self) -> Iterator[Tuple[str, Triple]]:
+        """Yield the ``(graph IRI, triple)`` pairs left to insert."""
+        for graph_iri, triples in self._inserts.items():
+            for triple in triples:
+                yield graph_iri, triple
+
+    def updates(self, inserts: bool = True) -> Iterator[Update]:
+        """Yield the updates; with ``inserts=False`` only the deletions."""
+        parts: List[str] = []
+        added = removed = 0
+        operations = [("DELETE", self._deletes)]
+        if inserts:
+            operations.append(("INSERT", self._inserts))
+        for operation, changes in operations:
+            graphs: List[str] = []
+            for graph_iri, triples in changes.items():
+                pending = list(triples)
+                while pending:
+                    room = self.max_triples - added - removed
+                    if room <= 0:
+                        if graphs:
+                            parts.append(f"{operation} DATA {{ {' '.join(graphs)} }}")
+                            graphs = []
+                        yield " ; ".join(parts), added, removed
+                        parts, added, removed = [], 0, 0
+                        room = self.max_triples
+                    chunk, pending = pending[:room], pending[room:]
+                    graphs.append(
+                        f"GRAPH <{graph_iri}> {{ {_serialize_triples_to_nt(chunk)} }}"
+                    )
+                    if operation == "DELETE":
+                        removed += len(chunk)
+                    else:
+                        added += len(chunk)
+            if graphs:
+                parts.append(f"{operation} DATA {{ {' '.join(graphs)} }}")
+        if parts:
+            yield " ; ".join(parts), added, removed
+
+
+def coalesce_storer(storer: Storer, max_triples: int) -> UpdateCoalescer:
+    """Coalesce the changes of the entities ``storer`` would upload."""
+    coalescer = UpdateCoalescer(max_triples)
+    for entity in storer.a_set.res_to_entity.values():
+        if (
+            storer.modified_entities is not None
+            and str(entity.res).split("/prov/se/")[0] not in storer.modified_entities
+        ):
+            continue
+        coalescer.add_entity(entity)
+    return coalescer
+
+
+def upload_coalesced(
+    storer: Storer, triplestore_url: str, base_dir: str | None, max_triples: int
+) -> Dict[str, float]:
+    """
+    Upload the changes of the entities of ``storer`` as coalesced updates.
+
+    Entities are filtered and failed updates saved as in ``Storer.upload_all``.
+    Returns the number of requests, their payload in bytes, the total and
+    the longest request time in seconds, and the number of cancelled triples.
+    """
+    coalescer = coalesce_storer(storer, max_triples)
+    stats: Dict[str, float] = {
+        "requests": 0,
+        "bytes": 0,
+        "seconds": 0.0,
+        "max_seconds": 0.0,
+        "cancelled": coalescer.cancelled,
+    }
+    for query, added, removed in coalescer.updates():
+        start = time.perf_counter()
+        storer._query(query, triplestore_url, base_dir, added, removed)
+        elapsed = time.perf_counter() - start
+        stats["requests"] += 1
+        stats["bytes"] += len(query.encode("utf-8"))
+        stats["seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+    return stats
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import psutil
+
+Barrier = Callable[[Optional[BaseException]], None]
+
+
+class StorageQueue:
+    """
+    Bounded queue of storage jobs run one at a time, in submission order.
+
+    Every job belongs to a group (the input file it stores). Once a job fails,
+    the remaining jobs of its group are skipped and the error is kept until a
+    barrier or ``pop_error`` collects it. ``submit`` blocks while
+    ``max_queued`` jobs are waiting or running, or while some are and the
+    process RSS is above ``max_rss_mb``, since every queued job holds a batch
+    of entities in memory. With ``max_queued`` set to 0 jobs run immediately
+    in the calling thread and their errors propagate.
+    """
+
+    def __init__(self, max_queued: int = 0, max_rss_mb: float | None = None) -> None:
+        self.max_queued = max_queued
+        self.max_rss = int(max_rss_mb * 1024 * 1024) if max_rss_mb else None
+        self.submitted = 0
+        self.completed = 0
+        self._jobs: Deque[Tuple[str, Callable[[], None], bool]] = deque()
+        self._errors: Dict[str, BaseException] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._process = psutil.Process()
+
+    def _backpressure(self) -> bool:
+        queued = self.submitted - self.completed
+        if queued >= self.max_queued:
+            return True
+        return (
+            queued > 0
+            and self.max_rss is not None
+            and self._process.memory_info().rss > self.max_rss
+        )
+
+    def _enqueue(self, group: str, job: Callable[[], None], barrier: bool) -> int:
+        with self._condition:
+            while self._backpressure():
+                self._condition.wait(timeout=1)
+            self._jobs.append((group, job, barrier))
+            self.submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+            return self.submitted
+
+    def submit(self, group: str, job: Callable[[], None]) -> int:
+        """Queue ``job`` and return its ticket for ``wait``."""
+        if not self.max_queued:
+            job()
+            return self.submitted
+        return self._enqueue(group, job, barrier=False)
+
+    def submit_barrier(self, group: str, callback: Barrier) -> int:
+        """
+        Queue ``callback`` to run once every job submitted before it is done.
+
+        It receives the error raised by a job of ``group``, or None, and runs
+        even if the group failed.
+        """
+        if not self.max_queued:
+            callback(self.pop_error(group))
+            return self.submitted
+        return self._enqueue(group, lambda: callback(self.pop_error(group)), True)
+
+    def wait(self, ticket: int | None = None) -> None:
+        """Block until the job with ``ticket``, or every job so far, is done."""
+        with self._condition:
+            target = self.submitted if ticket is None else ticket
+            while self.completed < target:
+                self._condition.wait()
+
+    def pop_error(self, group: str) -> BaseException | None:
+        with self._condition:
+            return self._errors.pop(group, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._jobs:
+                    self._condition.wait()
+                group, job, barrier = self._jobs.popleft()
+                skip = not barrier and group in self._errors
+            if not skip:
+                try:
+                    job()
+                except BaseException as e:
+                    with self._condition:
+                        self._errors.setdefault(group, e)
+            with self._condition:
+                self.completed += 1
+                self._condition.notify_all()
@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Tuple
+
+import orjson
+
+# (predicate, object value, object term type, object datatype)
+CachedRow = Tuple[str, str, str, str]
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+class SubjectCache:
+    """
+    Persistent subject → triples cache shared across input files.
+
+    ResourceFinder consults it before issuing a ``SELECT ?s ?p ?o`` batch, so
+    hot venues, publishers and prolific authors fetched while processing one
+    file are not fetched again for the next one. Data lives in a SQLite file
+    opened with memory-mapped I/O. Entries must be invalidated for every
+    subject touched by a file (the ``modified_entities`` returned by ProvSet)
+    before the next file is curated.
+    """
+
+    def __init__(self, path: str, mmap_size: int = 1 << 30) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS subjects (s TEXT PRIMARY KEY, rows BLOB NOT NULL)"
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, subjects: Iterable[str]) -> Dict[str, List[CachedRow]]:
+        """Return the cached rows of every subject found, keyed by subject URI."""
+        subject_list = list(subjects)
+        found: Dict[str, List[CachedRow]] = {}
+        for i in range(0, len(subject_list), _SQLITE_MAX_VARIABLES):
+            chunk = subject_list[i : i + _SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT s, rows FROM subjects WHERE s IN ({placeholders})", chunk
+            )
+            for s, rows in cursor:
+                found[s] = [tuple(row) for row in orjson.loads(rows)]
+        self.hits += len(found)
+        self.misses += len(subject_list) - len(found)
+        return found
+
+    def put_many(self, rows_by_subject: Dict[str, List[CachedRow]]) -> None:
+        """Store (or replace) the rows of each subject."""
+        if not rows_by_subject:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO subjects (s, rows) VALUES (?, ?)",
+                (
+                    (s, orjson.dumps(rows))
+                    for s, rows in rows_by_subject.items()
+                    if rows
+                ),
+            )
+
+    def invalidate(self, subjects: Iterable[str]) -> None:
+        """Drop the cached rows of the given subjects."""
+        subject_list = [str(s) for s in subjects]
+        if not subject_list:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN")
+            for i in range(0, len(subject_list), _SQLITE_MAX_VARIABLES):
+                chunk = subject_list[i : i + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                self._conn.execute(
+                    f"DELETE FROM subjects WHERE s IN ({placeholders})", chunk
+                )
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM subjects")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM subjects").fetchone()[0]
+
+    def __contains__(self, subject: str) -> bool:
+        cursor = self._conn.execute("SELECT 1 FROM subjects WHERE s = ?", (subject,))
+        return cursor.fetchone() is not None
@@ -33,6 +33,7 @@ CURATION_PHASES = [
     ("curation__collect_identifiers", "Collect IDs", CURATION_COLLECT_IDS_COLOR),
     ("curation__clean_id", "Clean ID", CURATION_CLEAN_ID_COLOR),
     ("curation__clean_vvi_ra", "Clean VVI/RA", CURATION_VVI_RA_COLOR),
+    ("curation__partitioned", "Clean (partitioned)", CURATION_CLEAN_ID_COLOR),
     ("curation__metamaker", "Metamaker", CURATION_METAMAKER_COLOR),
     ("curation__csv_out", "CSV out", CURATION_CSV_OUT_COLOR),
 ]
@@ -40,6 +41,7 @@ CURATION_PHASES = [
 CURATION_REST_PHASES = [
     "curation__clean_id",
     "curation__clean_vvi_ra",
+    "curation__partitioned",
     "curation__metamaker",
     "curation__csv_out",
 ]
@@ -223,7 +225,7 @@ def plot_scalability_analysis(per_size_results: List[Dict[str, Any]], output_pat
             curation_sum = size_data["statistics"][
                 "curation__collect_identifiers_duration_seconds"
             ]["mean"] + sum(
-                size_data["statistics"][f"{p}_duration_seconds"]["mean"]
+                size_data["statistics"].get(f"{p}_duration_seconds", {}).get("mean", 0)
                 for p in CURATION_REST_PHASES
             )
             phase_data["curation"].append(curation_sum)
@@ -384,7 +386,8 @@ def plot_benchmark_results(
     # Phase breakdown
     collect_ids_mean = stats["curation__collect_identifiers_duration_seconds"]["mean"]
     curation_rest_mean = sum(
-        stats[f"{p}_duration_seconds"]["mean"] for p in CURATION_REST_PHASES
+        stats.get(f"{p}_duration_seconds", {}).get("mean", 0)
+        for p in CURATION_REST_PHASES
     )
     rdf_mean = stats["rdf_creation_duration_seconds"]["mean"]
     storage_mean = stats.get("storage_duration_seconds", {}).get("mean", 0)
@@ -17,8 +17,7 @@ from rich_argparse import RichHelpFormatter
 
 from oc_meta.lib.console import create_progress
 from oc_meta.lib.file_manager import collect_zip_files
-from oc_meta.lib.file_manager import find_rdf_file
-from oc_meta.run.meta.generate_csv import load_json_from_file
+from oc_meta.run.meta.generate_csv import find_entity, load_json_from_file
 
 ROLE_MAP = {
     "http://purl.org/spar/pro/author": "author",
@@ -49,34 +48,27 @@ def _ar_summary(ar_uri: str, info: dict) -> dict:
 def load_ar_data(
     ar_uri: str, rdf_dir: str, dir_split_number: int, items_per_file: int
 ) -> Optional[dict]:
-    ar_file = find_rdf_file(
-        ar_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
-    )
-    if not os.path.exists(ar_file):
+    entity = find_entity(ar_uri, rdf_dir, dir_split_number, items_per_file)
+    if entity is None:
         return None
-    data = load_json_from_file(ar_file)
-    for graph in data:
-        for entity in graph["@graph"]:
-            if entity["@id"] == ar_uri:
-                role_uri = ""
-                if WITH_ROLE in entity:
-                    role_uri = entity[WITH_ROLE][0]["@id"]
-                role_type = ROLE_MAP.get(role_uri, "unknown")
+    role_uri = ""
+    if WITH_ROLE in entity:
+        role_uri = entity[WITH_ROLE][0]["@id"]
+    role_type = ROLE_MAP.get(role_uri, "unknown")
 
-                ra_uri = None
-                if IS_HELD_BY in entity:
-                    ra_uri = entity[IS_HELD_BY][0]["@id"]
+    ra_uri = None
+    if IS_HELD_BY in entity:
+        ra_uri = entity[IS_HELD_BY][0]["@id"]
 
-                has_next = []
-                if HAS_NEXT in entity:
-                    has_next = [item["@id"] for item in entity[HAS_NEXT]]
+    has_next = []
+    if HAS_NEXT in entity:
+        has_next = [item["@id"] for item in entity[HAS_NEXT]]
 
-                return {
-                    "role_type": role_type,
-                    "ra": ra_uri,
-                    "has_next": has_next,
-                }
-    return None
+    return {
+        "role_type": role_type,
+        "ra": ra_uri,
+        "has_next": has_next,
+    }
 
 
 def detect_cycles(ar_data: Dict[str, dict], ar_uris_in_group: set) -> List[List[str]]:
@@ -48,6 +48,7 @@ from rich_argparse import RichHelpFormatter
 from oc_meta.core.creator import Creator
 from oc_meta.lib.cleaner import normalize_id
 from oc_meta.lib.console import console
+from oc_meta.lib.entity_index import get_entity_index
 from oc_meta.lib.file_manager import find_rdf_file
 from oc_meta.run.find.hasnext_anomalies import (
     HAS_NEXT,
@@ -55,7 +56,7 @@ from oc_meta.run.find.hasnext_anomalies import (
     find_anomalies,
 )
 from oc_meta.run.meta.check_results import _extract_entity_groups, find_prov_file
-from oc_meta.run.meta.generate_csv import URI_TYPE_DICT, load_json_from_file
+from oc_meta.run.meta.generate_csv import URI_TYPE_DICT
 
 TITLE = "http://purl.org/dc/terms/title"
 PUB_DATE = "http://prismstandard.org/namespaces/basic/2.0/publicationDate"
@@ -83,25 +84,13 @@ class RowResult:
 
 
 class EntityCache:
-    """Per-row cache of data files, so one zip is read once even for many entities."""
+    """Entity lookups through the ``EntityIndex`` of the worker, shared across rows."""
 
     def __init__(self, rdf_dir: str, dir_split: int, items_per_file: int) -> None:
         self.rdf_dir = rdf_dir
         self.dir_split = dir_split
         self.items_per_file = items_per_file
-        self._files: dict[str, Optional[dict[str, dict]]] = {}
-
-    def _graphs(self, data_zip: str) -> Optional[dict[str, dict]]:
-        if data_zip not in self._files:
-            if not os.path.exists(data_zip):
-                self._files[data_zip] = None
-            else:
-                index: dict[str, dict] = {}
-                for graph in load_json_from_file(data_zip):
-                    for entity in graph["@graph"]:
-                        index[entity["@id"]] = entity
-                self._files[data_zip] = index
-        return self._files[data_zip]
+        self.index = get_entity_index()
 
     def data_file(self, uri: str) -> str:
         return find_rdf_file(
@@ -109,10 +98,7 @@ class EntityCache:
         )
 
     def get(self, uri: str) -> Optional[dict]:
-        graphs = self._graphs(self.data_file(uri))
-        if graphs is None:
-            return None
-        return graphs.get(uri)
+        return self.index.get(self.data_file(uri), uri)
 
 
 def _values(entity: dict, predicate: str) -> list[str]:
@@ -196,11 +182,10 @@ def _check_provenance(uri: str, cache: EntityCache) -> Optional[str]:
     if prov_file is None:
         return "provenance_missing"
     snapshots: dict[int, dict] = {}
-    for graph in load_json_from_file(prov_file):
-        for snapshot in graph["@graph"]:
-            if uri in _ids(snapshot, SPECIALIZATION_OF):
-                number = int(snapshot["@id"].rsplit("/se/", 1)[1])
-                snapshots[number] = snapshot
+    for snapshot in (cache.index.entities(prov_file) or {}).values():
+        if uri in _ids(snapshot, SPECIALIZATION_OF):
+            number = int(snapshot["@id"].rsplit("/se/", 1)[1])
+            snapshots[number] = snapshot
     if not snapshots:
         return "provenance_missing"
     if INVALIDATED in snapshots[max(snapshots)]:
@@ -42,6 +42,11 @@ RECOGNIZED_SCHEMAS = BR_ID_SCHEMAS | RA_ID_SCHEMAS
 
 _SPACE_PATTERN = "[\t\xa0\u200b\u202f\u2003\u2005\u2009]"
 _ID_COLUMNS = ["id", "author", "editor", "publisher", "venue"]
+# Polars patterns mirroring RE_SEMICOLON_IN_PEOPLE_FIELD and RE_NAME_AND_IDS
+_INNER_SEMICOLON = r";([^\[\]]*\])"
+_ID_TOKEN = r"[^\s\[\]]+:[^\s\[\]]+"
+_BRACKETED_IDS = rf"\[\s*((?:{_ID_TOKEN})?(?:\s+{_ID_TOKEN})*)\s*\]"
+_TOKEN = r"^([^:]+):(.*)$"
 _STAT_FIELDS = (
     "total_rows",
     "rows_with_ids",
@@ -268,6 +273,85 @@ def _extract_entity_groups(cell: str, col: str, base_iri: str) -> list[dict]:
     return groups
 
 
+def _extract_identifier_tokens(df: pl.DataFrame, base_iri: str) -> pl.DataFrame:
+    """
+    Vectorised counterpart of ``_extract_entity_groups`` over whole columns.
+
+    Returns one row per ``schema:value`` token with its 1-based ``row``, its
+    column, the ``group`` (entity) it belongs to within that column, its
+    ``kind`` (omid, recognized or unverifiable) and the ``omid_uri`` of the
+    group, in row-major order.
+    """
+    base = base_iri.rstrip("/")
+    frames = []
+    for col_idx, col in enumerate(_ID_COLUMNS):
+        cells = (
+            df.select(
+                pl.int_range(1, pl.len() + 1, dtype=pl.Int64).alias("row"),
+                pl.col(col).alias("ids"),
+            )
+            .filter(pl.col("ids").is_not_null() & (pl.col("ids") != ""))
+            .with_row_index("group")
+        )
+        if col != "id":
+            # Semicolons before a closing bracket belong to an id, not the list
+            protected = pl.col("ids")
+            while cells.select(protected.str.contains(_INNER_SEMICOLON).any()).item():
+                cells = cells.with_columns(
+                    protected.str.replace_all(_INNER_SEMICOLON, "\x00$1")
+                )
+            cells = (
+                cells.select("row", pl.col("ids").str.extract_all("[^;]+").alias("ids"))
+                .explode("ids")
+                .with_row_index("group")
+                .with_columns(
+                    pl.col("ids")
+                    .str.replace_all("\x00", ";", literal=True)
+                    .str.extract(_BRACKETED_IDS, 1)
+                )
+            )
+        frames.append(
+            cells.select(
+                "row",
+                "group",
+                pl.col("ids").str.extract_all(r"\S+").alias("token"),
+            )
+            .explode("token")
+            .select(
+                "row",
+                pl.lit(col_idx, dtype=pl.Int64).alias("col_idx"),
+                pl.lit(col).alias("col"),
+                "group",
+                pl.col("token")
+                .str.extract(_TOKEN, 1)
+                .str.to_lowercase()
+                .alias("schema"),
+                pl.col("token").str.extract(_TOKEN, 2).alias("value"),
+            )
+            .drop_nulls("schema")
+        )
+    tokens = pl.concat(frames).sort(["row", "col_idx"], maintain_order=True)
+
+    kind = (
+        pl.when(pl.col("schema") == "omid")
+        .then(pl.lit("omid"))
+        .when(pl.col("schema").is_in(sorted(RECOGNIZED_SCHEMAS)))
+        .then(pl.lit("recognized"))
+        .otherwise(pl.lit("unverifiable"))
+    )
+    tokens = tokens.with_columns(kind.alias("kind"))
+    omid_values = tokens.filter(pl.col("kind") == "omid")["value"].unique()
+    omid_uris = {value: f"{base}/{normalize_hyphens(value)}" for value in omid_values}
+    group_omid = (
+        pl.col("value")
+        .replace_strict(omid_uris, default=None, return_dtype=pl.String)
+        .filter(pl.col("kind") == "omid")
+        .last()
+        .over(["col_idx", "group"])
+    )
+    return tokens.with_columns(group_omid.alias("omid_uri"))
+
+
 def process_csv_file(
     args: tuple, workers: int = QLEVER_MAX_WORKERS, progress=None, task_id=None
 ) -> FileResult:
@@ -302,83 +386,81 @@ def process_csv_file(
     )
 
     result.total_rows = len(df)
-    col_lists = {col: df[col].to_list() for col in _ID_COLUMNS}
+
+    phase1_task = None
+    if progress:
+        phase1_task = progress.add_task(
+            "  Phase 1/5: Extracting identifiers", total=result.total_rows, detail=""
+        )
+
+    tokens = _extract_identifier_tokens(df, base_iri)
     del df
 
+    result.rows_with_ids = tokens["row"].n_unique()
+    omid_groups = tokens.filter(pl.col("kind") == "omid").unique(
+        ["col_idx", "group"], keep="first", maintain_order=True
+    )
+    result.omid_schema_identifiers = len(omid_groups)
+    result.identifiers_skipped_unverifiable = int(
+        (tokens["kind"] == "unverifiable").sum()
+    )
+    recognized = tokens.filter(pl.col("kind") == "recognized")
+    result.total_identifiers = (
+        result.omid_schema_identifiers
+        + result.identifiers_skipped_unverifiable
+        + len(recognized)
+    )
+
     # entity URIs from CSV OMID tokens — used for data graph + prov verification
-    all_entity_uris: set[str] = set()
-    entity_uri_to_info: dict[str, tuple[int, str]] = {}  # uri → (row_num, col)
+    entity_uri_to_info: dict[str, tuple[int, str]] = {
+        uri: (row_num, col)
+        for uri, row_num, col in omid_groups.unique(
+            "omid_uri", keep="first", maintain_order=True
+        )
+        .select("omid_uri", "row", "col")
+        .iter_rows()
+    }
+    all_entity_uris: set[str] = set(entity_uri_to_info)
+
+    # recognized IDs for SPARQL lookup; only distinct tokens are normalised
+    raw_ids = recognized.select(
+        pl.concat_str("schema", pl.lit(":"), "value").alias("raw_id")
+    )["raw_id"]
+    normalized_ids = {
+        raw_id: normalize_id(normalize_hyphens(raw_id)) for raw_id in raw_ids.unique()
+    }
+    recognized = recognized.with_columns(
+        raw_ids.replace_strict(
+            normalized_ids, default=None, return_dtype=pl.String
+        ).alias("id_key")
+    )
+    result.identifiers_skipped_invalid = recognized["id_key"].null_count()
 
-    # recognized IDs for SPARQL lookup
     recognized_ids: list[dict] = []
     recognized_id_set: set[str] = set()
     recognized_id_to_csv_omid: dict[str, str | None] = {}
     recognized_id_occurrences: dict[str, list[tuple[int, str]]] = {}
     recognized_id_meta: dict[str, tuple[str, str]] = {}
-
-    phase1_task = None
-    if progress:
-        phase1_task = progress.add_task(
-            "  Phase 1/5: Extracting identifiers", total=result.total_rows, detail=""
+    for id_key, csv_omid, rows, cols in (
+        recognized.drop_nulls("id_key")
+        .group_by("id_key", maintain_order=True)
+        .agg(
+            pl.col("omid_uri").first(),
+            pl.col("row"),
+            pl.col("col"),
         )
-
-    for row_idx in range(result.total_rows):
-        row_has_ids = False
-        row_num = row_idx + 1
-
-        for col in _ID_COLUMNS:
-            cell = col_lists[col][row_idx]
-            if not cell:
-                continue
-
-            groups = _extract_entity_groups(cell, col, base_iri)
-            for group in groups:
-                n_tokens = (
-                    (1 if group["omid_uri"] else 0)
-                    + len(group["recognized"])
-                    + len(group["unverifiable"])
-                )
-                if n_tokens == 0:
-                    continue
-
-                row_has_ids = True
-                result.total_identifiers += n_tokens
-
-                if group["omid_uri"]:
-                    result.omid_schema_identifiers += 1
-                    all_entity_uris.add(group["omid_uri"])
-                    if group["omid_uri"] not in entity_uri_to_info:
-                        entity_uri_to_info[group["omid_uri"]] = (row_num, col)
-
-                result.identifiers_skipped_unverifiable += len(group["unverifiable"])
-
-                for schema, value in group["recognized"]:
-                    normalized = normalize_id(f"{schema}:{value}")
-                    if not normalized:
-                        result.identifiers_skipped_invalid += 1
-                        continue
-                    norm_schema, norm_value = normalized.split(":", 1)
-                    id_key = normalized
-                    if id_key not in recognized_id_set:
-                        recognized_id_set.add(id_key)
-                        recognized_ids.append(
-                            {"schema": norm_schema, "value": norm_value}
-                        )
-                        recognized_id_to_csv_omid[id_key] = group["omid_uri"]
-                        recognized_id_meta[id_key] = (norm_schema, norm_value)
-                        recognized_id_occurrences[id_key] = []
-                    recognized_id_occurrences[id_key].append((row_num, col))
-
-        if row_has_ids:
-            result.rows_with_ids += 1
-
-        if progress and phase1_task is not None:
-            progress.advance(phase1_task)
+        .iter_rows()
+    ):
+        norm_schema, norm_value = id_key.split(":", 1)
+        recognized_id_set.add(id_key)
+        recognized_ids.append({"schema": norm_schema, "value": norm_value})
+        recognized_id_to_csv_omid[id_key] = csv_omid
+        recognized_id_meta[id_key] = (norm_schema, norm_value)
+        recognized_id_occurrences[id_key] = list(zip(rows, cols))
+    del tokens, recognized
 
     if progress and phase1_task is not None:
-        progress.update(phase1_task, visible=False)
-
-    del col_lists
+        progress.update(phase1_task, completed=result.total_rows, visible=False)
 
     phase2_task = None
     if progress:
@@ -4,14 +4,20 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
+import tempfile
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Iterator
 
 from rich_argparse import RichHelpFormatter
 
 from oc_meta.lib.cleaner import normalize_hyphens, normalize_id
 from oc_meta.lib.console import console, create_progress
 from oc_meta.lib.file_manager import get_csv_data, write_csv
+from oc_meta.lib.id_omid_index import IdOmidIndex, build_id_omid_index, is_index
 
 CITING_COL = "citing_id"
 CITED_COL = "cited_id"
@@ -30,8 +36,7 @@ def _count_csv_rows(filepath: str) -> int:
         return sum(1 for _ in f) - 1
 
 
-def build_id_to_omid_mapping(meta_output_dir: str) -> dict[str, str]:
-    mapping: dict[str, str] = {}
+def iter_id_omid_pairs(meta_output_dir: str) -> Iterator[tuple[str, str]]:
     csv_files = _csv_files_in_dir(meta_output_dir)
     for i, csv_path in enumerate(csv_files, 1):
         console.print(
@@ -43,19 +48,76 @@ def build_id_to_omid_mapping(meta_output_dir: str) -> dict[str, str]:
             others = [p for p in parts if not p.startswith("omid:")]
             for omid in omids:
                 for other in others:
-                    mapping[other.lower()] = omid
-    return mapping
+                    yield other.lower(), omid
+
+
+def build_id_to_omid_index(meta_output_dir: str, index_dir: str) -> IdOmidIndex:
+    build_id_omid_index(iter_id_omid_pairs(meta_output_dir), index_dir)
+    return IdOmidIndex(index_dir)
+
+
+_index: IdOmidIndex | None = None
+
+
+def _init_worker(index: IdOmidIndex) -> None:
+    global _index
+    _index = index
+    _resolve.cache_clear()
+
+
+@lru_cache(maxsize=1_000_000)
+def _resolve(raw_id: str) -> tuple[str | None, str | None]:
+    # Citing and cited columns repeat the same identifiers many times
+    normalized = normalize_id(normalize_hyphens(raw_id))
+    if not normalized:
+        return None, None
+    assert _index is not None
+    return normalized, _index.get(normalized.lower())
+
+
+def _convert_file(cit_path: str, out_path: str) -> tuple[int, int, int, int, set[str]]:
+    resolved = 0
+    unresolved_citing = 0
+    unresolved_cited = 0
+    invalid = 0
+    orphan_ids: set[str] = set()
+    output_rows: list[dict[str, str]] = []
+
+    for row in get_csv_data(cit_path):
+        citing_id, citing_omid = _resolve(row[CITING_COL].strip())
+        cited_id, cited_omid = _resolve(row[CITED_COL].strip())
+
+        if not citing_id or not cited_id:
+            invalid += 1
+            continue
+
+        if citing_omid and cited_omid:
+            output_rows.append({"citing": citing_omid, "cited": cited_omid})
+            resolved += 1
+        else:
+            if not citing_omid:
+                unresolved_citing += 1
+                orphan_ids.add(citing_id)
+            if not cited_omid:
+                unresolved_cited += 1
+                orphan_ids.add(cited_id)
+
+    write_csv(out_path, output_rows)
+    return resolved, unresolved_citing, unresolved_cited, invalid, orphan_ids
 
 
 def convert_citations(
     meta_output_dir: str,
     citations_dir: str,
     output_dir: str,
+    workers: int = 1,
+    index_dir: str | None = None,
 ) -> None:
     os.makedirs(output_dir, exist_ok=True)
 
     citation_files = _csv_files_in_dir(citations_dir)
-    total_cit_rows = sum(_count_csv_rows(f) for f in citation_files)
+    file_rows = {f: _count_csv_rows(f) for f in citation_files}
+    total_cit_rows = sum(file_rows.values())
 
     total_resolved = 0
     total_unresolved_citing = 0
@@ -63,51 +125,54 @@ def convert_citations(
     total_invalid = 0
     all_orphan_ids: set[str] = set()
 
-    console.print("[bold]Building ID→OMID mapping…[/bold]")
-    mapping = build_id_to_omid_mapping(meta_output_dir)
-    console.print(f"  Loaded {len(mapping)} ID→OMID entries")
-
-    with create_progress() as progress:
-        cit_task = progress.add_task("Converting citations", total=total_cit_rows)
-        for cit_path in citation_files:
-            out_path = os.path.join(output_dir, os.path.basename(cit_path))
-
-            resolved = 0
-            unresolved_citing = 0
-            unresolved_cited = 0
-            output_rows: list[dict[str, str]] = []
-
-            for row in get_csv_data(cit_path):
-                raw_citing = row[CITING_COL].strip()
-                raw_cited = row[CITED_COL].strip()
-
-                citing_id = normalize_id(normalize_hyphens(raw_citing))
-                cited_id = normalize_id(normalize_hyphens(raw_cited))
-
-                if not citing_id or not cited_id:
-                    total_invalid += 1
-                    progress.advance(cit_task)
-                    continue
-
-                citing_omid = mapping.get(citing_id.lower())
-                cited_omid = mapping.get(cited_id.lower())
-
-                if citing_omid and cited_omid:
-                    output_rows.append({"citing": citing_omid, "cited": cited_omid})
-                    resolved += 1
-                else:
-                    if not citing_omid:
-                        unresolved_citing += 1
-                        all_orphan_ids.add(citing_id)
-                    if not cited_omid:
-                        unresolved_cited += 1
-                        all_orphan_ids.add(cited_id)
-                progress.advance(cit_task)
-
-            write_csv(out_path, output_rows)
-            total_resolved += resolved
-            total_unresolved_citing += unresolved_citing
-            total_unresolved_cited += unresolved_cited
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if index_dir is None:
+            index_dir = os.path.join(tmp_dir, "id_omid_index")
+        if is_index(index_dir):
+            console.print(f"[bold]Reusing ID→OMID index in {index_dir}[/bold]")
+            index = IdOmidIndex(index_dir)
+        else:
+            console.print("[bold]Building ID→OMID index…[/bold]")
+            index = build_id_to_omid_index(meta_output_dir, index_dir)
+        console.print(f"  Indexed {len(index)} ID→OMID entries")
+
+        jobs = [
+            (cit_path, os.path.join(output_dir, os.path.basename(cit_path)))
+            for cit_path in citation_files
+        ]
+        with create_progress() as progress:
+            cit_task = progress.add_task("Converting citations", total=total_cit_rows)
+            if workers <= 1:
+                _init_worker(index)
+                results = ((job[0], _convert_file(*job)) for job in jobs)
+                executor = None
+            else:
+                # Use forkserver to avoid deadlocks when forking in a multi-threaded environment
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("forkserver"),
+                    initializer=_init_worker,
+                    initargs=(index,),
+                )
+                futures = {executor.submit(_convert_file, *job): job[0] for job in jobs}
+                results = (
+                    (futures[future], future.result())
+                    for future in as_completed(futures)
+                )
+            try:
+                for cit_path, result in results:
+                    resolved, unresolved_citing, unresolved_cited, invalid, orphans = (
+                        result
+                    )
+                    total_resolved += resolved
+                    total_unresolved_citing += unresolved_citing
+                    total_unresolved_cited += unresolved_cited
+                    total_invalid += invalid
+                    all_orphan_ids.update(orphans)
+                    progress.advance(cit_task, file_rows[cit_path])
+            finally:
+                if executor is not None:
+                    executor.shutdown()
 
     console.print("\n[bold]Results:[/bold]")
     console.print(f"  Total citations:     {total_cit_rows}")
@@ -144,9 +209,24 @@ if __name__ == "__main__":  # pragma: no cover
         required=True,
         help="Directory for output citation CSVs (with 'citing' and 'cited' columns)",
     )
+    arg_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes converting citation files in parallel",
+    )
+    arg_parser.add_argument(
+        "--index-dir",
+        default=None,
+        help="Directory for the on-disk ID→OMID index. Reused when it already "
+        "holds an index; a temporary one is built and removed otherwise",
+    )
     args = arg_parser.parse_args()
     convert_citations(
         meta_output_dir=args.meta_output,
         citations_dir=args.citations,
         output_dir=args.output,
+        workers=args.workers,
+        index_dir=args.index_dir,
     )
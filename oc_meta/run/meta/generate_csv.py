@@ -9,9 +9,8 @@ from __future__ import annotations
 import csv
 import os
 from argparse import ArgumentParser
-from functools import lru_cache
 import multiprocessing
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from zipfile import ZipFile
 
 import orjson
@@ -19,7 +18,9 @@ import redis
 import yaml
 
 from oc_meta.lib.console import create_progress
+from oc_meta.lib.entity_index import get_entity_index, set_entity_index_size
 from oc_meta.lib.file_manager import collect_zip_files, find_rdf_file
+from oc_meta.lib.omid_set import OmidSet
 
 csv.field_size_limit(2**31 - 1)
 
@@ -75,27 +76,27 @@ URI_TYPE_DICT = {
     "http://purl.org/spar/fabio/WebContent": "web content",
 }
 
-_worker_redis: Optional[redis.Redis] = None
+PROCESSED_OMIDS_FILE = "processed_omids.npy"
+
+_worker_omids: Optional[OmidSet] = None
 _worker_config: Optional[Tuple[str, int, int]] = None
 
 
 def _init_worker(
-    redis_host: str,
-    redis_port: int,
-    redis_db: int,
+    processed_omids: OmidSet,
     input_dir: str,
     dir_split_number: int,
     items_per_file: int,
+    cache_mb: int = 512,
 ) -> None:
-    global _worker_redis, _worker_config
-    _worker_redis = redis.Redis(
-        host=redis_host, port=redis_port, db=redis_db, decode_responses=True
-    )
+    global _worker_omids, _worker_config
+    _worker_omids = processed_omids
     _worker_config = (input_dir, dir_split_number, items_per_file)
+    set_entity_index_size(cache_mb * 1024 * 1024)
 
 
 def _process_file_worker(filepath: str) -> Tuple[str, List[Dict[str, str]]]:
-    assert _worker_redis is not None and _worker_config is not None
+    assert _worker_omids is not None and _worker_config is not None
     input_dir, dir_split_number, items_per_file = _worker_config
     results = []
     data = load_json_from_file(filepath)
@@ -110,7 +111,7 @@ def _process_file_worker(filepath: str) -> Tuple[str, List[Dict[str, str]]]:
             entity_id = entity.get("@id", "")
             if entity_id:
                 omid = f"omid:br/{entity_id.split('/')[-1]}"
-                if _worker_redis.sismember("processed_omids", omid):
+                if omid in _worker_omids:
                     continue
             br_data = process_bibliographic_resource(
                 entity, input_dir, dir_split_number, items_per_file
@@ -132,16 +133,13 @@ def is_omid_processed(omid: str, redis_client: redis.Redis) -> bool:
     return bool(redis_client.sismember("processed_omids", omid))
 
 
-def load_processed_omids_to_redis(output_dir: str, redis_client: redis.Redis) -> int:
-    redis_client.delete("processed_omids")
-
+def iter_processed_omids(output_dir: str) -> Iterator[str]:
+    """Yield the BR OMIDs of the CSV files already written to ``output_dir``."""
     if not os.path.exists(output_dir):
-        return 0
+        return
 
     csv.field_size_limit(2**31 - 1)
 
-    count = 0
-    BATCH_SIZE = 1000
     csv_files = [f for f in os.listdir(output_dir) if f.endswith(".csv")]
 
     with create_progress() as progress:
@@ -150,32 +148,56 @@ def load_processed_omids_to_redis(output_dir: str, redis_client: redis.Redis) ->
         for filename in csv_files:
             filepath = os.path.join(output_dir, filename)
             with open(filepath, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                batch_pipe = redis_client.pipeline()
-                batch_count = 0
-
-                for row in reader:
-                    omids = [
-                        id_part.strip()
-                        for id_part in row["id"].split()
-                        if id_part.startswith("omid:br/")
-                    ]
-                    for omid in omids:
-                        batch_pipe.sadd("processed_omids", omid)
-                        batch_count += 1
-                        count += 1
-
-                        if batch_count >= BATCH_SIZE:
-                            batch_pipe.execute()
-                            batch_pipe = redis_client.pipeline()
-                            batch_count = 0
-
-                if batch_count > 0:
-                    batch_pipe.execute()
+                for row in csv.DictReader(f):
+                    for id_part in row["id"].split():
+                        if id_part.startswith("omid:br/"):
+                            yield id_part.strip()
 
             progress.update(task, advance=1)
 
-    return count
+
+def _mirror_to_redis(
+    omids: Iterable[str], redis_client: redis.Redis, batch_size: int = 1000
+) -> Iterator[str]:
+    """Yield ``omids`` unchanged while adding them to the Redis set in batches."""
+    batch_pipe = redis_client.pipeline()
+    batch_count = 0
+    for omid in omids:
+        batch_pipe.sadd("processed_omids", omid)
+        batch_count += 1
+        if batch_count >= batch_size:
+            batch_pipe.execute()
+            batch_pipe = redis_client.pipeline()
+            batch_count = 0
+        yield omid
+
+    if batch_count > 0:
+        batch_pipe.execute()
+
+
+def load_processed_omids(
+    output_dir: str, redis_client: Optional[redis.Redis] = None
+) -> OmidSet:
+    """
+    Save the OMIDs already exported to ``output_dir`` as a memory-mapped set,
+    mirroring them into ``redis_client`` in the same pass if given.
+    """
+    omids = iter_processed_omids(output_dir)
+    if redis_client is not None:
+        redis_client.delete("processed_omids")
+        omids = _mirror_to_redis(omids, redis_client)
+    return OmidSet.build(
+        omids,
+        os.path.join(output_dir, PROCESSED_OMIDS_FILE),
+        "omid:br/",
+    )
+
+
+def load_processed_omids_to_redis(output_dir: str, redis_client: redis.Redis) -> int:
+    redis_client.delete("processed_omids")
+    return sum(
+        1 for _ in _mirror_to_redis(iter_processed_omids(output_dir), redis_client)
+    )
 
 
 def load_checkpoint(checkpoint_file: str) -> set:
@@ -190,7 +212,6 @@ def mark_file_processed(checkpoint_file: str, filepath: str) -> None:
         f.write(filepath + "\n")
 
 
-@lru_cache(maxsize=2000)
 def load_json_from_file(filepath: str) -> list:
     with ZipFile(filepath, "r") as zip_file:
         json_filename = zip_file.namelist()[0]
@@ -198,6 +219,16 @@ def load_json_from_file(filepath: str) -> list:
             return orjson.loads(json_file.read())
 
 
+def find_entity(
+    uri: str, rdf_dir: str, dir_split_number: int, items_per_file: int
+) -> Optional[dict]:
+    """Return the JSON-LD entity ``uri`` from its data file, if any."""
+    return get_entity_index().get(
+        find_rdf_file(uri, rdf_dir, dir_split_number, items_per_file, zip_output=True),
+        uri,
+    )
+
+
 def process_identifier(id_data: dict) -> Optional[str]:
     try:
         id_schema = id_data["http://purl.org/spar/datacite/usesIdentifierScheme"][0][
@@ -242,18 +273,13 @@ def process_responsible_agent(
 
         if "http://purl.org/spar/datacite/hasIdentifier" in ra_data:
             for identifier in ra_data["http://purl.org/spar/datacite/hasIdentifier"]:
-                id_uri = identifier["@id"]
-                id_file = find_rdf_file(
-                    id_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
+                id_entity = find_entity(
+                    identifier["@id"], rdf_dir, dir_split_number, items_per_file
                 )
-                if os.path.exists(id_file):
-                    id_data = load_json_from_file(id_file)
-                    for graph in id_data:
-                        for entity in graph.get("@graph", []):
-                            if entity["@id"] == id_uri:
-                                id_value = process_identifier(entity)
-                                if id_value:
-                                    identifiers.append(id_value)
+                if id_entity is not None:
+                    id_value = process_identifier(id_entity)
+                    if id_value:
+                        identifiers.append(id_value)
 
         if identifiers:
             return f"{name} [{' '.join(identifiers)}]"
@@ -280,18 +306,13 @@ def process_venue_title(
 
     if "http://purl.org/spar/datacite/hasIdentifier" in venue_data:
         for identifier in venue_data["http://purl.org/spar/datacite/hasIdentifier"]:
-            id_uri = identifier["@id"]
-            id_file = find_rdf_file(
-                id_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
+            id_entity = find_entity(
+                identifier["@id"], rdf_dir, dir_split_number, items_per_file
             )
-            if os.path.exists(id_file):
-                id_data = load_json_from_file(id_file)
-                for graph in id_data:
-                    for entity in graph.get("@graph", []):
-                        if entity["@id"] == id_uri:
-                            id_value = process_identifier(entity)
-                            if id_value:
-                                identifiers.append(id_value)
+            if id_entity is not None:
+                id_value = process_identifier(id_entity)
+                if id_value:
+                    identifiers.append(id_value)
 
     return f"{venue_title} [{' '.join(identifiers)}]" if identifiers else venue_title
 
@@ -333,25 +354,21 @@ def process_hierarchical_venue(
 
     if "http://purl.org/vocab/frbr/core#partOf" in entity:
         parent_uri = entity["http://purl.org/vocab/frbr/core#partOf"][0]["@id"]
-        parent_file = find_rdf_file(
-            parent_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
+        parent_entity = find_entity(
+            parent_uri, rdf_dir, dir_split_number, items_per_file
         )
-        if os.path.exists(parent_file):
-            parent_data = load_json_from_file(parent_file)
-            for graph in parent_data:
-                for parent_entity in graph.get("@graph", []):
-                    if parent_entity["@id"] == parent_uri:
-                        parent_info = process_hierarchical_venue(
-                            parent_entity,
-                            rdf_dir,
-                            dir_split_number,
-                            items_per_file,
-                            visited,
-                            depth + 1,
-                        )
-                        for key, value in parent_info.items():
-                            if not result[key]:
-                                result[key] = value
+        if parent_entity is not None:
+            parent_info = process_hierarchical_venue(
+                parent_entity,
+                rdf_dir,
+                dir_split_number,
+                items_per_file,
+                visited,
+                depth + 1,
+            )
+            for key, value in parent_info.items():
+                if not result[key]:
+                    result[key] = value
 
     return result
 
@@ -412,18 +429,13 @@ def process_bibliographic_resource(
 
         if "http://purl.org/spar/datacite/hasIdentifier" in br_data:
             for identifier in br_data["http://purl.org/spar/datacite/hasIdentifier"]:
-                id_uri = identifier["@id"]
-                id_file = find_rdf_file(
-                    id_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
+                id_entity = find_entity(
+                    identifier["@id"], rdf_dir, dir_split_number, items_per_file
                 )
-                if os.path.exists(id_file):
-                    id_data = load_json_from_file(id_file)
-                    for graph in id_data:
-                        for entity in graph.get("@graph", []):
-                            if entity["@id"] == id_uri:
-                                id_value = process_identifier(entity)
-                                if id_value:
-                                    identifiers.append(id_value)
+                if id_entity is not None:
+                    id_value = process_identifier(id_entity)
+                    if id_value:
+                        identifiers.append(id_value)
         output["id"] = " ".join(identifiers)
 
         authors = []
@@ -435,20 +447,14 @@ def process_bibliographic_resource(
         if "http://purl.org/spar/pro/isDocumentContextFor" in br_data:
             for ar_data in br_data["http://purl.org/spar/pro/isDocumentContextFor"]:
                 ar_uri = ar_data["@id"]
-                ar_file = find_rdf_file(
-                    ar_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
-                )
-                if os.path.exists(ar_file):
-                    ar_data = load_json_from_file(ar_file)
-                    for graph in ar_data:
-                        for entity in graph.get("@graph", []):
-                            if entity["@id"] == ar_uri:
-                                agent_roles[ar_uri] = entity
-                                if "https://w3id.org/oc/ontology/hasNext" in entity:
-                                    next_ar = entity[
-                                        "https://w3id.org/oc/ontology/hasNext"
-                                    ][0]["@id"]
-                                    next_relations[ar_uri] = next_ar
+                entity = find_entity(ar_uri, rdf_dir, dir_split_number, items_per_file)
+                if entity is not None:
+                    agent_roles[ar_uri] = entity
+                    if "https://w3id.org/oc/ontology/hasNext" in entity:
+                        next_ar = entity["https://w3id.org/oc/ontology/hasNext"][0][
+                            "@id"
+                        ]
+                        next_relations[ar_uri] = next_ar
 
             for role_type, role_list in [
                 ("author", authors),
@@ -484,27 +490,19 @@ def process_bibliographic_resource(
                             ra_uri = entity["http://purl.org/spar/pro/isHeldBy"][0][
                                 "@id"
                             ]
-                            ra_file = find_rdf_file(
-                                ra_uri,
-                                rdf_dir,
-                                dir_split_number,
-                                items_per_file,
-                                zip_output=True,
+                            ra_entity = find_entity(
+                                ra_uri, rdf_dir, dir_split_number, items_per_file
                             )
-                            if os.path.exists(ra_file):
-                                ra_data = load_json_from_file(ra_file)
-                                for ra_graph in ra_data:
-                                    for ra_entity in ra_graph.get("@graph", []):
-                                        if ra_entity["@id"] == ra_uri:
-                                            agent_name = process_responsible_agent(
-                                                ra_entity,
-                                                ra_uri,
-                                                rdf_dir,
-                                                dir_split_number,
-                                                items_per_file,
-                                            )
-                                            if agent_name:
-                                                role_list.append(agent_name)
+                            if ra_entity is not None:
+                                agent_name = process_responsible_agent(
+                                    ra_entity,
+                                    ra_uri,
+                                    rdf_dir,
+                                    dir_split_number,
+                                    items_per_file,
+                                )
+                                if agent_name:
+                                    role_list.append(agent_name)
 
                     current_ar = next_relations.get(current_ar)
 
@@ -514,39 +512,27 @@ def process_bibliographic_resource(
 
         if "http://purl.org/vocab/frbr/core#partOf" in br_data:
             venue_uri = br_data["http://purl.org/vocab/frbr/core#partOf"][0]["@id"]
-            venue_file = find_rdf_file(
-                venue_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
-            )
-            if os.path.exists(venue_file):
-                venue_data = load_json_from_file(venue_file)
-                for graph in venue_data:
-                    for entity in graph.get("@graph", []):
-                        if entity["@id"] == venue_uri:
-                            venue_info = process_hierarchical_venue(
-                                entity, rdf_dir, dir_split_number, items_per_file
-                            )
-                            output.update(venue_info)
+            entity = find_entity(venue_uri, rdf_dir, dir_split_number, items_per_file)
+            if entity is not None:
+                venue_info = process_hierarchical_venue(
+                    entity, rdf_dir, dir_split_number, items_per_file
+                )
+                output.update(venue_info)
 
         if "http://purl.org/vocab/frbr/core#embodiment" in br_data:
             page_uri = br_data["http://purl.org/vocab/frbr/core#embodiment"][0]["@id"]
-            page_file = find_rdf_file(
-                page_uri, rdf_dir, dir_split_number, items_per_file, zip_output=True
-            )
-            if os.path.exists(page_file):
-                page_data = load_json_from_file(page_file)
-                for graph in page_data:
-                    for entity in graph.get("@graph", []):
-                        if entity["@id"] == page_uri:
-                            start_page = entity.get(
-                                "http://prismstandard.org/namespaces/basic/2.0/startingPage",
-                                [{}],
-                            )[0].get("@value", "")
-                            end_page = entity.get(
-                                "http://prismstandard.org/namespaces/basic/2.0/endingPage",
-                                [{}],
-                            )[0].get("@value", "")
-                            if start_page or end_page:
-                                output["page"] = f"{start_page}-{end_page}"
+            entity = find_entity(page_uri, rdf_dir, dir_split_number, items_per_file)
+            if entity is not None:
+                start_page = entity.get(
+                    "http://prismstandard.org/namespaces/basic/2.0/startingPage",
+                    [{}],
+                )[0].get("@value", "")
+                end_page = entity.get(
+                    "http://prismstandard.org/namespaces/basic/2.0/endingPage",
+                    [{}],
+                )[0].get("@value", "")
+                if start_page or end_page:
+                    output["page"] = f"{start_page}-{end_page}"
 
     except Exception as e:
         print(f"Error processing bibliographic resource: {type(e).__name__}: {e}")
@@ -602,10 +588,11 @@ def generate_csv(
     output_dir: str,
     dir_split_number: int,
     items_per_file: int,
-    redis_host: str = "localhost",
+    redis_host: Optional[str] = None,
     redis_port: int = 6379,
     redis_db: int = 2,
     workers: int = 4,
+    cache_mb: int = 512,
 ) -> None:
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
@@ -613,8 +600,11 @@ def generate_csv(
     checkpoint_file = os.path.join(output_dir, "processed_br_files.txt")
     processed_br_files = load_checkpoint(checkpoint_file)
 
-    redis_client = init_redis_connection(redis_host, redis_port, redis_db)
-    load_processed_omids_to_redis(output_dir, redis_client)
+    # Workers check a local memory-mapped set; Redis only mirrors it if given
+    redis_client = None
+    if redis_host is not None:
+        redis_client = init_redis_connection(redis_host, redis_port, redis_db)
+    processed_omids = load_processed_omids(output_dir, redis_client)
 
     br_dir = os.path.join(input_dir, "br")
     if not os.path.exists(br_dir):
@@ -640,7 +630,13 @@ def generate_csv(
     with ctx.Pool(
         workers,
         _init_worker,
-        (redis_host, redis_port, redis_db, input_dir, dir_split_number, items_per_file),
+        (
+            processed_omids,
+            input_dir,
+            dir_split_number,
+            items_per_file,
+            cache_mb,
+        ),
     ) as pool:
         with create_progress() as progress:
             task = progress.add_task("Processing files", total=len(files_to_process))
@@ -682,7 +678,9 @@ if __name__ == "__main__":
         help="Directory where CSV files will be stored",
     )
     parser.add_argument(
-        "--redis-host", default="localhost", help="Redis host (default: localhost)"
+        "--redis-host",
+        default=None,
+        help="Redis host where processed OMIDs are also stored (default: none)",
     )
     parser.add_argument(
         "--redis-port", type=int, default=6379, help="Redis port (default: 6379)"
@@ -693,10 +691,18 @@ if __name__ == "__main__":
     parser.add_argument(
         "--workers", type=int, default=4, help="Number of parallel workers (default: 4)"
     )
+    parser.add_argument(
+        "--cache-mb",
+        type=int,
+        default=512,
+        help="Uncompressed JSON budget per worker for indexed RDF files, in MB. "
+        "Parsed entities take about 4x as much memory, so the default of 512 is "
+        "about 2 GB per worker (about 8 GB with the default 4 workers)",
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
-        help="Clear checkpoint file and Redis cache before starting",
+        help="Clear checkpoint file and processed OMID cache before starting",
     )
     args = parser.parse_args()
 
@@ -712,12 +718,13 @@ if __name__ == "__main__":
         if os.path.exists(checkpoint_file):
             os.remove(checkpoint_file)
             print(f"Removed checkpoint file: {checkpoint_file}")
-        redis_client = redis.Redis(
-            host=args.redis_host, port=args.redis_port, db=args.redis_db
-        )
-        deleted = redis_client.delete("processed_omids")
-        if deleted:
-            print("Cleared Redis processed_omids cache")
+        if args.redis_host is not None:
+            redis_client = redis.Redis(
+                host=args.redis_host, port=args.redis_port, db=args.redis_db
+            )
+            deleted = redis_client.delete("processed_omids")
+            if deleted:
+                print("Cleared Redis processed_omids cache")
 
     generate_csv(
         input_dir=rdf_dir,
@@ -728,4 +735,5 @@ if __name__ == "__main__":
         redis_port=args.redis_port,
         redis_db=args.redis_db,
         workers=args.workers,
+        cache_mb=args.cache_mb,
     )
@@ -0,0 +1,658 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+"""Columnar CSV export of the RDF dump.
+
+``generate_csv`` resolves every bibliographic resource by reading the files of
+its identifiers, agent roles, agents, venues and pages one entity at a time.
+This engine instead reads each entity tree once, sequentially and in parallel,
+into compact Parquet tables, and builds the same rows with hash joins and a
+join-based walk of the hasNext chains.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import orjson
+import polars as pl
+import yaml
+from rich_argparse import RichHelpFormatter
+
+from oc_meta.lib.console import console, create_progress
+from oc_meta.lib.file_manager import collect_zip_files
+from oc_meta.run.meta.generate_csv import (
+    FIELDNAMES,
+    URI_TYPE_DICT,
+    load_json_from_file,
+    process_identifier,
+    write_csv,
+)
+
+TITLE = "http://purl.org/dc/terms/title"
+PUB_DATE = "http://prismstandard.org/namespaces/basic/2.0/publicationDate"
+SEQUENCE_ID = "http://purl.org/spar/fabio/hasSequenceIdentifier"
+PART_OF = "http://purl.org/vocab/frbr/core#partOf"
+EMBODIMENT = "http://purl.org/vocab/frbr/core#embodiment"
+HAS_IDENTIFIER = "http://purl.org/spar/datacite/hasIdentifier"
+DOC_CONTEXT_FOR = "http://purl.org/spar/pro/isDocumentContextFor"
+WITH_ROLE = "http://purl.org/spar/pro/withRole"
+IS_HELD_BY = "http://purl.org/spar/pro/isHeldBy"
+HAS_NEXT = "https://w3id.org/oc/ontology/hasNext"
+FAMILY_NAME = "http://xmlns.com/foaf/0.1/familyName"
+GIVEN_NAME = "http://xmlns.com/foaf/0.1/givenName"
+FOAF_NAME = "http://xmlns.com/foaf/0.1/name"
+STARTING_PAGE = "http://prismstandard.org/namespaces/basic/2.0/startingPage"
+ENDING_PAGE = "http://prismstandard.org/namespaces/basic/2.0/endingPage"
+EXPRESSION = "http://purl.org/spar/fabio/Expression"
+JOURNAL_ISSUE = "http://purl.org/spar/fabio/JournalIssue"
+JOURNAL_VOLUME = "http://purl.org/spar/fabio/JournalVolume"
+
+ROLES = ("author", "editor", "publisher")
+MAX_VENUE_DEPTH = 5
+FILES_PER_CHUNK = 100
+FILES_PER_PARTITION = 1000
+
+SCHEMAS: Dict[str, Dict[str, pl.DataType]] = {
+    "br": {
+        "uri": pl.String(),
+        "file": pl.Int64(),
+        "row": pl.Int64(),
+        "types": pl.List(pl.String()),
+        "title": pl.String(),
+        "pub_date": pl.String(),
+        "seq": pl.String(),
+        "part_of": pl.String(),
+        "embodiment": pl.String(),
+        "ids": pl.List(pl.String()),
+        "ars": pl.List(pl.String()),
+    },
+    "ar": {
+        "uri": pl.String(),
+        "role": pl.String(),
+        "ra": pl.String(),
+        "next": pl.String(),
+    },
+    "ra": {
+        "uri": pl.String(),
+        "family": pl.String(),
+        "given": pl.String(),
+        "name": pl.String(),
+        "ids": pl.List(pl.String()),
+    },
+    "id": {"uri": pl.String(), "value": pl.String()},
+    "re": {"uri": pl.String(), "start": pl.String(), "end": pl.String()},
+}
+
+
+def _value(entity: dict, predicate: str) -> str:
+    return entity.get(predicate, [{}])[0].get("@value", "")
+
+
+def _first_id(entity: dict, predicate: str) -> Optional[str]:
+    values = entity.get(predicate)
+    return values[0]["@id"] if values else None
+
+
+def _all_ids(entity: dict, predicate: str) -> List[str]:
+    return [item["@id"] for item in entity.get(predicate, [])]
+
+
+def _extract_row(kind: str, entity: dict) -> tuple:
+    if kind == "br":
+        return (
+            entity.get("@type", []),
+            _value(entity, TITLE),
+            _value(entity, PUB_DATE),
+            _value(entity, SEQUENCE_ID),
+            _first_id(entity, PART_OF),
+            _first_id(entity, EMBODIMENT),
+            _all_ids(entity, HAS_IDENTIFIER),
+            _all_ids(entity, DOC_CONTEXT_FOR),
+        )
+    if kind == "ar":
+        return (
+            _first_id(entity, WITH_ROLE) or "",
+            _first_id(entity, IS_HELD_BY),
+            _first_id(entity, HAS_NEXT),
+        )
+    if kind == "ra":
+        return (
+            _value(entity, FAMILY_NAME),
+            _value(entity, GIVEN_NAME),
+            _value(entity, FOAF_NAME),
+            _all_ids(entity, HAS_IDENTIFIER),
+        )
+    if kind == "id":
+        return (process_identifier(entity),)
+    return (_value(entity, STARTING_PAGE), _value(entity, ENDING_PAGE))
+
+
+def _chunk_inputs(files: List[str]) -> List[list]:
+    """Identify the input files of a chunk by path, size and modification time."""
+    inputs = []
+    for filepath in files:
+        stat = os.stat(filepath)
+        inputs.append([filepath, stat.st_size, stat.st_mtime_ns])
+    return inputs
+
+
+def _extract_chunk(
+    kind: str, files: List[str], first_file: int, out_path: str, inputs: List[list]
+) -> str:
+    rows: List[tuple] = []
+    for offset, filepath in enumerate(files):
+        row = 0
+        for graph in load_json_from_file(filepath):
+            for entity in graph.get("@graph", []):
+                values = _extract_row(kind, entity)
+                if kind == "br":
+                    rows.append((entity["@id"], first_file + offset, row) + values)
+                    row += 1
+                else:
+                    rows.append((entity["@id"],) + values)
+    table = pl.DataFrame(rows, schema=SCHEMAS[kind], orient="row")
+    tmp_path = f"{out_path}.tmp"
+    table.write_parquet(tmp_path)
+    os.replace(tmp_path, out_path)
+    # The manifest is written last: a chunk without one is extracted again
+    with open(f"{out_path}.json", "wb") as f:
+        f.write(orjson.dumps({"first_file": first_file, "inputs": inputs}))
+    return out_path
+
+
+def _chunk_is_current(out_path: str, first_file: int, inputs: List[list]) -> bool:
+    if not os.path.exists(out_path) or not os.path.exists(f"{out_path}.json"):
+        return False
+    with open(f"{out_path}.json", "rb") as f:
+        manifest = orjson.loads(f.read())
+    return manifest == {"first_file": first_file, "inputs": inputs}
+
+
+def extract_tables(rdf_dir: str, tables_dir: str, workers: int = 4) -> int:
+    """
+    Read every entity tree of ``rdf_dir`` into Parquet tables under ``tables_dir``.
+
+    Each tree is split into chunks of ``FILES_PER_CHUNK`` files, read in
+    parallel, one Parquet file per chunk. Next to each chunk a manifest records
+    the path, size and modification time of its input files: chunks whose
+    inputs are unchanged, e.g. after an interrupted run, are kept, the others
+    are extracted again and chunks left over from a larger dump are removed.
+    Returns the number of ``br`` files.
+    """
+    tasks = []
+    br_files = 0
+    for kind in SCHEMAS:
+        files = collect_zip_files(os.path.join(rdf_dir, kind), only_data=True)
+        if kind == "br":
+            br_files = len(files)
+        kind_dir = os.path.join(tables_dir, kind)
+        os.makedirs(kind_dir, exist_ok=True)
+        chunk_names = set()
+        for start in range(0, len(files), FILES_PER_CHUNK):
+            chunk_files = files[start : start + FILES_PER_CHUNK]
+            name = f"{start // FILES_PER_CHUNK:06d}.parquet"
+            chunk_names.add(name)
+            out_path = os.path.join(kind_dir, name)
+            inputs = _chunk_inputs(chunk_files)
+            if not _chunk_is_current(out_path, start, inputs):
+                tasks.append((kind, chunk_files, start, out_path, inputs))
+        for name in os.listdir(kind_dir):
+            if name.endswith(".parquet") and name not in chunk_names:
+                os.remove(os.path.join(kind_dir, name))
+                if os.path.exists(os.path.join(kind_dir, f"{name}.json")):
+                    os.remove(os.path.join(kind_dir, f"{name}.json"))
+    if not tasks:
+        return br_files
+    # Use forkserver to avoid deadlocks when forking in a multi-threaded environment
+    ctx = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        futures = [executor.submit(_extract_chunk, *task) for task in tasks]
+        with create_progress() as progress:
+            task_id = progress.add_task("Extracting tables", total=len(futures))
+            for future in as_completed(futures):
+                future.result()
+                progress.update(task_id, advance=1)
+    return br_files
+
+
+def load_tables(tables_dir: str) -> Dict[str, pl.LazyFrame]:
+    """Scan the Parquet tables lazily; nothing is read until a partition needs it."""
+    tables = {}
+    for kind, schema in SCHEMAS.items():
+        kind_dir = os.path.join(tables_dir, kind)
+        if os.path.isdir(kind_dir) and any(
+            name.endswith(".parquet") for name in os.listdir(kind_dir)
+        ):
+            tables[kind] = pl.scan_parquet(os.path.join(kind_dir, "*.parquet"))
+        else:
+            tables[kind] = pl.LazyFrame(schema=schema)
+    return tables
+
+
+def _matching(table: pl.LazyFrame, uris: pl.Series) -> pl.DataFrame:
+    """Stream ``table`` keeping only the rows whose ``uri`` is in ``uris``."""
+    keys = pl.LazyFrame({"uri": uris.drop_nulls().unique()})
+    return table.join(keys, on="uri", how="semi").collect(engine="streaming")
+
+
+def _omid(prefix: str) -> pl.Expr:
+    return pl.lit(f"omid:{prefix}/") + pl.col("uri").str.split("/").list.last()
+
+
+def _resolved_ids(entities: pl.DataFrame, id_values: pl.DataFrame) -> pl.DataFrame:
+    """Map each entity to the ``scheme:value`` strings of its identifiers, in order."""
+    return (
+        entities.select("uri", pl.col("ids").alias("id"))
+        .explode("id", keep_nulls=False)
+        .with_row_index("pos")
+        .join(id_values, left_on="id", right_on="uri", how="inner")
+        .sort("pos")
+        .group_by("uri", maintain_order=True)
+        .agg(pl.col("value").str.join(" ").alias("resolved"))
+    )
+
+
+def _labelled(
+    entities: pl.DataFrame, id_values: pl.DataFrame, prefix: str, label: pl.Expr
+) -> pl.DataFrame:
+    """Return ``uri``, ``label [omid ids]`` for the entities whose label is not null."""
+    resolved = _resolved_ids(entities, id_values)
+    return (
+        entities.join(resolved, on="uri", how="left")
+        .with_columns(label.alias("label"))
+        .filter(pl.col("label").is_not_null())
+        .select(
+            "uri",
+            pl.format(
+                "{} [{}]",
+                "label",
+                pl.concat_str(
+                    [_omid(prefix), pl.col("resolved")],
+                    separator=" ",
+                    ignore_nulls=True,
+                ),
+            ).alias("label"),
+        )
+    )
+
+
+def _agent_labels(ra: pl.DataFrame, id_values: pl.DataFrame) -> pl.DataFrame:
+    family, given, name = pl.col("family"), pl.col("given"), pl.col("name")
+    label = (
+        pl.when((family != "") & (given != ""))
+        .then(pl.format("{}, {}", family, given))
+        .when(family != "")
+        .then(family + ",")
+        .when(given != "")
+        .then(pl.lit(", ") + given)
+        .when(name != "")
+        .then(name)
+    )
+    return _labelled(ra, id_values, "ra", label)
+
+
+def _agent_columns(
+    br: pl.DataFrame, ar: pl.DataFrame, agent_labels: pl.DataFrame
+) -> pl.DataFrame:
+    """
+    Return ``uri`` and the author, editor and publisher cells of each resource.
+
+    Each role starts from its first agent role nobody of the same role points
+    to and follows hasNext across all the agent roles of the resource, stopping
+    at a repeated one or after as many steps as there are agent roles.
+    """
+    roles = (
+        br.select(pl.col("uri").alias("br"), pl.col("ars").alias("ar"))
+        .explode("ar", keep_nulls=False)
+        .with_row_index("pos")
+        .join(ar.rename({"uri": "ar"}), on="ar", how="inner")
+        .unique(["br", "ar"], keep="first", maintain_order=True)
+    )
+    members = roles.select("br", "ar", "next").join(
+        roles.select("br", pl.col("ar").alias("next")), on=["br", "next"], how="semi"
+    )
+    limits = roles.group_by("br").agg(pl.len().alias("limit"))
+
+    starts = []
+    for role in ROLES:
+        role_ars = roles.filter(pl.col("role").str.contains(role, literal=True))
+        referenced = role_ars.select("br", "next").join(
+            role_ars.select("br", pl.col("ar").alias("next")),
+            on=["br", "next"],
+            how="semi",
+        )
+        unreferenced = role_ars.join(
+            referenced.rename({"next": "ar"}), on=["br", "ar"], how="anti"
+        )
+        first = (
+            pl.concat(
+                [
+                    unreferenced.select("br", "ar", "pos", pl.lit(0).alias("fallback")),
+                    role_ars.select("br", "ar", "pos", pl.lit(1).alias("fallback")),
+                ]
+            )
+            .sort("br", "fallback", "pos")
+            .unique("br", keep="first", maintain_order=True)
+        )
+        starts.append(first.select("br", pl.lit(role).alias("chain"), "ar"))
+
+    state = pl.concat(starts).with_columns(pl.lit(0, pl.Int64).alias("step"))
+    visited = state.select("br", "chain", "ar")
+    steps = []
+    while state.height:
+        steps.append(state)
+        state = (
+            state.join(members, on=["br", "ar"], how="inner")
+            .select("br", "chain", pl.col("next").alias("ar"), pl.col("step") + 1)
+            .join(limits, on="br", how="inner")
+            .filter(pl.col("step") < pl.col("limit"))
+            .drop("limit")
+            .join(visited, on=["br", "chain", "ar"], how="anti")
+        )
+        # Only chains still being walked can meet their own agent roles again
+        visited = pl.concat(
+            [
+                visited.join(
+                    state.select("br", "chain"), on=["br", "chain"], how="semi"
+                ),
+                state.select("br", "chain", "ar"),
+            ]
+        )
+
+    walked = pl.concat(steps) if steps else state
+    cells = (
+        walked.join(
+            roles.select("br", "ar", "role", "ra"), on=["br", "ar"], how="inner"
+        )
+        .filter(pl.col("role").str.contains(pl.col("chain"), literal=True))
+        .join(agent_labels, left_on="ra", right_on="uri", how="inner")
+        .sort("br", "chain", "step")
+        .group_by("br", "chain", maintain_order=True)
+        .agg(pl.col("label").str.join("; "))
+        .pivot(on="chain", index="br", values="label")
+    )
+    for role in ROLES:
+        if role not in cells.columns:
+            cells = cells.with_columns(pl.lit(None, pl.String).alias(role))
+    return cells.select(pl.col("br").alias("uri"), *ROLES)
+
+
+def _venue_columns(
+    br: pl.DataFrame, venue_nodes: pl.DataFrame, venue_labels: pl.DataFrame
+) -> pl.DataFrame:
+    """Return ``uri`` and the volume, issue and venue cells, following partOf upwards."""
+    nodes = venue_nodes.select(
+        pl.col("uri").alias("node"),
+        pl.col("types").list.contains(JOURNAL_ISSUE).alias("is_issue"),
+        pl.col("types").list.contains(JOURNAL_VOLUME).alias("is_volume"),
+        "seq",
+        pl.col("part_of").alias("parent"),
+    ).join(venue_labels.rename({"uri": "node"}), on="node", how="left")
+    state = br.filter(pl.col("part_of").is_not_null()).select(
+        "uri", pl.col("part_of").alias("node"), pl.lit(0, pl.Int64).alias("depth")
+    )
+    visited = state.select("uri", "node")
+    levels = []
+    while state.height:
+        level = state.join(nodes, on="node", how="inner")
+        levels.append(
+            level.select(
+                "uri",
+                "depth",
+                pl.when(pl.col("is_issue"))
+                .then("seq")
+                .otherwise(pl.lit(""))
+                .alias("issue"),
+                pl.when(~pl.col("is_issue") & pl.col("is_volume"))
+                .then("seq")
+                .otherwise(pl.lit(""))
+                .alias("volume"),
+                pl.when(~pl.col("is_issue") & ~pl.col("is_volume"))
+                .then(pl.col("label").fill_null(""))
+                .otherwise(pl.lit(""))
+                .alias("venue"),
+            )
+        )
+        state = (
+            level.filter(
+                (pl.col("is_issue") | pl.col("is_volume"))
+                & pl.col("parent").is_not_null()
+                & (pl.col("depth") < MAX_VENUE_DEPTH)
+            )
+            .select("uri", pl.col("parent").alias("node"), pl.col("depth") + 1)
+            .join(visited, on=["uri", "node"], how="anti")
+        )
+        visited = pl.concat([visited, state.select("uri", "node")])
+    if not levels:
+        return pl.DataFrame(
+            schema={key: pl.String() for key in ("uri", "volume", "issue", "venue")}
+        )
+    return (
+        pl.concat(levels)
+        .sort("uri", "depth")
+        .group_by("uri", maintain_order=True)
+        .agg(
+            pl.col(key).filter(pl.col(key) != "").first()
+            for key in ("volume", "issue", "venue")
+        )
+    )
+
+
+def _venue_nodes(br: pl.LazyFrame, resources: pl.DataFrame) -> pl.DataFrame:
+    """Fetch the resources reachable from ``resources`` through partOf."""
+    nodes = [resources]
+    known = resources["uri"]
+    parents = resources["part_of"]
+    for _ in range(MAX_VENUE_DEPTH + 1):
+        parents = parents.drop_nulls().unique()
+        parents = parents.filter(~parents.is_in(known.implode()))
+        if parents.is_empty():
+            break
+        fetched = _matching(br, parents)
+        nodes.append(fetched)
+        known = pl.concat([known, fetched["uri"]])
+        parents = fetched["part_of"]
+    return pl.concat(nodes).unique("uri", keep="first", maintain_order=True)
+
+
+def build_rows(
+    tables: Dict[str, pl.LazyFrame],
+    first_file: int = 0,
+    end_file: Optional[int] = None,
+) -> pl.DataFrame:
+    """
+    Return the CSV rows of the bibliographic resources of the ``br`` files
+    numbered from ``first_file`` to ``end_file`` (excluded), in dump order.
+
+    Only the agent roles, agents, identifiers, pages and venues those resources
+    point to are read from the other tables.
+    """
+    br_files = pl.col("file") >= first_file
+    if end_file is not None:
+        br_files &= pl.col("file") < end_file
+    br = (
+        tables["br"]
+        .filter(br_files)
+        .collect(engine="streaming")
+        .unique("uri", keep="last", maintain_order=True)
+    )
+    nodes = _venue_nodes(tables["br"], br)
+    ar = _matching(tables["ar"], br["ars"].explode())
+    ra = _matching(tables["ra"], ar["ra"])
+    re = _matching(tables["re"], br["embodiment"])
+    id_values = (
+        _matching(
+            tables["id"], pl.concat([nodes["ids"].explode(), ra["ids"].explode()])
+        )
+        .filter(pl.col("value").is_not_null())
+        .unique("uri", keep="last")
+    )
+
+    venue_title = pl.when(pl.col("title") != "").then(pl.col("title"))
+    venues = _venue_columns(br, nodes, _labelled(nodes, id_values, "br", venue_title))
+    agents = _agent_columns(br, ar, _agent_labels(ra, id_values))
+    pages = re.unique("uri", keep="last").select(
+        pl.col("uri").alias("embodiment"),
+        pl.when((pl.col("start") != "") | (pl.col("end") != ""))
+        .then(pl.format("{}-{}", "start", "end"))
+        .alias("page"),
+    )
+
+    resources = br.filter(
+        ~pl.col("types").list.contains(JOURNAL_ISSUE)
+        & ~pl.col("types").list.contains(JOURNAL_VOLUME)
+    )
+    rows = (
+        resources.join(_resolved_ids(resources, id_values), on="uri", how="left")
+        .join(agents, on="uri", how="left")
+        .join(venues, on="uri", how="left")
+        .join(pages, on="embodiment", how="left")
+        .sort("file", "row")
+        .with_columns(
+            pl.concat_str(
+                [_omid("br"), pl.col("resolved")], separator=" ", ignore_nulls=True
+            ).alias("id"),
+            pl.col("types")
+            .list.eval(pl.element().filter(pl.element() != EXPRESSION))
+            .list.first()
+            .replace_strict(URI_TYPE_DICT, default="", return_dtype=pl.String)
+            .alias("type"),
+        )
+    )
+    return rows.select(pl.col(field).fill_null("") for field in FIELDNAMES)
+
+
+def _processed_omids(output_dir: str) -> pl.DataFrame:
+    csv_files = [
+        os.path.join(output_dir, name)
+        for name in os.listdir(output_dir)
+        if name.startswith("output_") and name.endswith(".csv")
+    ]
+    if not csv_files:
+        return pl.DataFrame(schema={"omid": pl.String()})
+    return (
+        pl.concat(
+            pl.read_csv(path, columns=["id"], infer_schema=False) for path in csv_files
+        )
+        .select(pl.col("id").str.split(" ").alias("omid"))
+        .explode("omid")
+        .filter(pl.col("omid").str.starts_with("omid:br/"))
+        .unique()
+    )
+
+
+def _last_file_number(output_dir: str) -> int:
+    numbers = [-1]
+    for name in os.listdir(output_dir):
+        if name.startswith("output_") and name.endswith(".csv"):
+            try:
+                numbers.append(int(name[7:-4]))
+            except ValueError:
+                continue
+    return max(numbers)
+
+
+def generate_csv_columnar(
+    input_dir: str,
+    output_dir: str,
+    tables_dir: Optional[str] = None,
+    workers: int = 4,
+    max_rows: int = 3000,
+    partition_files: int = FILES_PER_PARTITION,
+) -> int:
+    """
+    Write the CSV dump of the RDF in ``input_dir``, skipping resources already
+    in the ``output_*.csv`` files of ``output_dir``. Rows are built for
+    ``partition_files`` ``br`` files at a time and written as each partition
+    is done. Returns the rows written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tables_dir = tables_dir or os.path.join(output_dir, "tables")
+    br_files = extract_tables(input_dir, tables_dir, workers)
+    tables = load_tables(tables_dir)
+    done = _processed_omids(output_dir)["omid"].implode()
+    file_number = _last_file_number(output_dir) + 1
+    written = 0
+    pending = pl.DataFrame(schema={field: pl.String() for field in FIELDNAMES})
+
+    with create_progress() as progress:
+        task_id = progress.add_task("Building rows", total=br_files)
+        for first_file in range(0, br_files, partition_files):
+            rows = build_rows(tables, first_file, first_file + partition_files)
+            rows = rows.filter(~pl.col("id").str.split(" ").list.first().is_in(done))
+            pending = pl.concat([pending, rows])
+            while pending.height >= max_rows:
+                _write_rows(output_dir, file_number, pending.head(max_rows))
+                pending = pending.slice(max_rows)
+                file_number += 1
+            written += rows.height
+            progress.update(
+                task_id, advance=min(partition_files, br_files - first_file)
+            )
+    if pending.height:
+        _write_rows(output_dir, file_number, pending)
+    return written
+
+
+def _write_rows(output_dir: str, file_number: int, rows: pl.DataFrame) -> None:
+    write_csv(
+        os.path.join(output_dir, f"output_{file_number}.csv"),
+        list(rows.iter_rows(named=True)),
+    )
+
+
+def main() -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        description="Generate CSV files from the OpenCitations Meta RDF dump with columnar joins",
+        formatter_class=RichHelpFormatter,
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        required=True,
+        help="OpenCitations Meta configuration file location",
+    )
+    parser.add_argument(
+        "-o",
+        "--output_dir",
+        required=True,
+        help="Directory where CSV files will be stored",
+    )
+    parser.add_argument(
+        "--tables-dir",
+        default=None,
+        help="Directory of the intermediate Parquet tables (default: <output_dir>/tables)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of parallel workers (default: 4)"
+    )
+    parser.add_argument(
+        "--partition-files",
+        type=int,
+        default=FILES_PER_PARTITION,
+        help=f"Number of br files whose rows are built at once (default: {FILES_PER_PARTITION})",
+    )
+    args = parser.parse_args()
+
+    with open(args.config, encoding="utf-8") as f:
+        settings = yaml.full_load(f)
+
+    rdf_dir = os.path.join(settings["output_rdf_dir"], "rdf")
+    written = generate_csv_columnar(
+        rdf_dir,
+        args.output_dir,
+        args.tables_dir,
+        args.workers,
+        partition_files=args.partition_files,
+    )
+    console.print(f"Wrote {written} rows")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -12,16 +12,20 @@ import csv
 import multiprocessing
 import os
 import sys
+import time
 import traceback
 from argparse import ArgumentParser
 from datetime import datetime
+from functools import partial
 from sys import executable, platform
 from typing import Any, Dict, List, Optional, Tuple
 
 import orjson
 import yaml
 from oc_ocdm import Storer
+from oc_ocdm.counter_handler.counter_handler import CounterHandler
 from oc_ocdm.counter_handler.filesystem_counter_handler import FilesystemCounterHandler
+from oc_ocdm.graph import GraphSet
 from oc_ocdm.prov import ProvSet
 from oc_ocdm.support.reporter import Reporter
 from piccione.upload.on_triplestore import upload_sparql_updates
@@ -30,16 +34,25 @@ from time_agnostic_library.support import generate_config_file
 
 from oc_meta.core.creator import Creator
 from oc_meta.core.curator import Curator
+from oc_meta.core.parallel_creator import create_in_parallel
+from oc_meta.lib.bulk_nquads import BulkFileStaging, write_bulk_files
 from oc_meta.lib.console import console, create_progress
+from oc_meta.lib.cow_graph import MutatedEntitiesProvSet
 from oc_meta.lib.file_manager import (
     get_csv_data,
     init_cache,
+    iter_csv_data,
     normalize_path,
     pathoo,
     sort_files,
 )
+from oc_meta.lib.rdf_file_cache import CachedStorer, RdfFileCache
+from oc_meta.lib.sparql_coalescer import upload_coalesced
+from oc_meta.lib.storage_queue import StorageQueue
+from oc_meta.lib.subject_cache import SubjectCache
 from oc_meta.lib.timer import ProcessTimer
 from oc_meta.run.benchmark.plotting import plot_incremental_progress
+from oc_meta.run.migration.stream_nquads import DEFAULT_LINES_PER_FILE
 
 
 def _upload_to_triplestore(
@@ -87,8 +100,17 @@ def _upload_to_triplestore(
 
 
 def _generate_queries_worker(
-    storer: Storer, triplestore_url: str, base_dir: str
+    storer: Storer,
+    triplestore_url: str,
+    base_dir: str,
+    max_triples: int = 0,
+    stats_queue=None,
 ) -> None:
+    if max_triples:
+        stats = upload_coalesced(storer, triplestore_url, base_dir, max_triples)
+        if stats_queue is not None:
+            stats_queue.put(stats)
+        return
     storer.upload_all(
         triplestore_url=triplestore_url,
         base_dir=base_dir,
@@ -139,6 +161,12 @@ class MetaProcess:
         )
         self.silencer = settings["silencer"]
         self.rdf_files_only = settings.get("rdf_files_only", False)
+        self.workers = settings.get("workers", 1)
+        self.parallel_rdf_creation = settings.get("parallel_rdf_creation", False)
+        # Partitioned curation and parallel RDF creation fork this process
+        self.forks_workers = self.workers > 1 and (
+            settings.get("parallel_curation", False) or self.parallel_rdf_creation
+        )
         # Time-Agnostic_library integration
         self.time_agnostic_library_config = os.path.join(
             os.path.dirname(meta_config_path), "time_agnostic_library_config.json"
@@ -174,10 +202,61 @@ class MetaProcess:
         # Triplestore upload settings
         self.ts_failed_queries = settings.get("ts_failed_queries", "failed_queries.txt")
         self.ts_stop_file = settings.get("ts_stop_file", ".stop_upload")
+        # Triples per coalesced SPARQL update, 0 to upload entity by entity
+        self.sparql_coalesce_max_triples = settings.get(
+            "sparql_coalesce_max_triples", 0
+        )
+
+        # 'sparql' uploads every batch, 'bulk_files' writes it for a bulk loader
+        self.upload_mode = settings.get("upload_mode", "sparql")
+        if self.upload_mode not in ("sparql", "bulk_files"):
+            raise ValueError(
+                f"upload_mode must be 'sparql' or 'bulk_files', not {self.upload_mode!r}"
+            )
+        self.bulk_lines_per_file = settings.get(
+            "bulk_lines_per_file", DEFAULT_LINES_PER_FILE
+        )
+        self.bulk_staging = (
+            BulkFileStaging(
+                normalize_path(
+                    settings.get("bulk_files_dir")
+                    or os.path.join(self.base_output_dir, "bulk_nquads")
+                )
+            )
+            if self.upload_mode == "bulk_files"
+            else None
+        )
 
         self.data_update_dir = os.path.join(self.base_output_dir, "to_be_uploaded_data")
         self.prov_update_dir = os.path.join(self.base_output_dir, "to_be_uploaded_prov")
 
+        # Windowed curation relies on the triplestore to deduplicate across
+        # windows, which does not happen when only RDF files are produced
+        if settings.get("curation_window_size") and self.rdf_files_only:
+            raise ValueError("curation_window_size requires rdf_files_only to be False")
+        if settings.get("curation_window_size") and self.bulk_staging is not None:
+            raise ValueError("curation_window_size requires upload_mode to be 'sparql'")
+
+        # Batches waiting to be stored and uploaded in the background
+        self.storage = StorageQueue(
+            settings.get("storage_queue_size", 0),
+            settings.get("storage_queue_max_rss_mb"),
+        )
+
+        # Parsed RDF files kept across batches and written back per input file
+        rdf_file_cache_size = settings.get("rdf_file_cache_size", 0)
+        self.rdf_file_cache = (
+            RdfFileCache(rdf_file_cache_size) if rdf_file_cache_size else None
+        )
+
+        # Persistent subject → triples cache reused across input files
+        subject_cache_path = settings.get("subject_cache_path")
+        self.subject_cache = (
+            SubjectCache(normalize_path(subject_cache_path))
+            if subject_cache_path
+            else None
+        )
+
     def prepare_folders(self) -> List[str]:
         completed = init_cache(self.cache_path)
         files_in_input_csv_dir = {
@@ -200,135 +279,108 @@ class MetaProcess:
         settings: dict | None = None,
         meta_config_path: str | None = None,
         progress=None,
+        drain_storage: bool = True,
     ) -> Tuple[dict, str, str, str]:
+        """
+        Curate an input CSV and create, store and upload its RDF.
+
+        With a storage queue, batches are stored in the background. Unless
+        ``drain_storage`` is False, the method waits for them and reports
+        their errors; otherwise the caller must queue a barrier for
+        ``filename`` before marking the file as done.
+        """
         try:
             with self.timer.timer("total_processing"):
                 filepath = os.path.join(self.input_csv_dir, filename)
                 console.print(filepath)
-                data = get_csv_data(filepath)
-                self.timer.record_metric("input_records", len(data))
+                # Files left pending by an interrupted run are written again
+                if self.bulk_staging is not None:
+                    self.bulk_staging.discard(filename)
+                window_size = settings.get("curation_window_size") if settings else None
+                if window_size:
+                    windows = iter_csv_data(filepath, window_size)
+                else:
+                    windows = iter([get_csv_data(filepath)])
 
                 min_rows_parallel = (
                     settings.get("min_rows_parallel", 1000) if settings else 1000
                 )
-                curator_obj = Curator(
-                    data=data,
-                    ts=self.triplestore_url,
-                    prov_config=self.time_agnostic_library_config,
-                    counter_handler=self.counter_handler,
-                    base_iri=self.base_iri,
-                    prefix=self.supplier_prefix,
-                    settings=settings,
-                    silencer=self.silencer,
-                    meta_config_path=meta_config_path,
-                    timer=self.timer,
-                    progress=progress,
-                    min_rows_parallel=min_rows_parallel,
-                )
-                name = f"{filename.replace('.csv', '')}_{datetime.now().strftime('%Y-%m-%dT%H-%M-%S')}"
-                curator_obj.curator(filename=name, path_csv=self.output_csv_dir)
-                self.timer.record_metric("curated_records", len(curator_obj.data))
-
-                local_g_size = len(curator_obj.finder.graph)
-                self.timer.record_metric("local_g_triples", local_g_size)
-                preexisting_count = len(curator_obj.preexisting_entities)
-                self.timer.record_metric(
-                    "preexisting_entities_count", preexisting_count
-                )
-
-                RDF_BATCH_SIZE = 100_000
-                data = curator_obj.data
-                n_batches = (len(data) + RDF_BATCH_SIZE - 1) // RDF_BATCH_SIZE
+                input_records = 0
+                curated_records = 0
+                local_g_size = 0
+                subject_cache_hits = 0
+                preexisting_count = 0
                 total_entities = 0
                 total_modified = 0
 
-                batch_task_id = None
-                if progress is not None and n_batches > 1:
-                    batch_task_id = progress.add_task(
-                        f"  [cyan]RDF batches[/cyan] ({filename})",
-                        total=n_batches,
+                for window_idx, data in enumerate(windows):
+                    # Curation reads what the previous batches uploaded, and
+                    # forked workers must not copy a storage job in progress
+                    if not self.rdf_files_only or self.forks_workers:
+                        self.storage.wait()
+                    input_records += len(data)
+                    self.timer.record_metric("input_records", input_records)
+
+                    curator_obj = Curator(
+                        data=data,
+                        ts=self.triplestore_url,
+                        prov_config=self.time_agnostic_library_config,
+                        counter_handler=self.counter_handler,
+                        base_iri=self.base_iri,
+                        prefix=self.supplier_prefix,
+                        settings=settings,
+                        silencer=self.silencer,
+                        meta_config_path=meta_config_path,
+                        timer=self.timer,
+                        progress=progress,
+                        min_rows_parallel=min_rows_parallel,
+                        subject_cache=self.subject_cache,
                     )
-
-                for batch_idx in range(n_batches):
-                    batch_start = batch_idx * RDF_BATCH_SIZE
-                    batch_end = min(batch_start + RDF_BATCH_SIZE, len(data))
-                    batch_data = data[batch_start:batch_end]
-
-                    with self.timer.timer("rdf_creation"):
-                        creator_obj = Creator(
-                            data=batch_data,
-                            finder=curator_obj.finder,
-                            base_iri=self.base_iri,
-                            counter_handler=self.counter_handler,
-                            supplier_prefix=self.supplier_prefix,
-                            resp_agent=self.resp_agent,
-                            ra_index=curator_obj.index_id_ra,
-                            br_index=curator_obj.index_id_br,
-                            re_index_csv=curator_obj.re_index,
-                            ar_index_csv=curator_obj.ar_index,
-                            vi_index=curator_obj.VolIss,
-                            silencer=self.silencer,
-                            progress=progress,
-                        )
-                        creator = creator_obj.creator(source=self.source)
-                        total_entities += sum(
-                            1
-                            for e in creator.res_to_entity.values()
-                            if not e._preexisting_triples
+                    del data
+                    name = f"{filename.replace('.csv', '')}_{datetime.now().strftime('%Y-%m-%dT%H-%M-%S')}"
+                    if window_size:
+                        name = f"{name}_{window_idx}"
+                    curator_obj.curator(filename=name, path_csv=self.output_csv_dir)
+                    curated_records += len(curator_obj.data)
+                    self.timer.record_metric("curated_records", curated_records)
+
+                    local_g_size = max(local_g_size, len(curator_obj.finder.graph))
+                    self.timer.record_metric("local_g_triples", local_g_size)
+                    if self.subject_cache is not None:
+                        subject_cache_hits += curator_obj.finder.subject_cache_hits
+                        self.timer.record_metric(
+                            "subject_cache_hits", subject_cache_hits
                         )
-
-                        prov = ProvSet(
-                            creator,
-                            self.base_iri,
-                            wanted_label=False,
-                            supplier_prefix=self.supplier_prefix,
-                            custom_counter_handler=self.counter_handler,
-                        )
-                        modified_entities = prov.generate_provenance()
-                        total_modified += len(modified_entities)
-
-                    repok = Reporter(print_sentences=False)
-                    reperr = Reporter(print_sentences=True, prefix="[Storer: ERROR] ")
-                    res_storer = Storer(
-                        abstract_set=creator,
-                        repok=repok,
-                        reperr=reperr,
-                        dir_split=self.dir_split_number,
-                        n_file_item=self.items_per_file,
-                        default_dir=self.default_dir,
-                        output_format="json-ld",
-                        zip_output=self.zip_output_rdf,
-                        modified_entities=modified_entities,
-                    )
-                    prov_storer = Storer(
-                        abstract_set=prov,
-                        repok=repok,
-                        reperr=reperr,
-                        dir_split=self.dir_split_number,
-                        n_file_item=self.items_per_file,
-                        output_format="json-ld",
-                        zip_output=self.zip_output_rdf,
-                        modified_entities=modified_entities,
-                    )
-                    self.store_data_and_prov(res_storer, prov_storer)
-                    del (
-                        creator_obj,
-                        creator,
-                        prov,
-                        res_storer,
-                        prov_storer,
-                        modified_entities,
+                    preexisting_count += len(curator_obj.preexisting_entities)
+                    self.timer.record_metric(
+                        "preexisting_entities_count", preexisting_count
                     )
 
-                    if progress is not None and batch_task_id is not None:
-                        progress.update(batch_task_id, advance=1)
-
-                if progress is not None and batch_task_id is not None:
-                    progress.remove_task(batch_task_id)
+                    new_entities, modified_count = self._create_and_store(
+                        curator_obj, filename, progress
+                    )
+                    total_entities += new_entities
+                    total_modified += modified_count
+                    del curator_obj
 
                 self.timer.record_metric("new_entities", total_entities)
                 self.timer.record_metric("modified_entities", total_modified)
 
+                if self.rdf_file_cache is not None:
+                    self.storage.submit(
+                        filename, partial(self._flush_rdf_files, self.timer)
+                    )
+                if self.bulk_staging is not None and not self.rdf_files_only:
+                    self.storage.submit(
+                        filename, partial(self.bulk_staging.commit, filename)
+                    )
+
+                if drain_storage:
+                    self.storage.wait()
+                    error = self.storage.pop_error(filename)
+                    if error is not None:
+                        raise error
+
             return {"message": "success"}, cache_path, errors_path, filename
         except Exception as e:
             tb = traceback.format_exc()
@@ -338,6 +390,139 @@ class MetaProcess:
             message = template.format(type(e).__name__, e.args, tb)
             return {"message": message}, cache_path, errors_path, filename
 
+    def _create_and_store(
+        self, curator_obj: Curator, filename: str, progress=None
+    ) -> Tuple[int, int]:
+        """Create, store and upload the RDF of a curated window in batches."""
+        RDF_BATCH_SIZE = 100_000
+        data = curator_obj.data
+        n_batches = (len(data) + RDF_BATCH_SIZE - 1) // RDF_BATCH_SIZE
+        total_entities = 0
+        total_modified = 0
+
+        batch_task_id = None
+        if progress is not None and n_batches > 1:
+            batch_task_id = progress.add_task(
+                f"  [cyan]RDF batches[/cyan] ({filename})",
+                total=n_batches,
+            )
+
+        batches = [
+            data[batch_start : batch_start + RDF_BATCH_SIZE]
+            for batch_start in range(0, len(data), RDF_BATCH_SIZE)
+        ]
+        if (
+            self.parallel_rdf_creation
+            and self.workers > 1
+            and n_batches > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            created = create_in_parallel(
+                batches,
+                partial(self._create_rdf, curator_obj),
+                self._create_provenance,
+                self.counter_handler,
+                self.workers,
+            )
+        else:
+            created = (
+                self._create_rdf(curator_obj, batch, self.counter_handler, progress)
+                for batch in batches
+            )
+
+        while True:
+            with self.timer.timer("rdf_creation"):
+                batch_output = next(created, None)
+                if batch_output is None:
+                    break
+                creator, prov, modified_entities = batch_output
+                del batch_output
+                total_entities += sum(
+                    1
+                    for e in creator.res_to_entity.values()
+                    if not e._preexisting_triples
+                )
+                total_modified += len(modified_entities)
+                if self.subject_cache is not None:
+                    self.subject_cache.invalidate(modified_entities)
+
+            repok = Reporter(print_sentences=False)
+            reperr = Reporter(print_sentences=True, prefix="[Storer: ERROR] ")
+            res_storer = CachedStorer(
+                abstract_set=creator,
+                repok=repok,
+                reperr=reperr,
+                dir_split=self.dir_split_number,
+                n_file_item=self.items_per_file,
+                default_dir=self.default_dir,
+                output_format="json-ld",
+                zip_output=self.zip_output_rdf,
+                modified_entities=modified_entities,
+                file_cache=self.rdf_file_cache,
+            )
+            prov_storer = CachedStorer(
+                abstract_set=prov,
+                repok=repok,
+                reperr=reperr,
+                dir_split=self.dir_split_number,
+                n_file_item=self.items_per_file,
+                output_format="json-ld",
+                zip_output=self.zip_output_rdf,
+                modified_entities=modified_entities,
+                file_cache=self.rdf_file_cache,
+            )
+            self.store_data_and_prov(res_storer, prov_storer, filename)
+            del (
+                creator,
+                prov,
+                res_storer,
+                prov_storer,
+                modified_entities,
+            )
+
+            if progress is not None and batch_task_id is not None:
+                progress.update(batch_task_id, advance=1)
+
+        if progress is not None and batch_task_id is not None:
+            progress.remove_task(batch_task_id)
+
+        return total_entities, total_modified
+
+    def _create_rdf(
+        self,
+        curator_obj: Curator,
+        batch_data: list,
+        counter_handler: CounterHandler,
+        progress=None,
+    ) -> Tuple[GraphSet, ProvSet, set]:
+        """Create the RDF entities of a batch of curated rows and their provenance."""
+        creator_obj = Creator(
+            data=batch_data,
+            finder=curator_obj.finder,
+            base_iri=self.base_iri,
+            counter_handler=counter_handler,
+            supplier_prefix=self.supplier_prefix,
+            resp_agent=self.resp_agent,
+            silencer=self.silencer,
+            progress=progress,
+            index=curator_obj.index,
+        )
+        creator = creator_obj.creator(source=self.source)
+        prov, modified_entities = self._create_provenance(creator, counter_handler)
+        return creator, prov, modified_entities
+
+    def _create_provenance(
+        self, creator: GraphSet, counter_handler: CounterHandler
+    ) -> Tuple[ProvSet, set]:
+        prov = MutatedEntitiesProvSet(
+            creator,
+            self.base_iri,
+            wanted_label=False,
+            supplier_prefix=self.supplier_prefix,
+            custom_counter_handler=counter_handler,
+        )
+        return prov, prov.generate_provenance()
+
     def _setup_output_directories(self) -> None:
         """Create output directories for data and provenance."""
         os.makedirs(self.data_update_dir, exist_ok=True)
@@ -396,14 +581,46 @@ class MetaProcess:
                 f"Provenance upload failed with exit code {prov_process.exitcode}"
             )
 
-    def store_data_and_prov(self, res_storer: Storer, prov_storer: Storer) -> None:
-        """Orchestrate storage and upload."""
-        if not self.rdf_files_only:
+    def store_data_and_prov(
+        self, res_storer: Storer, prov_storer: Storer, filename: str = ""
+    ) -> None:
+        """Orchestrate storage and upload, in the background with a storage queue."""
+        if not self.rdf_files_only and self.bulk_staging is None:
             self._setup_output_directories()
-        self._store_and_upload(res_storer, prov_storer, self.timer)
+        if self.storage.max_queued:
+            job = partial(
+                self._store_in_background,
+                res_storer,
+                prov_storer,
+                self.timer,
+                filename,
+            )
+        else:
+            job = partial(
+                self._store_and_upload, res_storer, prov_storer, self.timer, filename
+            )
+        self.storage.submit(filename, job)
+
+    def _store_in_background(
+        self,
+        res_storer: Storer,
+        prov_storer: Storer,
+        timer: ProcessTimer,
+        filename: str = "",
+    ) -> None:
+        # Timed by hand: phase callbacks must only run in the main thread
+        start = time.time()
+        self._store_and_upload(
+            res_storer, prov_storer, ProcessTimer(enabled=False), filename
+        )
+        timer.record_phase("storage", time.time() - start)
 
     def _store_and_upload(
-        self, res_storer: Storer, prov_storer: Storer, timer: ProcessTimer
+        self,
+        res_storer: Storer,
+        prov_storer: Storer,
+        timer: ProcessTimer,
+        filename: str = "",
     ) -> None:
         """Store RDF files and upload queries to triplestore with parallel execution."""
         with timer.timer("storage"):
@@ -412,22 +629,46 @@ class MetaProcess:
             # copy locked mutexes into the child process, causing hangs.
             ctx = multiprocessing.get_context("forkserver")
 
-            data_store_process = ctx.Process(
-                target=_store_rdf_worker,
-                args=(res_storer, self.output_rdf_dir, self.base_iri),
-            )
-            prov_store_process = ctx.Process(
-                target=_store_rdf_worker,
-                args=(prov_storer, self.output_rdf_dir, self.base_iri),
-            )
-            rdf_store_processes = [data_store_process, prov_store_process]
-            for p in rdf_store_processes:
-                p.start()
+            rdf_store_processes = []
+            if self.rdf_file_cache is None:
+                data_store_process = ctx.Process(
+                    target=_store_rdf_worker,
+                    args=(res_storer, self.output_rdf_dir, self.base_iri),
+                )
+                prov_store_process = ctx.Process(
+                    target=_store_rdf_worker,
+                    args=(prov_storer, self.output_rdf_dir, self.base_iri),
+                )
+                rdf_store_processes = [data_store_process, prov_store_process]
+                for p in rdf_store_processes:
+                    p.start()
 
-            if not self.rdf_files_only:
+            stats_queue = None
+            if not self.rdf_files_only and self.bulk_staging is not None:
+                data_dir, prov_dir, prefix = self.bulk_staging.next_batch(filename)
+                data_query_process = ctx.Process(
+                    target=write_bulk_files,
+                    args=(res_storer, data_dir, prefix, self.bulk_lines_per_file),
+                )
+                prov_query_process = ctx.Process(
+                    target=write_bulk_files,
+                    args=(prov_storer, prov_dir, prefix, self.bulk_lines_per_file),
+                )
+                data_query_process.start()
+                prov_query_process.start()
+            elif not self.rdf_files_only:
+                stats_queue = (
+                    ctx.SimpleQueue() if self.sparql_coalesce_max_triples else None
+                )
                 data_query_process = ctx.Process(
                     target=_generate_queries_worker,
-                    args=(res_storer, self.triplestore_url, self.data_update_dir),
+                    args=(
+                        res_storer,
+                        self.triplestore_url,
+                        self.data_update_dir,
+                        self.sparql_coalesce_max_triples,
+                        stats_queue,
+                    ),
                 )
                 prov_query_process = ctx.Process(
                     target=_generate_queries_worker,
@@ -435,10 +676,19 @@ class MetaProcess:
                         prov_storer,
                         self.provenance_triplestore_url,
                         self.prov_update_dir,
+                        self.sparql_coalesce_max_triples,
+                        stats_queue,
                     ),
                 )
                 data_query_process.start()
                 prov_query_process.start()
+
+            if self.rdf_file_cache is not None:
+                # The cache lives in this process, so files are merged here
+                _store_rdf_worker(res_storer, self.output_rdf_dir, self.base_iri)
+                _store_rdf_worker(prov_storer, self.output_rdf_dir, self.base_iri)
+
+            if not self.rdf_files_only:
                 data_query_process.join()
                 prov_query_process.join()
 
@@ -450,8 +700,12 @@ class MetaProcess:
                     raise RuntimeError(
                         f"Prov query generation failed with exit code {prov_query_process.exitcode}"
                     )
+                if stats_queue is not None:
+                    for _ in range(2):
+                        self._record_upload_stats(stats_queue.get())
 
-                self._upload_sparql_queries()
+                if self.bulk_staging is None:
+                    self._upload_sparql_queries()
 
             for p in rdf_store_processes:
                 p.join()
@@ -460,6 +714,31 @@ class MetaProcess:
                         f"RDF storage failed with exit code {p.exitcode}"
                     )
 
+    def _record_upload_stats(self, stats: Dict[str, float]) -> None:
+        """Add the stats of a coalesced upload to the metrics of the current file."""
+        metrics = self.timer.metrics
+        for key in ("requests", "bytes", "seconds", "cancelled"):
+            name = f"sparql_update_{key}"
+            self.timer.record_metric(name, metrics.get(name, 0) + stats[key])
+        self.timer.record_metric(
+            "sparql_update_max_seconds",
+            max(metrics.get("sparql_update_max_seconds", 0), stats["max_seconds"]),
+        )
+
+    def _flush_rdf_files(self, timer: ProcessTimer) -> None:
+        """Write the cached RDF files back to disk and record the cache hit rate."""
+        assert self.rdf_file_cache is not None
+        start = time.time()
+        self.rdf_file_cache.flush()
+        timer.record_phase("storage", time.time() - start)
+        timer.record_metric("rdf_file_cache_hits", self.rdf_file_cache.hits)
+        timer.record_metric("rdf_file_cache_misses", self.rdf_file_cache.misses)
+        timer.record_metric(
+            "rdf_file_cache_hit_rate", round(self.rdf_file_cache.hit_rate, 4)
+        )
+        # The metrics belong to this input file: count the next one from zero
+        self.rdf_file_cache.reset_stats()
+
     def run_sparql_updates(self, endpoint: str, folder: str):
         _upload_to_triplestore(
             endpoint,
@@ -633,6 +912,7 @@ def run_meta_process(
                 )
                 meta_process_setup.timer = file_timer
 
+                # Reports need the storage phases, so timed runs wait for them
                 result = meta_process_setup.curate_and_create(
                     filename,
                     meta_process_setup.cache_path,
@@ -640,9 +920,13 @@ def run_meta_process(
                     settings=settings,
                     meta_config_path=meta_config_path,
                     progress=progress,
+                    drain_storage=enable_timing,
                 )
-                task_done(result)
                 meta_process_setup.counter_handler.flush()
+                # The file is marked as done only once all its batches are stored
+                meta_process_setup.storage.submit_barrier(
+                    filename, partial(_mark_stored, result)
+                )
 
                 if enable_timing:
                     report = file_timer.get_report()
@@ -657,6 +941,10 @@ def run_meta_process(
             finally:
                 progress.advance(task_id)
 
+    meta_process_setup.storage.wait()
+    # A file whose storage failed skips its flush, leaving its RDF cached
+    if meta_process_setup.rdf_file_cache is not None:
+        meta_process_setup.rdf_file_cache.flush()
     meta_process_setup.counter_handler.flush()
 
     if not os.path.exists(os.path.join(meta_process_setup.base_output_dir, ".stop")):
@@ -689,6 +977,13 @@ def _cache_sort_key(filename: str) -> int:
     return int(filename.replace(".csv", ""))
 
 
+def _mark_stored(task_output: tuple, error: BaseException | None) -> None:
+    if error is not None:
+        message = f"Storage failed with {type(error).__name__}: {error}"
+        task_output = ({"message": message}, *task_output[1:])
+    task_done(task_output)
+
+
 def task_done(task_output: tuple) -> None:
     message, cache_path, errors_path, filename = task_output
     if message["message"] == "skip":
@@ -755,9 +1050,17 @@ if __name__ == "__main__":  # pragma: no cover
         default=None,
         help="Optional path to save timing report as JSON file",
     )
+    arg_parser.add_argument(
+        "--traversal-profile",
+        dest="traversal_profile",
+        default=None,
+        help="Traversal profile used to prefetch triplestore data, overriding the configuration",
+    )
     args = arg_parser.parse_args()
     with open(args.config, encoding="utf-8") as file:
         settings = yaml.full_load(file)
+    if args.traversal_profile:
+        settings["traversal_profile"] = args.traversal_profile
     run_meta_process(
         settings=settings,
         meta_config_path=args.config,
@@ -15,8 +15,10 @@ import uuid
 from zipfile import ZIP_DEFLATED, ZipFile
 
 import orjson
-from rdflib import Dataset
+from rdflib import BNode, Dataset, Literal
 from rdflib.exceptions import ParserError
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.namespace import RDF
 from oc_ocdm.support.support import find_paths
 from rich_argparse import RichHelpFormatter
 from tqdm import tqdm
@@ -28,24 +30,69 @@ def store(triples, graph_identifier, stored_g: Dataset) -> Dataset:
     return stored_g
 
 
+def _node_id(term) -> str:
+    return f"_:{term}" if isinstance(term, BNode) else str(term)
+
+
+def _object_to_jsonld(term) -> dict:
+    if not isinstance(term, Literal):
+        return {"@id": _node_id(term)}
+    if term.language:
+        return {"@language": term.language, "@value": str(term)}
+    if term.datatype:
+        return {"@type": str(term.datatype), "@value": str(term)}
+    return {"@value": str(term)}
+
+
+def dataset_to_jsonld(cur_g: Dataset) -> list:
+    """
+    Expanded JSON-LD of ``cur_g``, built from its quads without rdflib's
+    serializer.
+
+    Every named graph becomes a ``{"@id", "@graph"}`` object and the
+    default graph's nodes are listed at the top level, as rdflib does.
+    Typed literals are written as strings with their ``@type`` rather than
+    as JSON numbers or booleans.
+    """
+    graphs: dict = {}
+    for s, p, o, c in cur_g.quads((None, None, None, None)):
+        subject_id = _node_id(s)
+        nodes = graphs.setdefault(c, {})
+        node = nodes.get(subject_id)
+        if node is None:
+            node = nodes[subject_id] = {"@id": subject_id}
+        if p == RDF.type and not isinstance(o, Literal):
+            node.setdefault("@type", []).append(_node_id(o))
+        else:
+            node.setdefault(str(p), []).append(_object_to_jsonld(o))
+    json_ld: list = []
+    for graph_identifier, nodes in graphs.items():
+        if graph_identifier is None or graph_identifier == DATASET_DEFAULT_GRAPH_ID:
+            json_ld.extend(nodes.values())
+        else:
+            json_ld.append(
+                {"@id": _node_id(graph_identifier), "@graph": list(nodes.values())}
+            )
+    return json_ld
+
+
 def store_in_file(cur_g: Dataset, cur_file_path: str, zip_output: bool) -> None:
     dir_path = os.path.dirname(cur_file_path)
     if not os.path.exists(dir_path):
         os.makedirs(dir_path, exist_ok=True)
 
-    cur_json_ld = orjson.loads(cur_g.serialize(format="json-ld"))
+    json_bytes = orjson.dumps(dataset_to_jsonld(cur_g))
 
     if zip_output:
         with ZipFile(
             cur_file_path, mode="w", compression=ZIP_DEFLATED, allowZip64=True
         ) as zip_file:
-            json_str = orjson.dumps(cur_json_ld).decode("utf-8")
             zip_file.writestr(
-                os.path.basename(cur_file_path.replace(".zip", ".json")), json_str
+                os.path.basename(cur_file_path.replace(".zip", ".json")), json_bytes
             )
     else:
         with open(cur_file_path, "wb") as f:
-            f.write(orjson.dumps(cur_json_ld))
+            f.write(json_bytes)
 
 
 def load_graph(file_path: str, cur_format: str = "json-ld"):
@@ -32,8 +32,7 @@ from oc_ds_converter.ra_processor import RaProcessor
 
 from oc_meta.core.editor import MetaEditor
 from oc_meta.lib.console import create_progress
-from oc_meta.lib.file_manager import find_rdf_file
-from oc_meta.run.meta.generate_csv import URI_TYPE_DICT, load_json_from_file
+from oc_meta.run.meta.generate_csv import URI_TYPE_DICT, find_entity
 
 HAS_IDENTIFIER = "http://purl.org/spar/datacite/hasIdentifier"
 USES_ID_SCHEME = "http://purl.org/spar/datacite/usesIdentifierScheme"
@@ -175,15 +174,7 @@ def normalize_orcid(orcid: str) -> str:
 def find_entity_in_file(
     uri: str, rdf_dir: str, dir_split: int, items_per_file: int
 ) -> Optional[dict]:
-    filepath = find_rdf_file(uri, rdf_dir, dir_split, items_per_file, zip_output=True)
-    if not os.path.exists(filepath):
-        return None
-    data = load_json_from_file(filepath)
-    for graph in data:
-        for entity in graph["@graph"]:
-            if entity["@id"] == uri:
-                return entity
-    return None
+    return find_entity(uri, rdf_dir, dir_split, items_per_file)
 
 
 def load_br_identifiers(
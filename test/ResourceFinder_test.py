@@ -3,9 +3,15 @@
 # SPDX-License-Identifier: ISC
 
 import os
+from unittest.mock import patch
 
 import pytest
-from oc_meta.lib.finder import ResourceFinder, _RDF_TYPE, _XSD_STRING
+from oc_meta.lib.finder import (
+    ResourceFinder,
+    _RDF_TYPE,
+    _XSD_STRING,
+    _chain_lengths,
+)
 from oc_ocdm.graph import GraphEntity
 from triplelite import RDFTerm
 from oc_meta.lib.sparql import execute_sparql_update
@@ -801,6 +807,101 @@ class TestFinderRetrieveVenueFromLocalGraphIssueDirectlyInVenue:
         assert result["issue"]["5"]["id"] == "br/issue1"
 
 
+class TestFinderVenueIndex:
+    def _add_issue(self, finder, issue_uri, container_uri, seq):
+        finder.add_triple(issue_uri, _RDF_TYPE, GraphEntity.iri_journal_issue)
+        finder.add_triple(issue_uri, GraphEntity.iri_part_of, container_uri)
+        finder.add_triple(issue_uri, GraphEntity.iri_has_sequence_identifier, seq)
+
+    def test_index_rebuilt_after_new_triples(self):
+        base_iri = "https://w3id.org/oc/meta"
+        finder = ResourceFinder(FINDER_SERVER, base_iri + "/")
+        volume_uri = f"{base_iri}/br/volume1"
+        finder.add_triple(volume_uri, _RDF_TYPE, GraphEntity.iri_journal_volume)
+        finder.add_triple(volume_uri, GraphEntity.iri_part_of, f"{base_iri}/br/venue1")
+        finder.add_triple(volume_uri, GraphEntity.iri_has_sequence_identifier, "7")
+        self._add_issue(finder, f"{base_iri}/br/issue1", volume_uri, "1")
+
+        assert finder.retrieve_venue_from_local_graph("br/venue1") == {
+            "issue": {},
+            "volume": {"7": {"id": "br/volume1", "issue": {"1": {"id": "br/issue1"}}}},
+        }
+
+        self._add_issue(finder, f"{base_iri}/br/issue2", volume_uri, "2")
+        result = finder.retrieve_venue_from_local_graph("br/venue1")
+        assert result["volume"]["7"]["issue"]["2"] == {"id": "br/issue2"}
+
+    def test_lookups_return_independent_copies(self):
+        base_iri = "https://w3id.org/oc/meta"
+        finder = ResourceFinder(FINDER_SERVER, base_iri + "/")
+        self._add_issue(finder, f"{base_iri}/br/issue1", f"{base_iri}/br/venue1", "5")
+
+        result = finder.retrieve_venue_from_local_graph("br/venue1")
+        result["issue"]["6"] = {"id": "br/wannabe_0"}
+        result["issue"]["5"]["id"] = "br/other"
+
+        assert finder.retrieve_venue_from_local_graph("br/venue1") == {
+            "issue": {"5": {"id": "br/issue1"}},
+            "volume": {},
+        }
+        assert finder.retrieve_venue_from_local_graph("br/unknown") == {
+            "issue": {},
+            "volume": {},
+        }
+
+
+class TestFinderRaSequenceCache:
+    base_iri = "https://w3id.org/oc/meta"
+
+    def _add_author(self, finder, ar, ra, name, next_ar=None):
+        ar_uri = f"{self.base_iri}/{ar}"
+        finder.add_triple(
+            f"{self.base_iri}/br/0601", GraphEntity.iri_is_document_context_for, ar_uri
+        )
+        finder.add_triple(ar_uri, GraphEntity.iri_with_role, GraphEntity.iri_author)
+        finder.add_triple(ar_uri, GraphEntity.iri_is_held_by, f"{self.base_iri}/{ra}")
+        if next_ar:
+            finder.add_triple(
+                ar_uri, GraphEntity.iri_has_next, f"{self.base_iri}/{next_ar}"
+            )
+        finder.add_triple(f"{self.base_iri}/{ra}", GraphEntity.iri_name, name)
+
+    def test_chain_lengths(self):
+        # 1 -> 2 -> 3 -> 2 is a cycle with a tail, 4 -> 5 ends outside
+        lengths = _chain_lengths(
+            {"ar/1": "ar/2", "ar/2": "ar/3", "ar/3": "ar/2", "ar/4": "ar/5"}
+        )
+        assert lengths == {"ar/1": 3, "ar/2": 2, "ar/3": 2, "ar/4": 1}
+
+    def test_longest_chain_wins(self):
+        finder = ResourceFinder(FINDER_SERVER, self.base_iri + "/")
+        self._add_author(finder, "ar/0601", "ra/0601", "Single")
+        self._add_author(finder, "ar/0602", "ra/0602", "First", next_ar="ar/0603")
+        self._add_author(finder, "ar/0603", "ra/0603", "Second")
+
+        sequence = finder.retrieve_ra_sequence_from_br_meta("br/0601", "author")
+
+        assert sequence == [
+            {"ar/0602": ("First", [], "ra/0602")},
+            {"ar/0603": ("Second", [], "ra/0603")},
+        ]
+
+    def test_sequence_cached_until_graph_changes(self):
+        finder = ResourceFinder(FINDER_SERVER, self.base_iri + "/")
+        self._add_author(finder, "ar/0601", "ra/0601", "Doe")
+        first = finder.retrieve_ra_sequence_from_br_meta("br/0601", "author")
+        with patch.object(finder, "retrieve_ra_from_meta") as retrieve_ra_from_meta:
+            assert (
+                finder.retrieve_ra_sequence_from_br_meta("br/0601", "author") == first
+            )
+        retrieve_ra_from_meta.assert_not_called()
+
+        self._add_author(finder, "ar/0602", "ra/0602", "Roe", next_ar="ar/0601")
+        sequence = finder.retrieve_ra_sequence_from_br_meta("br/0601", "author")
+        assert [list(agent)[0] for agent in sequence] == ["ar/0602", "ar/0601"]
+        assert finder.retrieve_ra_sequence_from_br_meta("br/0601", "editor") == []
+
+
 class TestFinderRetrievePublisherDeepNesting:
     @pytest.fixture
     def finder_with_publisher_data(self):
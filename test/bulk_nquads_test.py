@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import gzip
+import os
+import tempfile
+from unittest.mock import patch
+
+from oc_meta.lib.bulk_nquads import BulkFileStaging, write_bulk_files
+from oc_ocdm import Storer
+from oc_ocdm.graph import GraphSet
+from rdflib import Dataset
+from test.test_utils import get_counter_handler
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+RESP_AGENT = "https://orcid.org/0000-0002-8420-0696"
+
+
+def _apply(queries, dataset=None):
+    dataset = dataset if dataset is not None else Dataset()
+    for query in queries:
+        dataset.update(query)
+    return dataset
+
+
+def _load_bulk_files(directory):
+    dataset = Dataset()
+    deletions = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if name.endswith(".nq.gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                dataset.parse(data=f.read(), format="nquads")
+        elif name.endswith(".delete.sparql"):
+            with open(path, encoding="utf-8") as f:
+                deletions.extend(line for line in f.read().splitlines() if line)
+    return _apply(deletions, dataset)
+
+
+class TestWriteBulkFiles:
+    def test_bulk_load_matches_sparql_upload(self):
+        graph_set = GraphSet(BASE_IRI, custom_counter_handler=get_counter_handler())
+        for n in range(5):
+            graph_set.add_br(RESP_AGENT).has_title(f"Title {n}")
+        with tempfile.TemporaryDirectory() as tmp:
+            queries = []
+            for batch in ("first", "second"):
+                storer = Storer(graph_set)
+                with patch.object(Storer, "_query", return_value=True) as query:
+                    storer.upload_all("http://localhost/sparql", batch_size=10)
+                queries.extend(call.args[0] for call in query.call_args_list)
+                write_bulk_files(storer, tmp, batch, lines_per_file=4)
+                graph_set.commit_changes()
+                graph_set.get_entity(f"{BASE_IRI}br/1").has_title("Changed")
+            names = sorted(os.listdir(tmp))
+            assert names[:3] == [f"first.00000{n}.nq.gz" for n in range(3)]
+            assert names[-2:] == ["second.000000.nq.gz", "second.delete.sparql"]
+            # Deletions run once every quad is loaded
+            loaded = _load_bulk_files(tmp)
+            assert set(loaded.quads()) == set(_apply(queries).quads())
+
+
+class TestBulkFileStaging:
+    def test_commit_and_discard(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            staging = BulkFileStaging(tmp)
+            data_dir, prov_dir, first = staging.next_batch("a.csv")
+            _, _, second = staging.next_batch("a.csv")
+            assert first != second and first.startswith("a_")
+            for directory in (data_dir, prov_dir):
+                open(os.path.join(directory, f"{first}.000000.nq.gz"), "w").close()
+            staging.next_batch("b.csv")
+            staging.discard("b.csv")
+            assert os.listdir(os.path.join(tmp, ".pending")) == ["a.csv"]
+            staging.commit("a.csv")
+            assert os.listdir(os.path.join(tmp, ".pending")) == []
+            for kind in ("data", "prov"):
+                assert os.listdir(os.path.join(tmp, kind)) == [f"{first}.000000.nq.gz"]
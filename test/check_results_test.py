@@ -10,12 +10,15 @@ import os
 import zipfile
 
 import orjson
+import polars as pl
 import pytest
 import yaml
 
 from oc_meta.lib.file_manager import find_rdf_file
 from oc_meta.run.meta.check_results import (
+    _ID_COLUMNS,
     _extract_entity_groups,
+    _extract_identifier_tokens,
     check_omids_existence,
     check_provenance_existence,
     process_csv_file,
@@ -134,6 +137,62 @@ class TestExtractEntityGroups:
         }
 
 
+class TestExtractIdentifierTokens:
+    def test_matches_entity_groups(self):
+        rows = [
+            {
+                "id": "omid:br/0601 doi:10.1/x DOI:10.1/Y foo:bar malformed :x doi:",
+                "author": "Doe, J [orcid:0000-0001-2345-6789 omid:ra/0601]; "
+                "Smith [omid:ra/0602];Lone [viaf:1]",
+                "editor": "A [doi:10.1/a;2-b];B [omid:ra/0603]",
+                "publisher": "X [crossref:1] [crossref:2]; ; [] ; Y",
+                "venue": "[Labour Party[ [omid:ra/123]; J [issn:1234-5678 omid:br/0\u2010602]",
+            },
+            {
+                "id": "",
+                "author": None,
+                "editor": "x;y] [omid:ra/9]",
+                "publisher": "P [omid:ra/1 omid:ra/2]",
+                "venue": "V [a:1;b:2;c:3] ; W [x:1]",
+            },
+        ]
+        df = pl.DataFrame(rows, schema={col: pl.String for col in _ID_COLUMNS})
+        tokens = _extract_identifier_tokens(df, BASE_IRI)
+
+        groups = []
+        for _, group in tokens.group_by(["row", "col", "group"], maintain_order=True):
+            first = group.row(0, named=True)
+            groups.append(
+                (
+                    first["row"],
+                    first["col"],
+                    {
+                        "omid_uri": first["omid_uri"],
+                        **{
+                            kind: [
+                                (schema, value)
+                                for schema, value, k in group.select(
+                                    "schema", "value", "kind"
+                                ).iter_rows()
+                                if k == kind
+                            ]
+                            for kind in ("recognized", "unverifiable")
+                        },
+                    },
+                )
+            )
+        expected = [
+            (row_num, col, group)
+            for row_num, row in enumerate(rows, 1)
+            for col in _ID_COLUMNS
+            if row[col]
+            for group in _extract_entity_groups(row[col], col, BASE_IRI)
+            if group["omid_uri"] or group["recognized"] or group["unverifiable"]
+        ]
+        assert groups == expected
+        assert len(groups) == 13
+
+
 class TestFindFile:
     def test_find_file_zip_format(self):
         uri = "https://w3id.org/oc/meta/br/0605"
@@ -2,7 +2,10 @@
 #
 # SPDX-License-Identifier: ISC
 
+from unittest.mock import patch
+
 from oc_meta.lib.cleaner import (
+    IdentifierNormalizer,
     clean_agent_name,
     clean_date,
     clean_name,
@@ -549,3 +552,58 @@ class TestNameAndIdsRegex:
             "",
             "orcid:0000-0003-0530-4305 viaf:1",
         )
+
+
+class TestIdentifierNormalizer:
+    def test_results_aligned_with_input(self):
+        normalizer = IdentifierNormalizer()
+        result = normalizer.normalize(
+            ["doi:10.1001/Jama.2016.4932", "issn:0000-0000", "DOI:10.1/a‐b"]
+        )
+        assert result == ["doi:10.1001/jama.2016.4932", None, "doi:10.1/a-b"]
+
+    def test_each_identifier_normalized_once(self):
+        normalizer = IdentifierNormalizer()
+        with patch(
+            "oc_meta.lib.cleaner.normalize_id", side_effect=lambda s: s
+        ) as normalize_id:
+            normalizer.normalize(["doi:10.1/a", "doi:10.1/b", "doi:10.1/a"])
+            normalizer.normalize(["doi:10.1/b"])
+        assert normalize_id.call_count == 2
+        assert (normalizer.hits, normalizer.misses) == (2, 2)
+
+    def test_least_recently_used_evicted(self):
+        normalizer = IdentifierNormalizer(maxsize=2)
+        with normalizer.collecting():
+            normalizer.normalize(
+                ["doi:10.1/a", "doi:10.1/b", "doi:10.1/a", "doi:10.1/c"]
+            )
+            assert normalizer.drain() == {
+                "doi:10.1/a": "doi:10.1/a",
+                "doi:10.1/c": "doi:10.1/c",
+            }
+
+    def test_update_from_drained_entries(self):
+        worker = IdentifierNormalizer()
+        with worker.collecting():
+            worker.normalize(["orcid:0000-0002-8420-0696", "doi:x"])
+            drained = worker.drain()
+            assert worker.drain() == {}
+        parent = IdentifierNormalizer()
+        parent.update(drained)
+        with patch("oc_meta.lib.cleaner.normalize_id") as normalize_id:
+            assert parent.normalize(["orcid:0000-0002-8420-0696", "doi:x"]) == [
+                "orcid:0000-0002-8420-0696",
+                None,
+            ]
+        normalize_id.assert_not_called()
+
+    def test_additions_recorded_only_while_collecting(self):
+        normalizer = IdentifierNormalizer()
+        normalizer.normalize(["doi:10.1/a"])
+        assert normalizer._added is None
+        assert normalizer.drain() == {}
+        with normalizer.collecting():
+            normalizer.normalize(["doi:10.1/a", "doi:10.1/b"])
+            assert normalizer.drain() == {"doi:10.1/b": "doi:10.1/b"}
+        assert normalizer._added is None
@@ -184,3 +184,41 @@ class TestConvertCitations:
             assert rows == [
                 {"citing": "omid:br/06019115524", "cited": "omid:br/0622049481"},
             ]
+
+    def test_parallel_conversion_reuses_index(self, tmp_path):
+        meta_dir = tmp_path / "meta"
+        cit_dir = tmp_path / "citations"
+        meta_dir.mkdir()
+        cit_dir.mkdir()
+        with open(meta_dir / "meta.csv", "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["id", "title"])
+            for n in range(1, 21):
+                w.writerow([f"doi:10.1/{n} omid:br/060{n}", f"Title {n}"])
+        for part in range(4):
+            with open(cit_dir / f"part{part}.csv", "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["citing_id", "cited_id"])
+                for n in range(1, 21):
+                    w.writerow([f"doi:10.1/{n}", f"DOI:10.1/{(n + part) % 22}"])
+        index_dir = str(tmp_path / "index")
+        for attempt in range(2):
+            out_dir = tmp_path / f"output{attempt}"
+            convert_citations(
+                str(meta_dir),
+                str(cit_dir),
+                str(out_dir),
+                workers=2,
+                index_dir=index_dir,
+            )
+            for part in range(4):
+                with open(out_dir / f"part{part}.csv", newline="") as f:
+                    rows = list(csv.DictReader(f))
+                assert rows == [
+                    {
+                        "citing": f"omid:br/060{n}",
+                        "cited": f"omid:br/060{(n + part) % 22}",
+                    }
+                    for n in range(1, 21)
+                    if 0 < (n + part) % 22 <= 20
+                ]
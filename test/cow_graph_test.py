@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import pickle
+from unittest.mock import patch
+
+from oc_meta.lib.cow_graph import (
+    CopyOnWriteGraph,
+    CopyOnWriteGraphSet,
+    MutatedEntitiesProvSet,
+)
+from oc_ocdm.graph import GraphSet
+from oc_ocdm.prov import ProvSet
+from oc_ocdm.prov import prov_set as prov_set_module
+from oc_ocdm.support.query_utils import get_update_query
+from test.test_utils import get_counter_handler
+from triplelite import RDFTerm, TripleLite
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+RESP_AGENT = "https://orcid.org/0000-0002-8420-0696"
+BR = f"{BASE_IRI}br/0601"
+VENUE = f"{BASE_IRI}br/0602"
+ID = f"{BASE_IRI}id/0601"
+RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+TITLE = "http://purl.org/dc/terms/title"
+PART_OF = "http://purl.org/vocab/frbr/core#partOf"
+HAS_ID = "http://purl.org/spar/datacite/hasIdentifier"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _uri(value):
+    return RDFTerm("uri", value)
+
+
+def _local_graph():
+    local = TripleLite()
+    local.add_many(
+        [
+            (BR, RDF_TYPE, _uri("http://purl.org/spar/fabio/Expression")),
+            (BR, RDF_TYPE, _uri("http://purl.org/spar/fabio/JournalArticle")),
+            (BR, TITLE, RDFTerm("literal", "Old title", XSD_STRING)),
+            (BR, PART_OF, _uri(VENUE)),
+            (BR, HAS_ID, _uri(ID)),
+            (VENUE, RDF_TYPE, _uri("http://purl.org/spar/fabio/Expression")),
+            (VENUE, TITLE, RDFTerm("literal", "Venue", XSD_STRING)),
+        ]
+    )
+    return local
+
+
+def _edit(graph_set_class, counter_handler=None):
+    local = _local_graph()
+    graph_set = graph_set_class(
+        BASE_IRI, custom_counter_handler=counter_handler or get_counter_handler()
+    )
+    br = graph_set.add_br(RESP_AGENT, res=BR, preexisting_graph=local.subgraph(BR))
+    venue = graph_set.add_br(
+        RESP_AGENT, res=VENUE, preexisting_graph=local.subgraph(VENUE)
+    )
+    br.has_title("New title")
+    br.is_part_of(venue)
+    venue.has_title("Venue")
+    new_br = graph_set.add_br(RESP_AGENT)
+    new_br.is_part_of(venue)
+    return br, venue, new_br
+
+
+def _changes(entity):
+    queries, added, removed = get_update_query(entity)
+    return frozenset(queries), added, removed
+
+
+class TestCopyOnWriteGraph:
+    def test_matches_plain_graph_set(self):
+        plain = _edit(GraphSet)
+        shared = _edit(CopyOnWriteGraphSet)
+        for expected, entity in zip(plain, shared):
+            assert isinstance(entity.g, CopyOnWriteGraph)
+            assert set(entity.g) == set(expected.g)
+            assert len(entity.g) == len(expected.g)
+            assert _changes(entity) == _changes(expected)
+            assert entity.get_title() == expected.get_title()
+        br, venue, new_br = shared
+        assert br.g.modified
+        assert not venue.g.modified
+        assert new_br.g.modified
+        assert venue.g._shared is venue._preexisting_triples
+
+    def test_reverting_a_change_leaves_graph_unmodified(self):
+        graph = CopyOnWriteGraph(BR)
+        title = (BR, TITLE, RDFTerm("literal", "Old title", XSD_STRING))
+        graph.add_many(frozenset([title]))
+        graph.remove((BR, TITLE, None))
+        assert title not in graph and len(graph) == 0
+        graph.add(title)
+        assert not graph.modified
+        assert list(graph.objects(BR, TITLE)) == [title[2]]
+
+    def test_pickle_keeps_shared_triples(self):
+        br, venue, _ = _edit(CopyOnWriteGraphSet)
+        loaded_br, loaded_venue = pickle.loads(pickle.dumps((br, venue)))
+        assert set(loaded_br.g) == set(br.g)
+        assert loaded_br.g.modified
+        assert not loaded_venue.g.modified
+        assert loaded_venue.g._shared is loaded_venue._preexisting_triples
+
+
+def _provenance(prov_set_class, graph_set_class, snapshots):
+    counter_handler = get_counter_handler()
+    for res, count in snapshots.items():
+        counter_handler.set_counter(count, "br", "se", int(res[-1]), "060")
+    br, venue, new_br = _edit(graph_set_class, counter_handler)
+    prov = prov_set_class(br.g_set, BASE_IRI, custom_counter_handler=counter_handler)
+    modified = prov.generate_provenance(c_time=0)
+    triples = {
+        (s, p, o) for entity in prov.res_to_entity.values() for s, p, o in entity.g
+    }
+    return modified, triples, venue
+
+
+class TestMutatedEntitiesProvSet:
+    def test_matches_prov_set_without_diffing_unchanged_entities(self):
+        snapshots = {BR: 2, VENUE: 1}
+        expected, expected_triples, _ = _provenance(ProvSet, GraphSet, snapshots)
+        with patch.object(
+            prov_set_module,
+            "get_update_query",
+            wraps=prov_set_module.get_update_query,
+        ) as update_query:
+            modified, triples, venue = _provenance(
+                MutatedEntitiesProvSet, CopyOnWriteGraphSet, snapshots
+            )
+        assert modified == expected
+        assert BR in modified and VENUE not in modified and len(modified) == 2
+        assert triples == expected_triples
+        assert [call.args[0].res for call in update_query.call_args_list] == [BR]
+        assert VENUE in venue.g_set.res_to_entity
+
+    def test_unchanged_entity_without_snapshot_gets_one(self):
+        expected, expected_triples, _ = _provenance(ProvSet, GraphSet, {BR: 2})
+        modified, triples, _ = _provenance(
+            MutatedEntitiesProvSet, CopyOnWriteGraphSet, {BR: 2}
+        )
+        assert VENUE in modified
+        assert modified == expected
+        assert triples == expected_triples
@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: ISC
 
 import os
+from unittest.mock import patch
 
 import orjson
 import pytest
@@ -354,6 +355,42 @@ class TestCreator:
             (ar0602, has_next, ar0603),
         }
 
+    def test_shared_entities_resolved_once_per_batch(self):
+        base_iri = "https://w3id.org/oc/meta/"
+        finder = ResourceFinder(ts_url=SERVER, base_iri=base_iri)
+        creator = Creator(
+            [],
+            finder,
+            base_iri,
+            self.counter_handler,
+            "060",
+            "https://orcid.org/0000-0002-8420-0696",
+            [{"id": "orcid:0000-0002-8420-0696", "meta": "id/0601"}],
+            [],
+            [],
+            [],
+            {},
+        )
+        creator.src = None
+        ra = creator._add_entity(creator.setgraph.add_ra, f"{base_iri}ra/0601")
+        with (
+            patch.object(ResourceFinder, "__contains__", return_value=True),
+            patch.object(finder.graph, "subgraph", wraps=finder.graph.subgraph) as sg,
+        ):
+            for _ in range(3):
+                creator.id_creator(ra, "orcid:0000-0002-8420-0696", ra=True)
+                creator.id_creator(ra, "doi:10.1000/1", ra=True)
+                creator.id_creator(ra, "temp:1", ra=True)
+                assert (
+                    creator._add_entity(creator.setgraph.add_ra, f"{base_iri}ra/0601")
+                    is ra
+                )
+        sg.assert_called_once_with(f"{base_iri}id/0601")
+        assert [identifier.res for identifier in ra.get_identifiers()] == [
+            f"{base_iri}id/0601"
+        ]
+        assert ra.get_identifiers()[0].get_literal_value() == "0000-0002-8420-0696"
+
 
 class TestCase01:
     def test(self):
@@ -17,6 +17,7 @@ from oc_meta.run.meta.generate_csv import (
     generate_csv,
     init_redis_connection,
     is_omid_processed,
+    load_processed_omids,
     load_processed_omids_to_redis,
 )
 
@@ -90,6 +91,27 @@ class TestCSVGeneratorLite:
         assert is_omid_processed("omid:br/0603", redis_client)
         assert not is_omid_processed("omid:br/0604", redis_client)
 
+    def test_load_processed_omids_mirrors_to_redis(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(
+            os.path.join(self.output_dir, "test.csv"), "w", newline="", encoding="utf-8"
+        ) as f:
+            writer = csv.DictWriter(f, fieldnames=["id", "title"])
+            writer.writeheader()
+            writer.writerows(
+                [
+                    {"id": "omid:br/0601", "title": "Test 1"},
+                    {"id": "omid:br/0602 doi:10.1/x", "title": "Test 2"},
+                ]
+            )
+        self.redis_client.sadd("processed_omids", "omid:br/0609")
+
+        omids = load_processed_omids(self.output_dir, self.redis_client)
+
+        assert "omid:br/0601" in omids and "omid:br/0602" in omids
+        assert is_omid_processed("omid:br/0602", self.redis_client)
+        assert not is_omid_processed("omid:br/0609", self.redis_client)
+
     def test_redis_cache_persistence(self):
         # Create initial test data
         test_data = [
@@ -118,6 +140,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -166,6 +189,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -206,6 +230,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -221,6 +246,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -264,6 +290,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -294,6 +321,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -344,6 +372,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -446,6 +475,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -477,6 +507,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -612,6 +643,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -695,6 +727,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -759,6 +792,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -806,6 +840,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -960,6 +995,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1048,6 +1084,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1170,6 +1207,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1283,6 +1321,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1402,6 +1441,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1573,6 +1613,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1670,6 +1711,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -1892,6 +1934,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -2031,6 +2074,7 @@ class TestCSVGeneratorLite:
             output_dir=self.output_dir,
             dir_split_number=10000,
             items_per_file=1000,
+            redis_host="localhost",
             redis_port=6381,
             redis_db=5,
         )
@@ -7,7 +7,7 @@ import os
 import orjson
 import pytest
 from oc_meta.core.creator import Creator
-from oc_meta.core.curator import Curator, is_a_valid_row
+from oc_meta.core.curator import CreatorIndex, Curator, is_a_valid_row
 from oc_meta.lib.file_manager import get_csv_data
 from oc_meta.lib.finder import ResourceFinder
 from oc_ocdm import Storer
@@ -1024,6 +1024,48 @@ class TestCurator:
         assert curator.re_index == expected_index_re
         assert curator.VolIss == expected_index_vi
 
+    def test_indexer_creator_index(self):
+        """The CreatorIndex matches what Creator parses from the list-of-dicts form."""
+        curator = prepareCurator(list())
+        curator.filename = "0.csv"
+        curator.entity_store.set_id_metaid("doi:10.1001/2013.jamasurg.270", "id/2585")
+        curator.entity_store.add_id("br/2585", "doi:10.1001/2013.jamasurg.270")
+        curator.entity_store.set_id_metaid("orcid:0000-0003-0530-4305", "id/0601")
+        curator.entity_store.add_id("ra/0601", "orcid:0000-0003-0530-4305")
+        curator.entity_store.set_id_metaid("temp:1", "id/0602")
+        curator.entity_store.add_id("ra/0602", "temp:1")
+        curator.ardict = {
+            "br/2585": {
+                "author": [("ar/0601", "ra/0601"), ("ar/0602", "ra/0602")],
+                "editor": [],
+                "publisher": [("ar/0603", "ra/0603")],
+            }
+        }
+        curator.remeta = {"br/2585": ("re/0601", "1-10")}
+        curator.VolIss = {"br/0602": {"issue": {"1": {"id": "br/0603"}}, "volume": {}}}
+        curator.indexer()
+
+        assert curator.index == CreatorIndex(
+            ra_ids={"orcid": {"0000-0003-0530-4305": "id/0601"}},
+            br_ids={"doi": {"10.1001/2013.jamasurg.270": "id/2585"}},
+            ar={
+                "br/2585": {
+                    "author": {"ra/0601": "ar/0601", "ra/0602": "ar/0602"},
+                    "editor": {},
+                    "publisher": {"ra/0603": "ar/0603"},
+                }
+            },
+            re={"br/2585": "re/0601"},
+            vi=curator.VolIss,
+        )
+        assert curator.index == CreatorIndex.from_csv(
+            curator.index_id_ra,
+            curator.index_id_br,
+            curator.re_index,
+            curator.ar_index,
+            curator.VolIss,
+        )
+
     def test_is_a_valid_row(self):
         rows = [
             {
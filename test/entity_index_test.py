@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import orjson
+
+from oc_meta.lib.entity_index import EntityIndex
+
+BASE = "https://w3id.org/oc/meta/br/"
+
+
+def _write_zip(path, titles):
+    data = [
+        {
+            "@id": BASE,
+            "@graph": [
+                {"@id": f"{BASE}{n}", "title": [{"@value": title}]}
+                for n, title in titles.items()
+            ],
+        }
+    ]
+    with ZipFile(path, "w", compression=ZIP_DEFLATED) as zf:
+        zf.writestr("1000.json", orjson.dumps(data))
+
+
+class TestEntityIndex:
+    def test_indexes_each_file_once(self, tmp_path):
+        path = str(tmp_path / "1000.zip")
+        _write_zip(path, {1: "A", 2: "B"})
+        index = EntityIndex()
+        assert index.get(path, f"{BASE}1")["title"][0]["@value"] == "A"
+        assert index.get(path, f"{BASE}2")["title"][0]["@value"] == "B"
+        assert index.get(path, f"{BASE}3") is None
+        assert index.get(str(tmp_path / "2000.zip"), f"{BASE}3") is None
+        assert (index.hits, index.misses) == (2, 1)
+
+    def test_rereads_changed_file(self, tmp_path):
+        path = str(tmp_path / "1000.zip")
+        _write_zip(path, {1: "A"})
+        index = EntityIndex()
+        index.get(path, f"{BASE}1")
+        _write_zip(path, {1: "Changed title"})
+        os.utime(path, ns=(0, 0))
+        assert index.get(path, f"{BASE}1")["title"][0]["@value"] == "Changed title"
+        os.remove(path)
+        assert index.get(path, f"{BASE}1") is None
+        assert len(index) == 0 and index.size == 0
+
+    def test_evicts_least_recently_used_by_size(self, tmp_path):
+        paths = [str(tmp_path / f"{n}000.zip") for n in range(1, 4)]
+        for path in paths:
+            _write_zip(path, {n: "x" * 100 for n in range(10)})
+        index = EntityIndex()
+        index.entities(paths[0])
+        index.max_bytes = index.size * 2
+        index.entities(paths[1])
+        index.entities(paths[0])
+        index.entities(paths[2])
+        assert list(index._files) == [paths[0], paths[2]]
+        assert index.size <= index.max_bytes
@@ -12,6 +12,7 @@ from shutil import rmtree
 import orjson
 from oc_meta.lib.file_manager import (
     get_csv_data,
+    iter_csv_data,
     read_zipped_json,
     unzip_files_in_dir,
     zip_files_in_dir,
@@ -76,3 +77,36 @@ class TestGetCsvData:
             assert result[0]["id"] == "doi:10.1234/test"
         finally:
             os.unlink(path)
+
+
+class TestIterCsvData:
+    def test_iter_csv_data_windows(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("id,title\n")
+            for i in range(5):
+                f.write(f'"doi:10.1234/{i}","Title {i}"\n')
+            path = f.name
+        try:
+            windows = list(iter_csv_data(path, 2, clean_data=False))
+            assert [len(window) for window in windows] == [2, 2, 1]
+            flattened = [row for window in windows for row in window]
+            assert flattened == get_csv_data(path, clean_data=False)
+        finally:
+            os.unlink(path)
+
+    def test_iter_csv_data_large_field(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write("id,title\n")
+            f.write('"doi:10.1234/0","short"\n')
+            f.write(f'"doi:10.1234/1","{"x" * 200_000}"\n')
+            path = f.name
+        try:
+            windows = list(iter_csv_data(path, 1, clean_data=False))
+            assert [row["id"] for window in windows for row in window] == [
+                "doi:10.1234/0",
+                "doi:10.1234/1",
+            ]
+            rows = get_csv_data(path, clean_data=False)
+            assert [row for window in windows for row in window] == rows
+        finally:
+            os.unlink(path)
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import re
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from oc_meta.lib.finder import ResourceFinder, resolve_traversal_profile
+from oc_ocdm.graph import GraphEntity
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+P0 = "https://w3id.org/oc/meta/br/1"
+Q = "https://w3id.org/oc/meta/br/2"
+C1 = "https://w3id.org/oc/meta/br/3"
+C2 = "https://w3id.org/oc/meta/br/4"
+X = "https://w3id.org/oc/meta/br/5"
+Y = "https://w3id.org/oc/meta/br/6"
+Z = "https://w3id.org/oc/meta/br/7"
+
+# P0 -> C1 -> C2 -> X -> Y -> Z is the long path, Q -> X the short one
+EDGES = {P0: [C1], C1: [C2], C2: [X], X: [Y], Y: [Z], Q: [X]}
+
+
+class _FakeEndpoint:
+    def __init__(self, slow_subject):
+        self.slow_subject = slow_subject
+        self.events = []
+        self.lock = threading.Lock()
+
+    def __call__(self, endpoint_url, queries, *args, **kwargs):
+        subjects = re.findall(r"<([^>]+)>", queries[0])
+        with self.lock:
+            self.events.extend(("start", s) for s in subjects)
+        if self.slow_subject in subjects:
+            time.sleep(0.5)
+        bindings = [
+            {
+                "s": {"type": "uri", "value": s},
+                "p": {"type": "uri", "value": GraphEntity.iri_part_of},
+                "o": {"type": "uri", "value": o},
+            }
+            for s in subjects
+            for o in EDGES.get(s, [])
+        ]
+        with self.lock:
+            self.events.extend(("end", s) for s in subjects)
+        return [bindings]
+
+
+class TestPipelinedTraversal:
+    def _traverse(self, fake, max_depth):
+        finder = ResourceFinder("http://localhost/sparql", BASE_IRI, workers=4)
+        with (
+            patch("oc_meta.lib.finder.QLEVER_BATCH_SIZE", 1),
+            patch("oc_meta.lib.finder.execute_sparql_queries", side_effect=fake),
+        ):
+            finder.get_everything_about_res(
+                metavals={"omid:br/1", "omid:br/2"},
+                identifiers=set(),
+                vvis=set(),
+                max_depth=max_depth,
+            )
+        return finder
+
+    def test_follow_up_batches_do_not_wait_for_slow_ones(self):
+        fake = _FakeEndpoint(slow_subject=Q)
+        self._traverse(fake, max_depth=10)
+        assert fake.events.index(("start", C2)) < fake.events.index(("end", Q))
+
+    def test_shortest_depth_wins(self):
+        fake = _FakeEndpoint(slow_subject=Q)
+        finder = self._traverse(fake, max_depth=4)
+        assert finder._get_objects(Y, GraphEntity.iri_part_of) == [Z]
+        assert finder.traversal_depth_stats == {0: 2, 1: 2, 2: 2, 3: 1}
+
+    def test_max_depth_cut_off(self):
+        fake = _FakeEndpoint(slow_subject="")
+        finder = self._traverse(fake, max_depth=1)
+        assert ("start", C2) not in fake.events
+        assert finder.traversal_depth_stats == {0: 2, 1: 2}
+
+
+class TestTraversalProfile:
+    def test_full_profile_is_default(self):
+        assert resolve_traversal_profile({}) is None
+        assert resolve_traversal_profile({"traversal_profile": "full"}) is None
+
+    def test_prefixes_are_expanded(self):
+        profile = resolve_traversal_profile({"traversal_profile": "curation"})
+        assert profile["br"][GraphEntity.iri_part_of] == 2
+        assert profile["ar"][GraphEntity.iri_has_next] == 3
+
+    def test_custom_profile_overrides_builtin(self):
+        settings = {
+            "traversal_profile": "curation",
+            "traversal_profiles": {"curation": {"br": {"frbr:partOf": 0}}},
+        }
+        assert resolve_traversal_profile(settings) == {
+            "br": {GraphEntity.iri_part_of: 0}
+        }
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            resolve_traversal_profile({"traversal_profile": "missing"})
+
+    def test_profile_limits_followed_predicates(self):
+        fake = _FakeEndpoint(slow_subject="")
+        settings = {
+            "traversal_profile": "short",
+            "traversal_profiles": {"short": {"br": {"frbr:partOf": 1}}},
+        }
+        finder = ResourceFinder(
+            "http://localhost/sparql", BASE_IRI, settings=settings, workers=4
+        )
+        with (
+            patch("oc_meta.lib.finder.QLEVER_BATCH_SIZE", 1),
+            patch("oc_meta.lib.finder.execute_sparql_queries", side_effect=fake),
+        ):
+            finder.get_everything_about_res(
+                metavals={"omid:br/1", "omid:br/2"}, identifiers=set(), vvis=set()
+            )
+        # P0 -> C1 -> C2 and Q -> X -> Y; partOf is not followed from depth 2
+        assert finder.traversal_depth_stats == {0: 2, 1: 2, 2: 2}
+        assert ("start", Z) not in fake.events
@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import csv
+import os
+import zipfile
+from collections import defaultdict
+
+import orjson
+
+from oc_meta.lib.file_manager import find_rdf_file
+from oc_meta.run.meta import generate_csv_columnar as columnar
+from oc_meta.run.meta.generate_csv import process_bibliographic_resource
+
+BASE = "https://w3id.org/oc/meta/"
+DIR_SPLIT = 10000
+ITEMS = 1000
+FABIO = "http://purl.org/spar/fabio/"
+
+
+def _write_entities(rdf_dir, entities):
+    by_file = defaultdict(list)
+    for entity in entities:
+        path = find_rdf_file(entity["@id"], rdf_dir, DIR_SPLIT, ITEMS, zip_output=True)
+        by_file[path].append(entity)
+    for path, ents in by_file.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("1000.json", orjson.dumps([{"@graph": ents}]))
+
+
+def _literal(value):
+    return [{"@value": value}]
+
+
+def _ref(*omids):
+    return [{"@id": BASE + omid} for omid in omids]
+
+
+def _br(omid, types, title="", ids=(), ars=(), part_of=None, page=None, seq=None):
+    entity = {
+        "@id": BASE + omid,
+        "@type": [FABIO + "Expression"] + [FABIO + t for t in types],
+    }
+    if title:
+        entity["http://purl.org/dc/terms/title"] = _literal(title)
+    if seq:
+        entity["http://purl.org/spar/fabio/hasSequenceIdentifier"] = _literal(seq)
+    if ids:
+        entity["http://purl.org/spar/datacite/hasIdentifier"] = _ref(*ids)
+    if ars:
+        entity["http://purl.org/spar/pro/isDocumentContextFor"] = _ref(*ars)
+    if part_of:
+        entity["http://purl.org/vocab/frbr/core#partOf"] = _ref(part_of)
+    if page:
+        entity["http://purl.org/vocab/frbr/core#embodiment"] = _ref(page)
+    return entity
+
+
+def _ar(omid, role, ra=None, has_next=None):
+    entity = {
+        "@id": BASE + omid,
+        "http://purl.org/spar/pro/withRole": [
+            {"@id": f"http://purl.org/spar/pro/{role}"}
+        ],
+    }
+    if ra:
+        entity["http://purl.org/spar/pro/isHeldBy"] = _ref(ra)
+    if has_next:
+        entity["https://w3id.org/oc/ontology/hasNext"] = _ref(has_next)
+    return entity
+
+
+def _ra(omid, family="", given="", name="", ids=()):
+    entity = {"@id": BASE + omid}
+    for predicate, value in (
+        ("familyName", family),
+        ("givenName", given),
+        ("name", name),
+    ):
+        if value:
+            entity[f"http://xmlns.com/foaf/0.1/{predicate}"] = _literal(value)
+    if ids:
+        entity["http://purl.org/spar/datacite/hasIdentifier"] = _ref(*ids)
+    return entity
+
+
+def _id(omid, scheme, value):
+    return {
+        "@id": BASE + omid,
+        "http://purl.org/spar/datacite/usesIdentifierScheme": [
+            {"@id": f"http://purl.org/spar/datacite/{scheme}"}
+        ],
+        "http://www.essepuntato.it/2010/06/literalreification/hasLiteralValue": _literal(
+            value
+        ),
+    }
+
+
+def _dump(rdf_dir):
+    _write_entities(
+        rdf_dir,
+        [
+            # Ordered authors, an editor chain and a publisher
+            _br(
+                "br/0601",
+                ["JournalArticle"],
+                "First",
+                ids=["id/0601", "id/06099", "id/0602"],
+                ars=["ar/0603", "ar/0601", "ar/0602", "ar/0604", "ar/0605", "ar/0601"],
+                part_of="br/06013",
+                page="re/0601",
+            ),
+            _ar("ar/0601", "author", "ra/0601", "ar/0602"),
+            _ar("ar/0602", "author", "ra/0602", "ar/0603"),
+            _ar("ar/0603", "author", "ra/0603"),
+            _ar("ar/0604", "editor", "ra/0604", "ar/0605"),
+            _ar("ar/0605", "editor", "ra/06099"),
+            # A cycle, an author chain running through an editor, two starts
+            _br(
+                "br/0602",
+                ["BookChapter"],
+                "Second",
+                ars=["ar/06011", "ar/06012", "ar/06013", "ar/06014", "ar/06015"],
+                part_of="br/06014",
+            ),
+            _ar("ar/06011", "author", "ra/0601", "ar/06012"),
+            _ar("ar/06012", "author", "ra/0602", "ar/06011"),
+            _ar("ar/06013", "publisher", "ra/0605", "ar/06014"),
+            _ar("ar/06014", "editor", "ra/0604", "ar/06015"),
+            _ar("ar/06015", "publisher", "ra/0603"),
+            _br("br/0603", [], "No type", ars=["ar/06021", "ar/06022"]),
+            _ar("ar/06021", "author", "ra/0601"),
+            _ar("ar/06022", "author", "ra/0602"),
+            _br("br/0604", ["Book"], part_of="br/06015"),
+            # Venues: issue -> volume -> journal, and a cyclic one
+            _br("br/06011", ["Journal"], "A Journal", ids=["id/06011"]),
+            _br("br/06012", ["JournalVolume"], seq="7", part_of="br/06011"),
+            _br("br/06013", ["JournalIssue"], seq="3", part_of="br/06012"),
+            _br("br/06014", ["Book"], "", ids=["id/06011"]),
+            _br("br/06015", ["JournalIssue"], seq="1", part_of="br/06016"),
+            _br("br/06016", ["JournalIssue"], seq="2", part_of="br/06015"),
+            _ra("ra/0601", "Alpha", "A", ids=["id/06021"]),
+            _ra("ra/0602", "Beta"),
+            _ra("ra/0603", given="Gamma"),
+            _ra("ra/0604", name="Delta Press", ids=["id/06099", "id/06022"]),
+            _ra("ra/0605"),
+            _id("id/0601", "doi", "10.1/one"),
+            _id("id/0602", "pmid", "1"),
+            _id("id/06011", "issn", "1234-5678"),
+            _id("id/06021", "orcid", "0000-0001"),
+            _id("id/06022", "crossref", "99"),
+            {
+                "@id": BASE + "re/0601",
+                "http://prismstandard.org/namespaces/basic/2.0/startingPage": _literal(
+                    "10"
+                ),
+            },
+        ],
+    )
+
+
+def _expected(rdf_dir):
+    rows = {}
+    for path in sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(os.path.join(rdf_dir, "br"))
+        for name in names
+    ):
+        with zipfile.ZipFile(path) as z:
+            for graph in orjson.loads(z.read(z.namelist()[0])):
+                for entity in graph["@graph"]:
+                    row = process_bibliographic_resource(
+                        entity, rdf_dir, DIR_SPLIT, ITEMS
+                    )
+                    if row:
+                        rows[row["id"].split()[0]] = row
+    return rows
+
+
+class TestGenerateCsvColumnar:
+    def test_rows_match_pointer_engine(self, tmp_path):
+        rdf_dir = str(tmp_path / "rdf") + os.sep
+        _dump(rdf_dir)
+        tables_dir = str(tmp_path / "tables")
+        columnar.extract_tables(rdf_dir, tables_dir, workers=2)
+        rows = columnar.build_rows(columnar.load_tables(tables_dir)).to_dicts()
+        expected = _expected(rdf_dir)
+        assert {row["id"].split()[0]: row for row in rows} == expected
+        first = next(row for row in rows if row["id"].startswith("omid:br/0601 "))
+        assert first["author"].startswith("Alpha, A [omid:ra/0601 orcid:0000-0001]")
+        assert (first["volume"], first["issue"], first["page"]) == ("7", "3", "10-")
+
+    def test_writes_only_new_rows(self, tmp_path):
+        rdf_dir = str(tmp_path / "rdf") + os.sep
+        _dump(rdf_dir)
+        output_dir = str(tmp_path / "csv")
+        assert columnar.generate_csv_columnar(rdf_dir, output_dir, max_rows=4) == 6
+        assert sorted(os.listdir(output_dir)) == [
+            "output_0.csv",
+            "output_1.csv",
+            "tables",
+        ]
+        with open(os.path.join(output_dir, "output_1.csv"), encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == 2
+        assert columnar.generate_csv_columnar(rdf_dir, output_dir) == 0
+
+    def test_partitions_match_single_pass(self, tmp_path):
+        rdf_dir = str(tmp_path / "rdf") + os.sep
+        _dump(rdf_dir)
+        # A resource in another file pointing to agents and venues of the first
+        _write_entities(
+            rdf_dir,
+            [
+                _br(
+                    "br/06011001",
+                    ["JournalArticle"],
+                    "Elsewhere",
+                    ids=["id/0601"],
+                    ars=["ar/0603"],
+                    part_of="br/06013",
+                )
+            ],
+        )
+        tables_dir = str(tmp_path / "tables")
+        assert columnar.extract_tables(rdf_dir, tables_dir) == 2
+        tables = columnar.load_tables(tables_dir)
+        whole = columnar.build_rows(tables).to_dicts()
+        parts = (
+            columnar.build_rows(tables, 0, 1).to_dicts()
+            + columnar.build_rows(tables, 1, 2).to_dicts()
+        )
+        assert parts == whole
+        assert {row["id"].split()[0]: row for row in whole} == _expected(rdf_dir)
+        elsewhere = whole[-1]
+        assert elsewhere["author"] == ", Gamma [omid:ra/0603]"
+        assert (elsewhere["volume"], elsewhere["issue"]) == ("7", "3")
+
+        output_dir = str(tmp_path / "csv")
+        assert (
+            columnar.generate_csv_columnar(
+                rdf_dir, output_dir, tables_dir, max_rows=4, partition_files=1
+            )
+            == 7
+        )
+        with open(os.path.join(output_dir, "output_1.csv"), encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == 3
+
+    def test_changed_files_extracted_again(self, tmp_path):
+        rdf_dir = str(tmp_path / "rdf") + os.sep
+        for kind in ("ar", "ra", "id", "re"):
+            os.makedirs(os.path.join(rdf_dir, kind))
+        _write_entities(rdf_dir, [_br("br/0601", ["Book"], "Old")])
+        tables_dir = str(tmp_path / "tables")
+        columnar.extract_tables(rdf_dir, tables_dir)
+        _write_entities(rdf_dir, [_br("br/0601", ["Book"], "New title")])
+        columnar.extract_tables(rdf_dir, tables_dir)
+        rows = columnar.build_rows(columnar.load_tables(tables_dir))
+        assert rows["title"].to_list() == ["New title"]
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import pickle
+
+from oc_meta.lib.id_omid_index import IdOmidIndex, build_id_omid_index, is_index
+
+
+class TestIdOmidIndex:
+    def test_lookup(self, tmp_path):
+        index_dir = str(tmp_path / "index")
+        pairs = [(f"doi:10.1/{n}", f"omid:br/060{n}") for n in range(500)]
+        pairs += [("doi:10.1/7", "omid:br/0609999"), ("temp:àé", "omid:br/0601")]
+        assert build_id_omid_index(pairs, index_dir, shards=8) == 501
+        index = IdOmidIndex(index_dir)
+        assert len(index) == 501
+        assert index.get("doi:10.1/0") == "omid:br/0600"
+        assert index.get("doi:10.1/499") == "omid:br/060499"
+        # The last OMID seen for a key wins
+        assert index.get("doi:10.1/7") == "omid:br/0609999"
+        assert index.get("temp:àé") == "omid:br/0601"
+        assert index.get("doi:10.1/500") is None
+        assert index.get("doi:10.1/") is None
+
+    def test_empty_shards_and_pickling(self, tmp_path):
+        index_dir = str(tmp_path / "index")
+        assert not is_index(index_dir)
+        build_id_omid_index([("pmid:1", "omid:br/0601")], index_dir, shards=16)
+        assert is_index(index_dir)
+        index = pickle.loads(pickle.dumps(IdOmidIndex(index_dir)))
+        assert index.get("pmid:1") == "omid:br/0601"
+        assert index.get("pmid:2") is None
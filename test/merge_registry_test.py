@@ -1,9 +1,14 @@
 # SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
 #
 # SPDX-License-Identifier: ISC
+import random
 
-
-from oc_meta.lib.merge_registry import EntityStore
+import pytest
+from oc_meta.lib.merge_registry import (
+    CompactEntityStore,
+    EntityStore,
+    create_entity_store,
+)
 
 
 class TestEntityStore:
@@ -328,3 +333,113 @@ class TestEntityStoreIdIndex:
         assert store.get_ids("wannabe_0") == {"doi:10.1234/test", "pmid:12345"}
         assert store.find_entities("doi:10.1234/test") == {"wannabe_0"}
         assert store.find_entities("pmid:12345") == {"wannabe_0"}
+
+    def test_tables_round_trip(self):
+        store = EntityStore()
+        store.add_id("wannabe_0", "doi:10.1234/test")
+        store.set_title("wannabe_0", "Title")
+        store.merge("wannabe_0", "wannabe_1")
+        copy = EntityStore.from_tables(store.tables())
+        assert copy.find("wannabe_1") == "wannabe_0"
+        assert copy.get_title("wannabe_0") == "Title"
+        assert copy.find_entities("doi:10.1234/test") == {"wannabe_0"}
+
+
+WANNABES = [f"br/wannabe_{idx}" for idx in range(12)]
+EXISTING = [f"br/060{idx}" for idx in range(6)]
+LITERALS = [f"doi:10.1/{idx}" for idx in range(15)]
+
+
+def _random_operations(seed: int, count: int = 300) -> list[tuple]:
+    # Shaped like a curation run: wannabes are merged into each other or into
+    # existing entities, then every surviving wannabe gets a new MetaID
+    rng = random.Random(seed)
+    keys = WANNABES + EXISTING
+    operations: list[tuple] = []
+    for _ in range(count):
+        name = rng.choice(
+            [
+                "add_entity",
+                "add_id",
+                "add_id",
+                "set_title",
+                "merge",
+                "merge_entities",
+                "remove_entity",
+                "update_id_entity",
+                "set_id_metaid",
+            ]
+        )
+        if name == "add_entity":
+            operations.append((name, rng.choice(keys), rng.choice(["", "T"])))
+        elif name == "add_id":
+            operations.append((name, rng.choice(keys), rng.choice(LITERALS)))
+        elif name == "set_title":
+            operations.append((name, rng.choice(keys), f"T{rng.randrange(3)}"))
+        elif name == "remove_entity":
+            operations.append((name, rng.choice(keys)))
+        elif name == "set_id_metaid":
+            operations.append((name, rng.choice(LITERALS), rng.choice(EXISTING)))
+        else:
+            operations.append((name, rng.choice(keys), rng.choice(WANNABES)))
+    wannabes = list(WANNABES)
+    rng.shuffle(wannabes)
+    for idx, wannabe in enumerate(wannabes):
+        operations.append(("assign_meta", wannabe, f"br/061{idx}"))
+    return operations
+
+
+def _replay(operations: list[tuple], reference: EntityStore, *stores) -> EntityStore:
+    for name, *args in operations:
+        getattr(reference, name)(*args)
+        for store in stores:
+            getattr(store, name)(*args)
+    return reference
+
+
+def _observe(store) -> dict:
+    keys = WANNABES + EXISTING + [f"br/061{idx}" for idx in range(12)]
+    return {
+        "order": list(store),
+        "len": len(store),
+        "entities": store.entities(),
+        "find": [store.find(key) for key in keys],
+        "merged": [store.get_merged(key) for key in keys],
+        "titles": [store.get_title(key) for key in keys],
+        "reverse": [store.find_entities(literal) for literal in LITERALS],
+        "metaids": list(store.get_id_metaids().items()),
+    }
+
+
+class TestCompactEntityStore:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_same_results_as_dict_backend(self, seed):
+        compact = CompactEntityStore()
+        store = _replay(_random_operations(seed), EntityStore(), compact)
+        assert _observe(compact) == _observe(store)
+        assert compact.tables() == store.tables()
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_tables_round_trip(self, seed):
+        operations = _random_operations(seed)
+        half = len(operations) // 2
+        store = _replay(operations[:half], EntityStore())
+        compact = CompactEntityStore.from_tables(store.tables())
+        store = _replay(operations[half:], store, compact)
+        assert _observe(compact) == _observe(store)
+
+    def test_update_id_entity_follows_moved_ids(self):
+        store = CompactEntityStore()
+        store.add_id("br/wannabe_0", "doi:10.1/a")
+        store.add_id("br/wannabe_1", "doi:10.1/b")
+        store.update_id_entity("br/wannabe_0", "br/wannabe_2")
+        store.update_id_entity("br/wannabe_2", "br/wannabe_1")
+        assert store.find_entities("doi:10.1/a") == {"br/wannabe_1"}
+        assert store.find_entities("doi:10.1/b") == {"br/wannabe_1"}
+        assert store.get_ids("br/wannabe_0") == {"doi:10.1/a"}
+
+    def test_create_entity_store(self):
+        assert isinstance(create_entity_store("compact"), CompactEntityStore)
+        assert isinstance(create_entity_store(), EntityStore)
+        with pytest.raises(ValueError, match="Unknown entity store backend: sql"):
+            create_entity_store("sql")
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+import pickle
+from zipfile import ZipFile
+
+import orjson
+
+from oc_meta.lib.file_manager import get_csv_data
+from oc_meta.lib.omid_set import OmidSet
+from oc_meta.run.meta.generate_csv import PROCESSED_OMIDS_FILE, generate_csv
+
+
+class TestOmidSet:
+    def test_membership(self, tmp_path):
+        path = str(tmp_path / "omids.npy")
+        big = "9" * 30
+        omids = OmidSet.build(
+            [
+                "omid:br/0601",
+                "omid:br/0603",
+                "omid:br/0601",
+                "omid:ra/0602",
+                f"omid:br/{big}",
+            ],
+            path,
+            "omid:br/",
+        )
+        assert len(omids) == 3
+        assert "omid:br/0601" in omids and "omid:br/0603" in omids
+        assert f"omid:br/{big}" in omids
+        # Leading zeros are part of the number
+        assert "omid:br/601" not in omids and "omid:br/00601" not in omids
+        assert "omid:br/0602" not in omids and "omid:ra/0602" not in omids
+        assert "omid:br/06x" not in omids
+
+    def test_pickles_as_path(self, tmp_path):
+        path = str(tmp_path / "omids.npy")
+        omids = OmidSet.build(
+            [f"omid:br/060{n}" for n in range(1000)], path, "omid:br/"
+        )
+        payload = pickle.dumps(omids)
+        assert len(payload) < 500
+        assert "omid:br/060999" in pickle.loads(payload)
+
+    def test_empty(self, tmp_path):
+        omids = OmidSet.build([], str(tmp_path / "omids.npy"), "omid:br/")
+        assert len(omids) == 0 and "omid:br/0601" not in omids
+
+
+def _write_brs(rdf_dir, titles):
+    br_dir = os.path.join(rdf_dir, "br", "060", "10000")
+    os.makedirs(br_dir, exist_ok=True)
+    graph = [
+        {
+            "@graph": [
+                {
+                    "@id": f"https://w3id.org/oc/meta/br/060{n}",
+                    "@type": ["http://purl.org/spar/fabio/JournalArticle"],
+                    "http://purl.org/dc/terms/title": [{"@value": title}],
+                }
+                for n, title in titles.items()
+            ]
+        }
+    ]
+    with ZipFile(os.path.join(br_dir, "1000.zip"), "w") as zip_file:
+        zip_file.writestr("1000.json", orjson.dumps(graph))
+
+
+class TestGenerateCsvWithoutRedis:
+    def test_resume_skips_exported_resources(self, tmp_path):
+        rdf_dir = str(tmp_path / "rdf")
+        output_dir = str(tmp_path / "csv")
+        kwargs = dict(
+            input_dir=rdf_dir,
+            output_dir=output_dir,
+            dir_split_number=10000,
+            items_per_file=1000,
+            redis_host=None,
+            workers=2,
+        )
+        _write_brs(rdf_dir, {1: "First"})
+        generate_csv(**kwargs)
+        _write_brs(rdf_dir, {1: "First", 2: "Second"})
+        os.remove(os.path.join(output_dir, "processed_br_files.txt"))
+        generate_csv(**kwargs)
+        rows = []
+        for name in sorted(os.listdir(output_dir)):
+            if name.endswith(".csv"):
+                rows.extend(get_csv_data(os.path.join(output_dir, name)))
+        assert sorted((row["id"], row["title"]) for row in rows) == [
+            ("omid:br/0601", "First"),
+            ("omid:br/0602", "Second"),
+        ]
+        assert os.path.exists(os.path.join(output_dir, PROCESSED_OMIDS_FILE))
@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import multiprocessing
+import re
+
+import pytest
+from oc_meta.core.creator import Creator
+from oc_meta.core.parallel_creator import (
+    BatchCounterHandler,
+    apply_counters,
+    create_in_parallel,
+    is_stale,
+)
+from oc_ocdm.prov import ProvSet
+from test.partitioned_curator_test import SYNTHETIC_DATA, _curate, _make_curator
+from test.test_utils import get_counter_handler
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+RESP_AGENT = "https://orcid.org/0000-0002-8420-0696"
+PROV_TIMES = {
+    "http://www.w3.org/ns/prov#generatedAtTime",
+    "http://www.w3.org/ns/prov#invalidatedAtTime",
+}
+UPDATE_QUERY = "https://w3id.org/oc/ontology/hasUpdateQuery"
+
+
+def _provenance(creator, counter_handler):
+    prov = ProvSet(
+        creator,
+        BASE_IRI,
+        wanted_label=False,
+        supplier_prefix="060",
+        custom_counter_handler=counter_handler,
+    )
+    return prov, prov.generate_provenance()
+
+
+def _creation(curator):
+    def create(batch, counter_handler):
+        creator = Creator(
+            batch,
+            curator.finder,
+            BASE_IRI,
+            counter_handler,
+            "060",
+            RESP_AGENT,
+            index=curator.index,
+        ).creator()
+        prov, modified_entities = _provenance(creator, counter_handler)
+        return creator, prov, modified_entities
+
+    return create
+
+
+def _triples(abstract_set) -> set:
+    # Update queries list the same triples, in the order of the unpickled graph
+    return {
+        (
+            s,
+            p,
+            frozenset(re.split(r" \{ | \.", o.value)) if p == UPDATE_QUERY else str(o),
+        )
+        for entity in abstract_set.res_to_entity.values()
+        for s, p, o in entity.g
+        if p not in PROV_TIMES
+    }
+
+
+def _counters(counter_handler, creators) -> dict:
+    counters = {
+        short_name: counter_handler.read_counter(short_name, supplier_prefix="060")
+        for short_name in ("br", "ra", "ar", "id", "re")
+    }
+    for creator in creators:
+        for res, entity in creator.res_to_entity.items():
+            counters[res] = counter_handler.read_counter(
+                entity.short_name, "se", int(res.rsplit("/", 1)[1][3:]), "060"
+            )
+    return counters
+
+
+class TestBatchCounterHandler:
+    def test_reads_through_without_writing(self):
+        base = get_counter_handler()
+        base.set_counter(3, "br", "se", 5, "060")
+        handler = BatchCounterHandler(base)
+        assert handler.increment_counter("br", "se", 5, "060") == 4
+        handler.set_counter(7, "ra", supplier_prefix="060")
+        assert handler.read_counter("br", "se", 5, "060") == 4
+        assert base.read_counter("br", "se", 5, "060") == 3
+        assert base.read_counter("ra", supplier_prefix="060") == 0
+        assert handler.observed == {("br", "se", 5, "060"): 3, ("ra", "", 1, "060"): 0}
+
+    def test_metadata_counters_layered(self):
+        base = get_counter_handler()
+        base.set_metadata_counter(2, "di", "dataset")
+        handler = BatchCounterHandler(base)
+        assert handler.increment_metadata_counter("di", "dataset") == 3
+        assert handler.read_metadata_counter("di", "dataset") == 3
+        assert base.read_metadata_counter("di", "dataset") == 2
+        apply_counters(handler, base)
+        assert base.read_metadata_counter("di", "dataset") == 3
+
+    def test_apply_counters_keeps_largest_entity_counter(self):
+        base = get_counter_handler()
+        handler = BatchCounterHandler(base)
+        handler.set_counter(7, "ra", supplier_prefix="060")
+        handler.increment_counter("ra", "se", 2, "060")
+        base.set_counter(9, "ra", supplier_prefix="060")
+        apply_counters(handler, base)
+        assert base.read_counter("ra", supplier_prefix="060") == 9
+        assert base.read_counter("ra", "se", 2, "060") == 1
+
+    def test_stale_only_on_provenance_counters(self):
+        base = get_counter_handler()
+        handler = BatchCounterHandler(base)
+        handler.read_counter("ra", supplier_prefix="060")
+        handler.read_counter("ra", "se", 2, "060")
+        base.set_counter(9, "ra", supplier_prefix="060")
+        assert not is_stale(handler.observed, base)
+        base.set_counter(1, "ra", "se", 2, "060")
+        assert is_stale(handler.observed, base)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+class TestCreateInParallel:
+    def test_matches_serial_creation(self):
+        serial_curator = _curate(_make_curator(SYNTHETIC_DATA, {"workers": 1}))
+        parallel_curator = _curate(_make_curator(SYNTHETIC_DATA, {"workers": 1}))
+        # Batches share journals and agents, so some provenance is regenerated
+        batches = [
+            serial_curator.data[start : start + 10]
+            for start in range(0, len(serial_curator.data), 10)
+        ]
+        serial_handler = serial_curator.counter_handler
+        create = _creation(serial_curator)
+        serial = [create(batch, serial_handler) for batch in batches]
+
+        parallel_handler = parallel_curator.counter_handler
+        parallel = list(
+            create_in_parallel(
+                batches,
+                _creation(parallel_curator),
+                _provenance,
+                parallel_handler,
+                workers=3,
+            )
+        )
+
+        assert len(parallel) == len(serial)
+        for (s_creator, s_prov, s_modified), (p_creator, p_prov, p_modified) in zip(
+            serial, parallel
+        ):
+            assert p_modified == s_modified
+            assert _triples(p_creator) == _triples(s_creator)
+            assert _triples(p_prov) == _triples(s_prov)
+            assert p_prov.counter_handler is parallel_handler
+        creators = [creator for creator, _, _ in serial]
+        assert _counters(parallel_handler, creators) == _counters(
+            serial_handler, creators
+        )
@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import copy
+import os
+from unittest.mock import patch
+
+import pytest
+from oc_meta.core.curator import Curator
+from oc_meta.core.partitioned_curator import curate_partitions, partition_rows
+from oc_meta.lib.file_manager import get_csv_data
+from oc_meta.lib.merge_registry import CompactEntityStore
+from rdflib import Graph, Literal
+from test.test_utils import get_counter_handler, normalize_row_ids
+
+BASE_DIR = os.path.join("test")
+MANUAL_DATA_CSV = os.path.join(BASE_DIR, "manual_data.csv")
+MANUAL_DATA_RDF = os.path.join(BASE_DIR, "testcases", "ts", "testcase_ts-13.ttl")
+PROV_CONFIG = os.path.join(BASE_DIR, "prov_config.json")
+FIELDS = [
+    "id",
+    "title",
+    "author",
+    "pub_date",
+    "venue",
+    "volume",
+    "issue",
+    "page",
+    "type",
+    "publisher",
+    "editor",
+]
+
+
+def _row(**values) -> dict:
+    return {field: values.get(field, "") for field in FIELDS}
+
+
+ORCIDS = ["0000-0002-8420-0696", "0000-0001-5506-523X", "0000-0003-0530-4305"]
+ISSNS = ["0138-9130", "0028-0836", "0036-8075"]
+
+# Three journals with their own authors, ten standalone articles, five
+# duplicated DOIs and five rows without identifiers
+SYNTHETIC_DATA = (
+    [
+        _row(
+            id=f"doi:10.1234/{idx}",
+            title=f"Title {idx}",
+            author=f"Doe, John [orcid:{ORCIDS[idx % 3]}]; Roe, Jane",
+            pub_date="2020",
+            venue=f"Journal {idx % 3} [issn:{ISSNS[idx % 3]}]",
+            volume=str(idx % 2 + 1),
+            issue=str(idx % 4 + 1),
+            page="1-10",
+            type="journal article",
+            publisher=f"Publisher {idx % 3}",
+        )
+        for idx in range(30)
+    ]
+    + [
+        _row(
+            id=f"doi:10.5678/{idx % 10}",
+            title=f"Standalone {idx % 10}",
+            author="Roe, Jane",
+            pub_date="2021",
+            type="book",
+        )
+        for idx in range(15)
+    ]
+    + [
+        _row(
+            title=f"Untitled {idx}",
+            author="Anonymous",
+            pub_date="2022",
+            type="book",
+        )
+        for idx in range(5)
+    ]
+)
+
+
+@pytest.fixture
+def local_graph():
+    graph = Graph()
+    graph.parse(MANUAL_DATA_RDF)
+    return graph
+
+
+def _make_curator(data, settings, graph=None) -> Curator:
+    curator = Curator(
+        copy.deepcopy(data),
+        "http://127.0.0.1:1/sparql",
+        PROV_CONFIG,
+        get_counter_handler(),
+        base_iri="https://w3id.org/oc/meta",
+        prefix="060",
+        settings=settings,
+        min_rows_parallel=10,
+    )
+    for s, p, o in graph or []:
+        datatype = str(o.datatype) if isinstance(o, Literal) and o.datatype else ""
+        curator.finder.add_triple(str(s), str(p), str(o), datatype)
+    return curator
+
+
+def _curate(curator: Curator) -> Curator:
+    with (
+        patch.object(
+            Curator,
+            "_collect_identifiers_with_progress",
+            return_value=(set(), set(), set()),
+        ),
+        patch("oc_meta.lib.finder.ResourceFinder.get_everything_about_res"),
+        patch("oc_meta.lib.finder.execute_sparql_queries", return_value=[[]]),
+    ):
+        curator.curator()
+    return curator
+
+
+def _assert_same_output(serial: Curator, partitioned: Curator) -> None:
+    for row in serial.data + partitioned.data:
+        normalize_row_ids(row)
+    assert partitioned.data == serial.data
+    assert list(partitioned.entity_store) == list(serial.entity_store)
+    assert partitioned.entity_store.entities() == serial.entity_store.entities()
+    assert partitioned.ardict == serial.ardict
+    assert partitioned.VolIss == serial.VolIss
+    assert partitioned.remeta == serial.remeta
+    for entity_type in ("br", "ra", "ar", "id", "re"):
+        assert partitioned.counter_handler.read_counter(
+            entity_type, supplier_prefix="060"
+        ) == serial.counter_handler.read_counter(entity_type, supplier_prefix="060")
+
+
+class TestPartitionRows:
+    def test_rows_sharing_identifiers_are_grouped(self):
+        data = [
+            _row(id="doi:10.1/a", author="Doe, J [orcid:0000-0002-8420-0696]"),
+            _row(id="doi:10.1/b"),
+            _row(id="doi:10.1/c", author="Doe, J [orcid:0000-0002-8420-0696]"),
+            _row(id="doi:10.1/b", title="Again"),
+        ]
+        curator = _make_curator(data, {})
+        assert partition_rows(curator) == [[0, 2], [1, 3]]
+
+    def test_local_graph_links_containers(self, local_graph):
+        # br/06011 is in an issue of a volume of the venue br/060301
+        data = [
+            _row(id="doi:10.1/a", venue="Venue1 [doi:10.1001/jama.2016.4932]"),
+            _row(id="doi:10.1/b"),
+            _row(id="doi:10.1123/ijatt.2015-0070"),
+        ]
+        curator = _make_curator(data, {}, local_graph)
+        assert partition_rows(curator) == [[0, 2], [1]]
+
+
+class TestCuratePartitions:
+    def test_synthetic_data_matches_serial_run(self):
+        serial = _curate(_make_curator(SYNTHETIC_DATA, {"workers": 1}))
+        partitioned = _make_curator(
+            SYNTHETIC_DATA, {"workers": 4, "parallel_curation": True}
+        )
+        assert len(partition_rows(partitioned)) == 18
+        _assert_same_output(serial, _curate(partitioned))
+
+    def test_preexisting_entities_match_serial_run(self, local_graph):
+        data = get_csv_data(MANUAL_DATA_CSV)
+        serial = _curate(_make_curator(data, {"workers": 1}, local_graph))
+        partitioned = _curate(
+            _make_curator(data, {"workers": 4, "parallel_curation": True}, local_graph)
+        )
+        _assert_same_output(serial, partitioned)
+
+    def test_shared_entity_falls_back_to_serial(self):
+        data = SYNTHETIC_DATA[:2] + [SYNTHETIC_DATA[0]]
+        curator = _make_curator(data, {"workers": 2})
+        with patch(
+            "oc_meta.core.partitioned_curator.partition_rows",
+            return_value=[[0, 1], [2]],
+        ):
+            assert not curate_partitions(curator)
+        assert len(curator.entity_store) == 0
+        assert curator.wnb_cnt == 0
+        assert curator.counter_handler.read_counter("id", supplier_prefix="060") == 0
+
+
+class TestEntityStoreBackends:
+    def test_compact_backend_matches_dict_backend(self, local_graph):
+        data = get_csv_data(MANUAL_DATA_CSV)
+        serial = _curate(_make_curator(data, {"workers": 1}, local_graph))
+        compact = _curate(
+            _make_curator(
+                data,
+                {
+                    "workers": 4,
+                    "parallel_curation": True,
+                    "entity_store_backend": "compact",
+                },
+                local_graph,
+            )
+        )
+        assert isinstance(compact.entity_store, CompactEntityStore)
+        _assert_same_output(serial, compact)
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+import pickle
+import tempfile
+from types import SimpleNamespace
+
+from oc_meta.lib.rdf_file_cache import CachedStorer, RdfFileCache
+from oc_meta.lib.timer import ProcessTimer
+from oc_meta.run.meta_process import MetaProcess
+from oc_ocdm.graph import GraphSet
+from oc_ocdm.reader import Reader
+from oc_ocdm.storer import Storer
+from test.test_utils import get_counter_handler
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+RESP_AGENT = "https://orcid.org/0000-0002-8420-0696"
+
+
+def _batches():
+    counter_handler = get_counter_handler()
+    batches = []
+    for titles in (["First", "Second"], ["Third"], ["Fourth"]):
+        graph_set = GraphSet(
+            BASE_IRI, supplier_prefix="060", custom_counter_handler=counter_handler
+        )
+        for title in titles:
+            graph_set.add_br(RESP_AGENT).has_title(title)
+            graph_set.add_ra(RESP_AGENT).has_name(title)
+        batches.append(graph_set)
+    return batches
+
+
+def _store(base_dir, batches, file_cache=None):
+    for graph_set in batches:
+        kwargs = {"file_cache": file_cache} if file_cache is not None else {}
+        storer_class = CachedStorer if file_cache is not None else Storer
+        storer = storer_class(
+            graph_set,
+            dir_split=10000,
+            n_file_item=1000,
+            output_format="json-ld",
+            zip_output=True,
+            **kwargs,
+        )
+        storer.store_all(base_dir, BASE_IRI)
+
+
+def _files(base_dir):
+    reader = Reader()
+    files = {}
+    for root, _, names in os.walk(base_dir):
+        for name in names:
+            if name.endswith(".zip"):
+                path = os.path.join(root, name)
+                files[os.path.relpath(path, base_dir)] = reader.load_jsonld_dict(path)
+    return files
+
+
+class TestRdfFileCache:
+    def test_matches_storer_and_writes_on_flush(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_dir = os.path.join(tmp, "plain") + os.sep
+            cached_dir = os.path.join(tmp, "cached") + os.sep
+            _store(plain_dir, _batches())
+            cache = RdfFileCache(max_files=10)
+            _store(cached_dir, _batches(), cache)
+            assert _files(cached_dir) == {}
+            assert (cache.hits, cache.misses, len(cache)) == (4, 2, 2)
+            cache.flush()
+            assert len(cache) == 0
+            assert _files(cached_dir) == _files(plain_dir)
+
+    def test_least_recently_used_file_is_written_back(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain_dir = os.path.join(tmp, "plain") + os.sep
+            cached_dir = os.path.join(tmp, "cached") + os.sep
+            _store(plain_dir, _batches())
+            cache = RdfFileCache(max_files=1)
+            _store(cached_dir, _batches(), cache)
+            assert len(cache) == 1
+            assert cache.misses == 6 and cache.hits == 0
+            cache.flush()
+            assert _files(cached_dir) == _files(plain_dir)
+
+    def test_cache_is_not_pickled(self):
+        storer = CachedStorer(_batches()[0], file_cache=RdfFileCache(1))
+        assert pickle.loads(pickle.dumps(storer)).file_cache is None
+
+    def test_flush_reports_each_input_file_separately(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = RdfFileCache(max_files=10)
+            process = SimpleNamespace(rdf_file_cache=cache)
+            reports = []
+            for name, batches in (("first", _batches()), ("second", _batches()[:1])):
+                _store(os.path.join(tmp, name) + os.sep, batches, cache)
+                timer = ProcessTimer(enabled=True)
+                MetaProcess._flush_rdf_files(process, timer)
+                reports.append(
+                    tuple(
+                        timer.metrics[f"rdf_file_cache_{key}"]
+                        for key in ("hits", "misses", "hit_rate")
+                    )
+                )
+            assert reports == [(4, 2, 0.6667), (0, 2, 0.0)]
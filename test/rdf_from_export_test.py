@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+import tempfile
+
+import orjson
+from oc_meta.run.migration.rdf_from_export import (
+    dataset_to_jsonld,
+    load_graph,
+    store_in_file,
+)
+from rdflib import RDF, XSD, Dataset, Literal, URIRef
+from rdflib.compare import isomorphic
+
+BR = URIRef("https://w3id.org/oc/meta/br/0601")
+GRAPH = URIRef("https://w3id.org/oc/meta/br/")
+SE = URIRef("https://w3id.org/oc/meta/br/0601/prov/se/1")
+PROV_GRAPH = URIRef("https://w3id.org/oc/meta/br/0601/prov/")
+
+
+def _dataset() -> Dataset:
+    dataset = Dataset()
+    quads = [
+        (BR, RDF.type, URIRef("http://purl.org/spar/fabio/Expression"), GRAPH),
+        (BR, RDF.type, URIRef("http://purl.org/spar/fabio/JournalArticle"), GRAPH),
+        (BR, URIRef("http://purl.org/dc/terms/title"), Literal("A title"), GRAPH),
+        (
+            BR,
+            URIRef("http://prismstandard.org/namespaces/basic/2.0/publicationDate"),
+            Literal("2020-01", datatype=XSD.gYearMonth),
+            GRAPH,
+        ),
+        (
+            BR,
+            URIRef("http://purl.org/dc/terms/abstract"),
+            Literal("Un riassunto", lang="it"),
+            GRAPH,
+        ),
+        (
+            BR,
+            URIRef("http://purl.org/vocab/frbr/core#partOf"),
+            URIRef("https://w3id.org/oc/meta/br/0602"),
+            GRAPH,
+        ),
+        (
+            SE,
+            URIRef("http://www.w3.org/ns/prov#generatedAtTime"),
+            Literal("2024-01-01T00:00:00", datatype=XSD.dateTime),
+            PROV_GRAPH,
+        ),
+        (SE, URIRef("http://www.w3.org/ns/prov#specializationOf"), BR, PROV_GRAPH),
+        (
+            SE,
+            URIRef("http://example.org/count"),
+            Literal("07", datatype=XSD.integer),
+            PROV_GRAPH,
+        ),
+    ]
+    dataset.addN(quads)
+    return dataset
+
+
+def _parse(json_ld: bytes) -> Dataset:
+    dataset = Dataset()
+    dataset.parse(data=json_ld.decode("utf-8"), format="json-ld")
+    return dataset
+
+
+class TestDatasetToJsonld:
+    def test_matches_rdflib_serializer(self):
+        dataset = _dataset()
+        expected = _parse(dataset.serialize(format="json-ld").encode("utf-8"))
+        written = _parse(orjson.dumps(dataset_to_jsonld(dataset)))
+        assert set(written.quads()) == set(expected.quads())
+
+    def test_typed_literals_stay_strings(self):
+        json_ld = dataset_to_jsonld(_dataset())
+        prov_graph = next(g for g in json_ld if g["@id"] == str(PROV_GRAPH))
+        (snapshot,) = prov_graph["@graph"]
+        assert snapshot["http://example.org/count"] == [
+            {"@type": str(XSD.integer), "@value": "7"}
+        ]
+
+    def test_default_graph_nodes_are_top_level(self):
+        dataset = Dataset()
+        dataset.add((BR, RDF.type, URIRef("http://purl.org/spar/fabio/Expression")))
+        assert dataset_to_jsonld(dataset) == [
+            {"@id": str(BR), "@type": ["http://purl.org/spar/fabio/Expression"]}
+        ]
+
+    def test_store_in_file_round_trip(self):
+        dataset = _dataset()
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, zip_output in (("1.zip", True), ("1.json", False)):
+                file_path = os.path.join(tmp, "br", "060", name)
+                store_in_file(dataset, file_path, zip_output)
+                loaded = load_graph(file_path)
+                for graph in (GRAPH, PROV_GRAPH):
+                    assert isomorphic(loaded.graph(graph), dataset.graph(graph))
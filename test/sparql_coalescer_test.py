@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+from unittest.mock import patch
+
+from oc_meta.lib.sparql_coalescer import UpdateCoalescer, upload_coalesced
+from oc_ocdm import Storer
+from oc_ocdm.graph import GraphSet
+from oc_ocdm.prov import ProvSet
+from rdflib import Dataset
+from test.test_utils import get_counter_handler
+from triplelite import RDFTerm
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+RESP_AGENT = "https://orcid.org/0000-0002-8420-0696"
+TITLE = "http://purl.org/dc/terms/title"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _title(n):
+    return (f"{BASE_IRI}br/060{n}", TITLE, RDFTerm("literal", f"T{n}", XSD_STRING))
+
+
+def _apply(queries):
+    dataset = Dataset()
+    for query in queries:
+        dataset.update(query)
+    return set(dataset.quads())
+
+
+class TestUpdateCoalescer:
+    def test_splits_by_size_and_keeps_every_triple(self):
+        coalescer = UpdateCoalescer(max_triples=3)
+        coalescer.add(f"{BASE_IRI}br/", [_title(1), _title(2)], [_title(3)])
+        coalescer.add(f"{BASE_IRI}ra/", [_title(4), _title(5)], [])
+        updates = list(coalescer.updates())
+        assert [(added, removed) for _, added, removed in updates] == [(2, 1), (2, 0)]
+        assert updates[0][0].startswith("DELETE DATA { GRAPH <")
+        assert " ; INSERT DATA { GRAPH <" in updates[0][0]
+        # The deleted triple was never there, so only the insertions remain
+        assert len(_apply(query for query, _, _ in updates)) == 4
+
+    def test_cancels_insert_delete_pairs(self):
+        coalescer = UpdateCoalescer(max_triples=100)
+        graph = f"{BASE_IRI}br/"
+        coalescer.add(graph, [_title(1)], [_title(2)])
+        coalescer.add(graph, [_title(2)], [_title(1)])
+        coalescer.add(f"{BASE_IRI}ra/", [], [_title(1)])
+        assert coalescer.cancelled == 2
+        ((query, added, removed),) = coalescer.updates()
+        assert (added, removed) == (0, 1)
+        assert query.startswith(f"DELETE DATA {{ GRAPH <{BASE_IRI}ra/>")
+
+
+class TestUploadCoalesced:
+    def test_sends_same_changes_in_fewer_requests(self):
+        graph_set = GraphSet(BASE_IRI, custom_counter_handler=get_counter_handler())
+        for n in range(30):
+            graph_set.add_br(RESP_AGENT).has_title(f"Title {n}")
+        prov = ProvSet(
+            graph_set, BASE_IRI, custom_counter_handler=get_counter_handler()
+        )
+        prov.generate_provenance()
+        for abstract_set in (graph_set, prov):
+            storer = Storer(abstract_set)
+            with patch.object(Storer, "_query", return_value=True) as query:
+                storer.upload_all("http://localhost/sparql", batch_size=10)
+                expected = _apply(call.args[0] for call in query.call_args_list)
+                query.reset_mock()
+                stats = upload_coalesced(storer, "http://localhost/sparql", None, 1000)
+                assert query.call_count == stats["requests"] == 1
+                coalesced = _apply(call.args[0] for call in query.call_args_list)
+            assert coalesced == expected
+            assert stats["bytes"] > 0 and stats["cancelled"] == 0
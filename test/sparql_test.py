@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import orjson
+import pytest
+from SPARQLWrapper.SPARQLExceptions import QueryBadFormed
+
+from oc_meta.lib.sparql import (
+    execute_sparql_queries,
+    execute_sparql_queries_parallel,
+    run_queries_parallel,
+)
+
+
+class _SparqlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        query = parse_qs(self.rfile.read(length).decode())["query"][0]
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            failures = server.failures_left.get(query, 0)
+            if failures:
+                server.failures_left[query] = failures - 1
+        if query == "BAD":
+            status, body = 400, b"malformed"
+        elif failures:
+            status, body = 500, b"boom"
+        else:
+            status = 200
+            body = orjson.dumps(
+                {"results": {"bindings": [{"q": {"type": "literal", "value": query}}]}}
+            )
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SparqlHandler)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.failures_left = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/sparql"
+    server.shutdown()
+    server.server_close()
+
+
+def _values(results):
+    return [bindings[0]["q"]["value"] for bindings in results]
+
+
+class TestExecuteSparqlQueries:
+    def test_sequential(self, endpoint):
+        _, url = endpoint
+        assert _values(execute_sparql_queries(url, ["A", "B"])) == ["A", "B"]
+
+    def test_retries_internal_error(self, endpoint):
+        server, url = endpoint
+        server.failures_left["A"] = 2
+        results = execute_sparql_queries(url, ["A"], backoff_factor=0)
+        assert _values(results) == ["A"]
+        assert server.requests == 3
+
+    def test_gives_up_after_max_retries(self, endpoint):
+        server, url = endpoint
+        server.failures_left["A"] = 10
+        with pytest.raises(Exception):
+            execute_sparql_queries(url, ["A"], max_retries=1, backoff_factor=0)
+        assert server.requests == 2
+
+    def test_bad_query_is_not_retried(self, endpoint):
+        server, url = endpoint
+        with pytest.raises(QueryBadFormed):
+            execute_sparql_queries(url, ["BAD"], backoff_factor=0)
+        assert server.requests == 1
+
+
+class TestParallelQueries:
+    def test_results_keep_query_order(self, endpoint):
+        _, url = endpoint
+        queries = [f"Q{i}" for i in range(50)]
+        completed = []
+        results = execute_sparql_queries_parallel(
+            url, queries, workers=8, progress_callback=completed.append
+        )
+        assert _values(results) == queries
+        assert sorted(completed) == list(range(50))
+
+    def test_run_queries_parallel_reports_batch_sizes(self, endpoint):
+        _, url = endpoint
+        advanced = []
+        results = run_queries_parallel(
+            url,
+            ["A", "B", "C"],
+            [3, 2, 1],
+            workers=2,
+            progress_callback=advanced.append,
+        )
+        assert _values(results) == ["A", "B", "C"]
+        assert sorted(advanced) == [1, 2, 3]
+
+    def test_error_propagates(self, endpoint):
+        _, url = endpoint
+        with pytest.raises(QueryBadFormed):
+            execute_sparql_queries_parallel(url, ["A", "BAD", "C"], workers=2)
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import threading
+
+import pytest
+from oc_meta.lib.storage_queue import StorageQueue
+
+
+def _fail():
+    raise RuntimeError("RDF storage failed")
+
+
+class TestStorageQueue:
+    def test_synchronous_without_queue(self):
+        queue = StorageQueue()
+        done = []
+        queue.submit("a.csv", lambda: done.append(1))
+        assert done == [1]
+        with pytest.raises(RuntimeError):
+            queue.submit("a.csv", _fail)
+        errors = []
+        queue.submit_barrier("a.csv", errors.append)
+        assert errors == [None]
+
+    def test_jobs_run_in_order(self):
+        queue = StorageQueue(max_queued=3)
+        done = []
+        for idx in range(10):
+            queue.submit("a.csv", lambda idx=idx: done.append(idx))
+        queue.wait()
+        assert done == list(range(10))
+
+    def test_submit_blocks_while_queue_is_full(self):
+        queue = StorageQueue(max_queued=1)
+        release = threading.Event()
+        queue.submit("a.csv", release.wait)
+        submitted = threading.Event()
+
+        def submit_second():
+            queue.submit("a.csv", lambda: None)
+            submitted.set()
+
+        thread = threading.Thread(target=submit_second)
+        thread.start()
+        assert not submitted.wait(0.2)
+        release.set()
+        assert submitted.wait(5)
+        thread.join()
+        queue.wait()
+
+    def test_rss_limit_waits_for_empty_queue(self):
+        queue = StorageQueue(max_queued=10, max_rss_mb=1)
+        release = threading.Event()
+        queue.submit("a.csv", release.wait)
+        submitted = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (queue.submit("a.csv", lambda: None), submitted.set())
+        )
+        thread.start()
+        assert not submitted.wait(0.2)
+        release.set()
+        assert submitted.wait(5)
+        thread.join()
+        queue.wait()
+
+    def test_failed_group_skips_jobs_until_barrier(self):
+        queue = StorageQueue(max_queued=2)
+        done = []
+        errors = []
+        queue.submit("a.csv", _fail)
+        queue.submit("a.csv", lambda: done.append("a"))
+        queue.submit_barrier("a.csv", errors.append)
+        queue.submit("b.csv", lambda: done.append("b"))
+        queue.submit_barrier("b.csv", errors.append)
+        queue.wait()
+        assert done == ["b"]
+        assert isinstance(errors[0], RuntimeError)
+        assert errors[1] is None
+
+    def test_wait_for_ticket(self):
+        queue = StorageQueue(max_queued=2)
+        release = threading.Event()
+        first = queue.submit("a.csv", lambda: None)
+        queue.submit("a.csv", release.wait)
+        queue.wait(first)
+        assert queue.completed >= first
+        release.set()
+        queue.wait()
+        assert queue.completed == queue.submitted == 2
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 Arcangelo Massari <arcangelo.massari@unibo.it>
+#
+# SPDX-License-Identifier: ISC
+
+import os
+import tempfile
+from unittest.mock import patch
+
+from oc_meta.lib.finder import ResourceFinder
+from oc_meta.lib.subject_cache import SubjectCache
+from oc_ocdm.graph import GraphEntity
+
+BASE_IRI = "https://w3id.org/oc/meta/"
+BR = "https://w3id.org/oc/meta/br/0601"
+ID = "https://w3id.org/oc/meta/id/0601"
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+
+
+def _binding(s, p, o, o_type="uri", datatype=""):
+    o_binding = {"type": o_type, "value": o}
+    if datatype:
+        o_binding["datatype"] = datatype
+    return {
+        "s": {"type": "uri", "value": s},
+        "p": {"type": "uri", "value": p},
+        "o": o_binding,
+    }
+
+
+class TestSubjectCache:
+    def test_put_and_get(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SubjectCache(os.path.join(tmp, "cache.db"))
+            cache.put_many(
+                {BR: [(GraphEntity.iri_title, "A title", "literal", XSD_STRING)]}
+            )
+            found = cache.get_many([BR, ID])
+            assert found == {
+                BR: [(GraphEntity.iri_title, "A title", "literal", XSD_STRING)]
+            }
+            assert cache.hits == 1
+            assert cache.misses == 1
+            cache.close()
+
+    def test_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "nested", "cache.db")
+            cache = SubjectCache(path)
+            cache.put_many({BR: [(GraphEntity.iri_has_identifier, ID, "uri", "")]})
+            cache.close()
+            reopened = SubjectCache(path)
+            assert BR in reopened
+            assert len(reopened) == 1
+            reopened.close()
+
+    def test_invalidate(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SubjectCache(os.path.join(tmp, "cache.db"))
+            cache.put_many(
+                {
+                    BR: [(GraphEntity.iri_has_identifier, ID, "uri", "")],
+                    ID: [
+                        (
+                            GraphEntity.iri_has_literal_value,
+                            "10.1/x",
+                            "literal",
+                            XSD_STRING,
+                        )
+                    ],
+                }
+            )
+            cache.invalidate({BR})
+            assert BR not in cache
+            assert ID in cache
+            cache.close()
+
+    def test_empty_subjects_are_not_stored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SubjectCache(os.path.join(tmp, "cache.db"))
+            cache.put_many({BR: []})
+            assert len(cache) == 0
+            cache.close()
+
+
+class TestResourceFinderWithSubjectCache:
+    def test_traversal_populates_cache(self):
+        responses = [
+            [[_binding(BR, GraphEntity.iri_has_identifier, ID)]],
+            [
+                [
+                    _binding(
+                        ID,
+                        GraphEntity.iri_has_literal_value,
+                        "10.1/x",
+                        "literal",
+                        XSD_STRING,
+                    )
+                ]
+            ],
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SubjectCache(os.path.join(tmp, "cache.db"))
+            finder = ResourceFinder(
+                "http://localhost/sparql", BASE_IRI, subject_cache=cache
+            )
+            with patch(
+                "oc_meta.lib.finder.execute_sparql_queries", side_effect=responses
+            ) as mocked:
+                finder.get_everything_about_res(
+                    metavals={"omid:br/0601"}, identifiers=set(), vvis=set()
+                )
+            assert mocked.call_count == 2
+            assert BR in cache
+            assert ID in cache
+            assert finder._get_objects(BR, GraphEntity.iri_has_identifier) == [ID]
+            cache.close()
+
+    def test_cached_subjects_skip_sparql(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SubjectCache(os.path.join(tmp, "cache.db"))
+            cache.put_many(
+                {
+                    BR: [(GraphEntity.iri_has_identifier, ID, "uri", "")],
+                    ID: [
+                        (
+                            GraphEntity.iri_has_literal_value,
+                            "10.1/x",
+                            "literal",
+                            XSD_STRING,
+                        ),
+                        (
+                            GraphEntity.iri_uses_identifier_scheme,
+                            GraphEntity.iri_doi,
+                            "uri",
+                            "",
+                        ),
+                    ],
+                }
+            )
+            finder = ResourceFinder(
+                "http://localhost/sparql", BASE_IRI, subject_cache=cache
+            )
+            with patch("oc_meta.lib.finder.execute_sparql_queries") as mocked:
+                finder.get_everything_about_res(
+                    metavals={"omid:br/0601"}, identifiers=set(), vvis=set()
+                )
+            mocked.assert_not_called()
+            assert finder.subject_cache_hits == 2
+            assert finder.retrieve_metaid_from_id("doi", "10.1/x") == "id/0601"
+            cache.close()